@@ -8,15 +8,16 @@ import os
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.config.flask import create_app
-from src.config.db import db
+# Import through the src path (not `src.config`) so the modules are only loaded once
+from config.flask import create_app
+from config.db import db
 
 # Create the Flask app
 app = create_app()
 
 if __name__ == '__main__':
     with app.app_context():
-        import src.models
+        import models
         db.create_all()
 
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1 @@
+"""Endpoint benchmarks over a synthetic campus dataset (python -m benchmarks.run)"""
@@ -0,0 +1,202 @@
+"""
+Synthetic large-campus dataset for the benchmarks
+
+Reuses the reference data and bulk insert helpers of scripts/seed_database.py
+and the service layer's ConflictDetector, so a campus-sized dataset loads in
+seconds. Generation is deterministic for a given seed.
+"""
+import math
+import random
+from datetime import date
+
+from scripts.seed_database import (
+    COURSE_TEMPLATES, DEPARTMENTS_DATA, FIRST_NAMES, LAST_NAMES, LEVELS_DATA,
+    SPECIALIZATIONS, TIME_SLOTS, TITLES, bulk_insert, reset_sequences
+)
+from services.conflict_service import ConflictDetector
+from config.db import db
+from models import Admin, Department, Teacher, Room, Course, TimeTable, TimeTableSlot, Level
+
+BENCH_ADMIN = {'username': 'bench', 'email': 'bench@university.edu', 'password': 'bench-password'}
+SCHOOL_DAYS = range(5)
+# Non-overlapping windows of TIME_SLOTS, used to estimate room capacity per term
+SLOTS_PER_ROOM_DAY = 5
+
+
+def _terms(scale):
+    """(semester, academic year, week start, week end) terms needed to fit the requested slots."""
+    capacity_per_term = scale.rooms * len(SCHOOL_DAYS) * SLOTS_PER_ROOM_DAY * 0.7
+    count = max(2, math.ceil(scale.slots / capacity_per_term))
+    terms = []
+    for index in range(count):
+        year = 2024 + index // 2
+        if index % 2 == 0:
+            terms.append(('Fall', f"{year}-{year + 1}", date(year, 9, 2), date(year, 12, 20)))
+        else:
+            terms.append(('Spring', f"{year}-{year + 1}", date(year + 1, 1, 13), date(year + 1, 5, 16)))
+    return terms
+
+
+def generate(scale, seed=42):
+    """
+    Create the benchmark dataset in the current app's (empty) database.
+
+    Args:
+        scale: Scale instance
+        seed: Random seed; the same seed yields the same dataset
+
+    Returns:
+        Dictionary of row counts and the term list
+    """
+    rng = random.Random(seed)
+
+    admin = Admin(username=BENCH_ADMIN['username'], email=BENCH_ADMIN['email'], role='super_admin')
+    admin.set_password(BENCH_ADMIN['password'])
+    db.session.add(admin)
+    db.session.flush()
+
+    levels = [dict(level, id=index + 1) for index, level in enumerate(LEVELS_DATA)]
+    bulk_insert(Level, levels)
+
+    departments = []
+    for index in range(scale.departments):
+        base = DEPARTMENTS_DATA[index % len(DEPARTMENTS_DATA)]
+        suffix = index // len(DEPARTMENTS_DATA)
+        departments.append({
+            'id': index + 1,
+            'name': f"{base['name']} {suffix + 1}" if suffix else base['name'],
+            'code': f"{base['code']}{suffix + 1}" if suffix else base['code'],
+            'head': base['head'],
+            'contact_email': base['contact_email'],
+            'base_code': base['code'],
+        })
+    bulk_insert(Department, departments)
+
+    teachers = []
+    teachers_by_department = {d['id']: [] for d in departments}
+    for index in range(scale.teachers):
+        department = departments[index % len(departments)]
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        teachers.append({
+            'id': index + 1,
+            'name': f"{rng.choice(TITLES)} {first_name} {last_name}",
+            'email': f"{first_name.lower()}.{last_name.lower()}{index}@university.edu",
+            'phone': f"+1-555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            'department_id': department['id'],
+            'specialization': rng.choice(SPECIALIZATIONS.get(department['base_code'], ['General Studies'])),
+            'is_active': True,
+        })
+        teachers_by_department[department['id']].append(index + 1)
+    bulk_insert(Teacher, teachers)
+
+    rooms = []
+    for index in range(scale.rooms):
+        kind = index % 10
+        if kind < 7:
+            room_type, capacity = 'classroom', rng.choice([30, 35, 40, 45, 50])
+        elif kind < 9:
+            room_type, capacity = 'lab', rng.choice([25, 30, 35, 40])
+        else:
+            room_type, capacity = 'lecture_hall', rng.choice([150, 200, 250, 300])
+        rooms.append({'id': index + 1, 'name': f"Room {1000 + index}", 'room_type': room_type,
+                      'capacity': capacity, 'is_available': True})
+    bulk_insert(Room, rooms)
+
+    courses = []
+    for index in range(scale.courses):
+        department = departments[index % len(departments)]
+        templates = COURSE_TEMPLATES.get(department['base_code']) or COURSE_TEMPLATES['CS']
+        name, _, weekly_sessions = templates[(index // len(departments)) % len(templates)]
+        department_teachers = teachers_by_department[department['id']]
+        courses.append({
+            'id': index + 1,
+            'name': name,
+            'code': f"{department['code']}{1000 + index}",
+            'department_id': department['id'],
+            'teacher_id': rng.choice(department_teachers) if department_teachers else None,
+            'level_id': levels[index % len(levels)]['id'],
+            'weekly_sessions': weekly_sessions,
+            'semester': 'Fall' if index % 2 == 0 else 'Spring',
+            'year': 2024,
+            'is_active': True,
+        })
+    bulk_insert(Course, courses)
+
+    terms = _terms(scale)
+    timetables = []
+    timetable_ids = {}
+    for department in departments:
+        for level in levels:
+            for term_index, (semester, academic_year, week_start, week_end) in enumerate(terms):
+                timetable_id = len(timetables) + 1
+                timetables.append({
+                    'id': timetable_id,
+                    'name': f"{department['name']} {level['code']} {semester} {academic_year}",
+                    'department_id': department['id'],
+                    'level_id': level['id'],
+                    'week_start': week_start,
+                    'week_end': week_end,
+                    'academic_year': academic_year,
+                    'semester': semester,
+                    'status': 'published' if term_index < len(terms) - 2 else 'draft',
+                    'created_by': admin.id,
+                })
+                timetable_ids[(department['id'], level['id'], term_index)] = timetable_id
+    bulk_insert(TimeTable, timetables)
+
+    # Conflicts only matter within a term, so each term gets its own detector
+    detectors = [ConflictDetector() for _ in terms]
+    terms_by_semester = {
+        semester: [i for i, term in enumerate(terms) if term[0] == semester] for semester in ('Fall', 'Spring')
+    }
+    slots = []
+    skipped = 0
+    attempt = 0
+    while len(slots) < scale.slots and skipped < scale.slots:
+        course = courses[attempt % len(courses)]
+        candidate_terms = terms_by_semester[course['semester']]
+        term_index = candidate_terms[(attempt // len(courses)) % len(candidate_terms)]
+        attempt += 1
+        detector = detectors[term_index]
+        timetable_id = timetable_ids[(course['department_id'], course['level_id'], term_index)]
+
+        placed = False
+        for _ in range(20):
+            day = rng.choice(SCHOOL_DAYS)
+            start_time, end_time = rng.choice(TIME_SLOTS)
+            if detector.teacher_conflict(course['teacher_id'], day, start_time, end_time):
+                continue
+            room = rooms[rng.randrange(len(rooms))]
+            if detector.room_conflict(room['id'], day, start_time, end_time):
+                continue
+            slot_id = len(slots) + 1
+            detector.add_slot(slot_id, day, start_time, end_time, room['id'], course['teacher_id'])
+            slots.append({
+                'id': slot_id,
+                'timetable_id': timetable_id,
+                'course_id': course['id'],
+                'room_id': room['id'],
+                'day_of_week': day,
+                'start_time': start_time,
+                'end_time': end_time,
+                'notes': None,
+            })
+            placed = True
+            break
+        if not placed:
+            skipped += 1
+    bulk_insert(TimeTableSlot, slots)
+
+    reset_sequences(Admin, Department, Teacher, Room, Course, TimeTable, TimeTableSlot, Level)
+    db.session.commit()
+
+    return {
+        'departments': len(departments),
+        'teachers': len(teachers),
+        'courses': len(courses),
+        'rooms': len(rooms),
+        'timetables': len(timetables),
+        'slots': len(slots),
+        'terms': len(terms),
+    }
@@ -0,0 +1,23 @@
+"""
+Dataset size presets for the benchmarks
+
+Kept apart from dataset.py so the runner can parse its arguments (and
+point the app at the target database) before any app module is imported.
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class Scale:
+    departments: int
+    teachers: int
+    courses: int
+    rooms: int
+    slots: int
+
+
+SCALES = {
+    'small': Scale(departments=5, teachers=60, courses=200, rooms=30, slots=1000),
+    'medium': Scale(departments=20, teachers=500, courses=2000, rooms=150, slots=12000),
+    'campus': Scale(departments=50, teachers=2000, courses=8000, rooms=500, slots=60000),
+}
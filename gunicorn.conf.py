@@ -0,0 +1,67 @@
+"""
+Gunicorn configuration for serving the Timetable Manager API in production
+
+Usage: gunicorn -c gunicorn.conf.py app:app
+Every setting can be overridden through the GUNICORN_* environment variables.
+Migrations are not run here; apply them once with `flask db upgrade` before
+starting (the `migrate` service in docker-compose does this). Set
+PROMETHEUS_MULTIPROC_DIR so /metrics aggregates all workers.
+"""
+import glob
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Load the app once in the master so workers share its memory copy-on-write
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True') == 'True'
+
+# Workers and threads sized from the CPU count; requests are mostly I/O bound on Postgres
+workers = int(os.environ.get('GUNICORN_WORKERS') or multiprocessing.cpu_count() * 2 + 1)
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+worker_class = 'gthread'
+
+# Recycle workers periodically to bound memory growth; jitter avoids restarting them all at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '2000'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '200'))
+
+# Graceful shutdown: on SIGTERM workers finish in-flight requests before exiting
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def _reset_prometheus_dir():
+    # Samples left by a previous run would be aggregated into this one. This
+    # runs when the config is loaded, before the preloaded app creates its
+    # metrics; the marker keeps a config reload (SIGHUP) from wiping live files.
+    multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if not multiproc_dir or os.environ.get('_PROMETHEUS_MULTIPROC_DIR_RESET'):
+        return
+    os.makedirs(multiproc_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(multiproc_dir, '*.db')):
+        os.remove(path)
+    os.environ['_PROMETHEUS_MULTIPROC_DIR_RESET'] = '1'
+
+
+_reset_prometheus_dir()
+
+
+def post_fork(server, worker):
+    # Connections opened in the master must not be shared across processes:
+    # drop the inherited pool so each worker opens its own connections
+    app = worker.app.wsgi()
+    with app.app_context():
+        for engine in app.extensions['sqlalchemy'].engines.values():
+            engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    # Drop the exited worker's live gauges (in-flight requests, pool usage) from /metrics
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
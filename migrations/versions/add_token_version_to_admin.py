@@ -0,0 +1,25 @@
+"""Add token_version column to admin table
+
+Revision ID: add_token_version_admin
+Revises: add_is_active_admin
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_token_version_admin'
+down_revision = 'add_is_active_admin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Tokens carry the version they were issued with; bumping it revokes them
+    op.add_column('admin', sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    op.drop_column('admin', 'token_version')
@@ -0,0 +1,32 @@
+"""Delete timetable slots with their timetable in the database
+
+Revision ID: cascade_timetable_slot_delete
+Revises: add_refresh_token_table
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'cascade_timetable_slot_delete'
+down_revision = 'add_refresh_token_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Deleting a timetable no longer loads and deletes its slots one by one
+    op.drop_constraint('timetable_slot_timetable_id_fkey', 'timetable_slot', type_='foreignkey')
+    op.create_foreign_key(
+        'timetable_slot_timetable_id_fkey', 'timetable_slot', 'time_table',
+        ['timetable_id'], ['id'], ondelete='CASCADE'
+    )
+
+
+def downgrade():
+    op.drop_constraint('timetable_slot_timetable_id_fkey', 'timetable_slot', type_='foreignkey')
+    op.create_foreign_key(
+        'timetable_slot_timetable_id_fkey', 'timetable_slot', 'time_table',
+        ['timetable_id'], ['id']
+    )
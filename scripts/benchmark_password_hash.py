@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Password Hash Benchmark
+Times werkzeug password hash methods on this machine and recommends the
+strongest one that verifies within a latency budget.
+
+Usage:
+    python3 scripts/benchmark_password_hash.py
+    python3 scripts/benchmark_password_hash.py --budget-ms 100 --rounds 10
+
+Set the chosen method with PASSWORD_HASH_METHOD; existing hashes are
+upgraded transparently on the next successful login.
+"""
+
+import argparse
+import time
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+# Candidates ordered from weakest to strongest within each family
+CANDIDATES = [
+    'scrypt:8192:8:1',
+    'scrypt:16384:8:1',
+    'scrypt:32768:8:1',
+    'scrypt:65536:8:1',
+    'scrypt:131072:8:1',
+    'pbkdf2:sha256:260000',
+    'pbkdf2:sha256:600000',
+    'pbkdf2:sha256:1000000',
+]
+
+
+def time_method(method, rounds):
+    """Return the median verify time in milliseconds for a hash method."""
+    password_hash = generate_password_hash('benchmark-password', method=method)
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        check_password_hash(password_hash, 'benchmark-password')
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark password hash methods')
+    parser.add_argument('--budget-ms', type=float, default=100.0,
+                        help='Maximum acceptable verify latency per login (default: 100)')
+    parser.add_argument('--rounds', type=int, default=5, help='Verifications per method (default: 5)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("PASSWORD HASH BENCHMARK")
+    print("=" * 70)
+
+    results = []
+    for method in CANDIDATES:
+        try:
+            median_ms = time_method(method, args.rounds)
+        except (ValueError, MemoryError) as e:
+            print(f"  [SKIP] {method}: {e}")
+            continue
+        results.append((method, median_ms))
+        marker = 'OK  ' if median_ms <= args.budget_ms else 'SLOW'
+        print(f"  [{marker}] {method:<24} {median_ms:8.1f} ms")
+
+    within_budget = [(m, t) for m, t in results if t <= args.budget_ms]
+    print("-" * 70)
+    if within_budget:
+        # Prefer scrypt (memory-hard); fall back to the slowest pbkdf2 within budget
+        scrypt = [r for r in within_budget if r[0].startswith('scrypt')]
+        method, median_ms = max(scrypt or within_budget, key=lambda r: r[1])
+        print(f"Recommended: PASSWORD_HASH_METHOD={method} ({median_ms:.1f} ms)")
+    else:
+        print(f"No method verifies within {args.budget_ms} ms; raise the budget or use faster hardware.")
+    print("=" * 70)
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -10,79 +10,261 @@ This script populates the database with realistic academic data with:
 - Teacher availability tracking
 - Room capacity validation
 - Duplicate prevention
+
+Rows are built in memory with preassigned ids and inserted in batches
+(COPY on PostgreSQL), so large datasets seed in seconds. Scale and the
+random seed are taken from the command line, e.g.:
+
+    python3 scripts/seed_database.py --seed 42 --quiet --departments 50 \
+        --teachers-per-department 40 --courses-per-department 200 \
+        --classrooms 1000 --labs 150 --terms 10 --max-timetables 0
+
+Add --processes N (0 for one per CPU) to generate courses and slots for
+groups of departments in parallel before the single bulk insert.
 """
 
+import argparse
+import io
 import random
 from datetime import datetime, date, time, timedelta
+from time import perf_counter
 import sys
 import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from config import create_app
 from config.db import db
-from models import Admin, Department, Teacher, Room, Course, TimeTable, TimeTableSlot, Level
-
-
-class ConflictDetector:
-    """Utility class for detecting scheduling conflicts across ALL timetables"""
-
-    def __init__(self):
-        # Track room usage across ALL timetables: {(day, room_id): [(start_time, end_time, slot_id, timetable_id)]}
-        # Changed: removed timetable_id from key to check conflicts across all timetables
-        self.room_schedule = defaultdict(list)
-        # Track teacher usage across ALL timetables: {(day, teacher_id): [(start_time, end_time, slot_id, timetable_id)]}
-        # Changed: removed timetable_id from key to check conflicts across all timetables
-        self.teacher_schedule = defaultdict(list)
-        # Track course sessions: {course_id: count}
-        self.course_sessions = defaultdict(int)
-
-    def has_room_conflict(self, timetable_id, day, start_time, end_time, room_id):
-        """Check if room is already booked for this time slot across ALL timetables (proper overlap detection)"""
-        # Check across all timetables, not just the current one
-        key = (day, room_id)
-        existing_slots = self.room_schedule.get(key, [])
-
-        for existing_start, existing_end, _, existing_timetable_id in existing_slots:
-            # Check for time overlap: two time periods overlap if:
-            # start1 < end2 AND end1 > start2
-            if start_time < existing_end and end_time > existing_start:
-                return True
-        return False
-
-    def has_teacher_conflict(self, timetable_id, day, start_time, end_time, teacher_id):
-        """Check if teacher is already scheduled for this time slot across ALL timetables (proper overlap detection)"""
-        if teacher_id is None:
-            return False
-
-        # Check across all timetables, not just the current one
-        key = (day, teacher_id)
-        existing_slots = self.teacher_schedule.get(key, [])
-
-        for existing_start, existing_end, _, existing_timetable_id in existing_slots:
-            # Check for time overlap: two time periods overlap if:
-            # start1 < end2 AND end1 > start2
-            if start_time < existing_end and end_time > existing_start:
-                return True
-        return False
-
-    def register_slot(self, timetable_id, day, start_time, end_time, room_id, teacher_id, course_id, slot_id):
-        """Register a scheduled slot to track conflicts across all timetables"""
-        # Track room usage across all timetables
-        room_key = (day, room_id)
-        self.room_schedule[room_key].append((start_time, end_time, slot_id, timetable_id))
-
-        # Track teacher usage across all timetables
-        if teacher_id:
-            teacher_key = (day, teacher_id)
-            self.teacher_schedule[teacher_key].append((start_time, end_time, slot_id, timetable_id))
-
-        self.course_sessions[course_id] += 1
-
-    def get_course_sessions(self, course_id):
-        """Get number of sessions scheduled for a course"""
-        return self.course_sessions.get(course_id, 0)
+from models import Admin, Department, Teacher, Room, Course, TimeTable, TimeTableSlot, Level, RefreshToken
+from services.conflict_service import ConflictDetector
+from sqlalchemy import func, text
+
+
+# Reference data shared with the benchmark dataset generator (benchmarks/dataset.py)
+DEPARTMENTS_DATA = [
+    {'name': 'Computer Science', 'code': 'CS', 'head': 'Dr. Alan Turing', 'contact_email': 'cs@university.edu'},
+    {'name': 'Mathematics', 'code': 'MATH', 'head': 'Dr. Ada Lovelace', 'contact_email': 'math@university.edu'},
+    {'name': 'Physics', 'code': 'PHY', 'head': 'Dr. Marie Curie', 'contact_email': 'physics@university.edu'},
+    {'name': 'Chemistry', 'code': 'CHEM', 'head': 'Dr. Dmitri Mendeleev', 'contact_email': 'chem@university.edu'},
+    {'name': 'Biology', 'code': 'BIO', 'head': 'Dr. Charles Darwin', 'contact_email': 'bio@university.edu'},
+    {'name': 'Engineering', 'code': 'ENG', 'head': 'Dr. Nikola Tesla', 'contact_email': 'eng@university.edu'},
+    {'name': 'Business Administration', 'code': 'BUS', 'head': 'Dr. Peter Drucker', 'contact_email': 'business@university.edu'},
+]
+
+FIRST_NAMES = ['James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda',
+               'William', 'Elizabeth', 'David', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica',
+               'Thomas', 'Sarah', 'Charles', 'Karen', 'Christopher', 'Nancy', 'Daniel', 'Lisa']
+
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
+              'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Wilson', 'Anderson', 'Thomas', 'Taylor',
+              'Moore', 'Jackson', 'Martin', 'Lee', 'Thompson', 'White', 'Harris', 'Clark']
+
+TITLES = ['Dr.', 'Prof.', 'Dr.', 'Prof.', 'Dr.']
+
+SPECIALIZATIONS = {
+    'CS': ['Artificial Intelligence', 'Database Systems', 'Software Engineering', 'Cybersecurity',
+           'Web Development', 'Machine Learning', 'Data Science'],
+    'MATH': ['Calculus', 'Linear Algebra', 'Statistics', 'Discrete Mathematics', 'Number Theory',
+             'Abstract Algebra', 'Mathematical Analysis'],
+    'PHY': ['Quantum Physics', 'Classical Mechanics', 'Thermodynamics', 'Electromagnetism',
+            'Optics', 'Astrophysics', 'Particle Physics'],
+    'CHEM': ['Organic Chemistry', 'Inorganic Chemistry', 'Physical Chemistry', 'Analytical Chemistry',
+             'Biochemistry', 'Chemical Engineering'],
+    'BIO': ['Molecular Biology', 'Genetics', 'Ecology', 'Microbiology', 'Anatomy',
+            'Cell Biology', 'Evolutionary Biology'],
+    'ENG': ['Mechanical Engineering', 'Electrical Engineering', 'Civil Engineering',
+            'Chemical Engineering', 'Computer Engineering'],
+    'BUS': ['Marketing', 'Finance', 'Management', 'Accounting', 'Economics',
+            'Business Strategy', 'Entrepreneurship']
+}
+
+LEVELS_DATA = [
+    {'name': 'Level 1', 'code': 'L1', 'order': 1, 'description': 'First year undergraduate level'},
+    {'name': 'Level 2', 'code': 'L2', 'order': 2, 'description': 'Second year undergraduate level'},
+    {'name': 'Level 3', 'code': 'L3', 'order': 3, 'description': 'Third year undergraduate level'},
+    {'name': 'Master 1', 'code': 'M1', 'order': 4, 'description': 'First year master level'},
+    {'name': 'Master 2', 'code': 'M2', 'order': 5, 'description': 'Second year master level'},
+]
+
+# Base course templates per department code - expanded to cover all levels
+COURSE_TEMPLATES = {
+    'CS': [
+        ('Introduction to Programming', 'CS', 3),
+        ('Data Structures', 'CS', 3),
+        ('Algorithms', 'CS', 2),
+        ('Database Systems', 'CS', 2),
+        ('Web Development', 'CS', 2),
+        ('Software Engineering', 'CS', 2),
+        ('Operating Systems', 'CS', 2),
+        ('Computer Networks', 'CS', 2),
+        ('Artificial Intelligence', 'CS', 2),
+        ('Machine Learning', 'CS', 2),
+    ],
+    'MATH': [
+        ('Calculus I', 'MATH', 4),
+        ('Calculus II', 'MATH', 4),
+        ('Linear Algebra', 'MATH', 3),
+        ('Statistics', 'MATH', 2),
+        ('Discrete Mathematics', 'MATH', 2),
+        ('Differential Equations', 'MATH', 2),
+        ('Abstract Algebra', 'MATH', 2),
+        ('Real Analysis', 'MATH', 2),
+    ],
+    'PHY': [
+        ('Physics I', 'PHY', 3),
+        ('Physics II', 'PHY', 3),
+        ('Quantum Mechanics', 'PHY', 2),
+        ('Thermodynamics', 'PHY', 2),
+        ('Electromagnetism', 'PHY', 2),
+        ('Optics', 'PHY', 2),
+        ('Astrophysics', 'PHY', 2),
+    ],
+    'CHEM': [
+        ('General Chemistry', 'CHEM', 3),
+        ('Organic Chemistry I', 'CHEM', 3),
+        ('Organic Chemistry II', 'CHEM', 3),
+        ('Physical Chemistry', 'CHEM', 2),
+        ('Analytical Chemistry', 'CHEM', 2),
+        ('Biochemistry', 'CHEM', 2),
+    ],
+    'BIO': [
+        ('Biology I', 'BIO', 3),
+        ('Biology II', 'BIO', 3),
+        ('Genetics', 'BIO', 2),
+        ('Molecular Biology', 'BIO', 2),
+        ('Ecology', 'BIO', 2),
+        ('Microbiology', 'BIO', 2),
+        ('Anatomy', 'BIO', 2),
+    ],
+    'ENG': [
+        ('Engineering Fundamentals', 'ENG', 3),
+        ('Mechanics', 'ENG', 2),
+        ('Circuits', 'ENG', 2),
+        ('Materials Science', 'ENG', 2),
+        ('Design Principles', 'ENG', 2),
+        ('Thermodynamics', 'ENG', 2),
+    ],
+    'BUS': [
+        ('Business Fundamentals', 'BUS', 2),
+        ('Marketing', 'BUS', 2),
+        ('Finance', 'BUS', 2),
+        ('Management', 'BUS', 2),
+        ('Economics', 'BUS', 2),
+        ('Accounting', 'BUS', 2),
+        ('Business Strategy', 'BUS', 2),
+    ]
+}
+
+# Time slots: 8:00 AM to 6:00 PM (expanded for more slots)
+TIME_SLOTS = [
+    (time(8, 0), time(10, 0)),   # 8:00 - 10:00 AM
+    (time(9, 0), time(11, 0)),   # 9:00 - 11:00 AM (additional slot)
+    (time(10, 0), time(12, 0)),  # 10:00 AM - 12:00 PM
+    (time(11, 0), time(13, 0)),  # 11:00 AM - 1:00 PM (additional slot)
+    (time(12, 0), time(14, 0)),  # 12:00 - 2:00 PM
+    (time(13, 0), time(15, 0)),  # 1:00 - 3:00 PM (additional slot)
+    (time(14, 0), time(16, 0)),  # 2:00 - 4:00 PM
+    (time(15, 0), time(17, 0)),  # 3:00 - 5:00 PM (additional slot)
+    (time(16, 0), time(18, 0)),  # 4:00 - 6:00 PM
+    (time(17, 0), time(19, 0)),  # 5:00 - 7:00 PM (additional slot)
+]
+
+# Monday to Friday at each time slot; consecutive entries are the same time on the next day
+WEEKLY_COMBINATIONS = [(day, slot) for slot in TIME_SLOTS for day in range(5)]
+
+LECTURE_HALLS = [
+    ('Auditorium A', 300),
+    ('Auditorium B', 250),
+    ('Hall 301', 150),
+    ('Hall 302', 150),
+    ('Grand Hall', 200),
+]
+
+# Set from the command line by main()
+_settings = {'verbose': True, 'batch_size': 5000}
+
+
+def log_row(message):
+    """Print a per-row progress line unless --quiet was given"""
+    if _settings['verbose']:
+        print(message)
+
+
+def next_id(model):
+    """First free primary key of a model's table, so ids can be assigned before inserting"""
+    return (db.session.query(func.max(model.id)).scalar() or 0) + 1
+
+
+def _copy_value(value):
+    """Format one value for COPY ... FROM STDIN (text format)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _copy_rows(table, rows):
+    """Stream rows into a table with PostgreSQL COPY on the session's connection"""
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_value(row[column]) for column in columns) + '\n')
+    buffer.seek(0)
+
+    preparer = db.engine.dialect.identifier_preparer
+    statement = (f"COPY {preparer.format_table(table)} "
+                 f"({', '.join(preparer.quote(column) for column in columns)}) FROM STDIN")
+    cursor = db.session.connection().connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def bulk_insert(model, rows):
+    """
+    Insert row dictionaries in batches of _settings['batch_size'].
+
+    Uses COPY on PostgreSQL with psycopg2 and executemany otherwise. Keys
+    that are not columns of the table are ignored, and Python-side column
+    defaults (created_at, ...) are filled in so both paths store the same
+    values. Rows must carry their id (see next_id).
+    """
+    table = model.__table__
+    defaults = [column for column in table.columns
+                if column.default is not None and (column.default.is_scalar or column.default.is_callable)]
+    use_copy = db.engine.dialect.name == 'postgresql' and db.engine.dialect.driver == 'psycopg2'
+    batch_size = _settings['batch_size']
+
+    for start in range(0, len(rows), batch_size):
+        batch = [{column.name: row[column.name] for column in table.columns if column.name in row}
+                 for row in rows[start:start + batch_size]]
+        for column in defaults:
+            value = column.default.arg(None) if column.default.is_callable else column.default.arg
+            for row in batch:
+                row.setdefault(column.name, value)
+
+        if use_copy:
+            _copy_rows(table, batch)
+        else:
+            db.session.execute(table.insert(), batch)
+
+
+def reset_sequences(*models):
+    """Move PostgreSQL id sequences past explicitly assigned ids"""
+    if db.engine.dialect.name != 'postgresql':
+        return
+    for model in models:
+        table = model.__tablename__
+        db.session.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        ))
 
 
 def clear_database():
@@ -117,6 +299,10 @@ def clear_database():
         deleted_counts['Department'] = Department.query.count()
         Department.query.delete()
 
+        # Refresh tokens reference admins; delete before admins
+        deleted_counts['RefreshToken'] = RefreshToken.query.count()
+        RefreshToken.query.delete()
+
         deleted_counts['Admin'] = Admin.query.count()
         Admin.query.delete()
 
@@ -184,123 +370,87 @@ def seed_admins():
     return admins
 
 
-def seed_departments():
-    """Create academic departments with unique codes"""
+def seed_departments(count=len(DEPARTMENTS_DATA)):
+    """Create academic departments with unique codes (numbered copies beyond the reference list)"""
     print("\n" + "=" * 70)
     print("CREATING DEPARTMENTS")
     print("=" * 70)
 
-    departments_data = [
-        {'name': 'Computer Science', 'code': 'CS', 'head': 'Dr. Alan Turing', 'contact_email': 'cs@university.edu'},
-        {'name': 'Mathematics', 'code': 'MATH', 'head': 'Dr. Ada Lovelace', 'contact_email': 'math@university.edu'},
-        {'name': 'Physics', 'code': 'PHY', 'head': 'Dr. Marie Curie', 'contact_email': 'physics@university.edu'},
-        {'name': 'Chemistry', 'code': 'CHEM', 'head': 'Dr. Dmitri Mendeleev', 'contact_email': 'chem@university.edu'},
-        {'name': 'Biology', 'code': 'BIO', 'head': 'Dr. Charles Darwin', 'contact_email': 'bio@university.edu'},
-        {'name': 'Engineering', 'code': 'ENG', 'head': 'Dr. Nikola Tesla', 'contact_email': 'eng@university.edu'},
-        {'name': 'Business Administration', 'code': 'BUS', 'head': 'Dr. Peter Drucker', 'contact_email': 'business@university.edu'},
-    ]
-
     departments = []
-    for dept_data in departments_data:
-        # Check for duplicate code
-        existing = Department.query.filter_by(code=dept_data['code']).first()
-        if existing:
-            print(f"  [SKIP] {dept_data['code']}: {dept_data['name']} (already exists)")
-            departments.append(existing)
+    new_departments = []
+    existing = {d.code: d for d in Department.query.all()}
+    dept_id = next_id(Department)
+
+    for index in range(count):
+        base = DEPARTMENTS_DATA[index % len(DEPARTMENTS_DATA)]
+        copy = index // len(DEPARTMENTS_DATA)
+        code = f"{base['code']}{copy + 1}" if copy else base['code']
+
+        if code in existing:
+            dept = existing[code]
+            print(f"  [SKIP] {code}: {dept.name} (already exists)")
+            departments.append({'id': dept.id, 'name': dept.name, 'code': dept.code,
+                                'base_code': base['code'], 'copy': copy})
             continue
 
-        dept = Department(**dept_data)
-        db.session.add(dept)
+        dept = dict(base, id=dept_id, code=code, base_code=base['code'], copy=copy,
+                    name=f"{base['name']} {copy + 1}" if copy else base['name'])
+        dept_id += 1
         departments.append(dept)
-        print(f"  [CREATE] {dept_data['code']}: {dept_data['name']}")
+        new_departments.append(dept)
+        log_row(f"  [CREATE] {code}: {dept['name']}")
 
+    bulk_insert(Department, new_departments)
     db.session.commit()
     print(f"\nTotal Departments: {len(departments)}")
     return departments
 
 
-def seed_teachers(departments):
+def seed_teachers(departments, teacher_count_per_dept=6):
     """Create teachers with unique email addresses"""
     print("\n" + "=" * 70)
     print("CREATING TEACHERS")
     print("=" * 70)
 
-    first_names = ['James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda',
-                   'William', 'Elizabeth', 'David', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica',
-                   'Thomas', 'Sarah', 'Charles', 'Karen', 'Christopher', 'Nancy', 'Daniel', 'Lisa']
-
-    last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
-                  'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Wilson', 'Anderson', 'Thomas', 'Taylor',
-                  'Moore', 'Jackson', 'Martin', 'Lee', 'Thompson', 'White', 'Harris', 'Clark']
-
-    titles = ['Dr.', 'Prof.', 'Dr.', 'Prof.', 'Dr.']
-
-    specializations = {
-        'CS': ['Artificial Intelligence', 'Database Systems', 'Software Engineering', 'Cybersecurity',
-               'Web Development', 'Machine Learning', 'Data Science'],
-        'MATH': ['Calculus', 'Linear Algebra', 'Statistics', 'Discrete Mathematics', 'Number Theory',
-                 'Abstract Algebra', 'Mathematical Analysis'],
-        'PHY': ['Quantum Physics', 'Classical Mechanics', 'Thermodynamics', 'Electromagnetism',
-                'Optics', 'Astrophysics', 'Particle Physics'],
-        'CHEM': ['Organic Chemistry', 'Inorganic Chemistry', 'Physical Chemistry', 'Analytical Chemistry',
-                 'Biochemistry', 'Chemical Engineering'],
-        'BIO': ['Molecular Biology', 'Genetics', 'Ecology', 'Microbiology', 'Anatomy',
-                'Cell Biology', 'Evolutionary Biology'],
-        'ENG': ['Mechanical Engineering', 'Electrical Engineering', 'Civil Engineering',
-                'Chemical Engineering', 'Computer Engineering'],
-        'BUS': ['Marketing', 'Finance', 'Management', 'Accounting', 'Economics',
-                'Business Strategy', 'Entrepreneurship']
-    }
-
     teachers = []
-    teacher_count_per_dept = 6  # 6 teachers per department for better coverage
-    existing_emails = set()
-
     # Get existing teacher emails to avoid duplicates
-    for existing_teacher in Teacher.query.all():
-        existing_emails.add(existing_teacher.email)
+    existing_emails = set(email for (email,) in db.session.query(Teacher.email))
+    email_counters = defaultdict(int)
+    teacher_id = next_id(Teacher)
 
     print(f"\nCreating {teacher_count_per_dept} teachers per department...")
 
     for dept in departments:
-        dept_specs = specializations.get(dept.code, ['General Studies'])
-        print(f"\n{dept.code} - {dept.name}:")
+        dept_specs = SPECIALIZATIONS.get(dept['base_code'], ['General Studies'])
+        log_row(f"\n{dept['code']} - {dept['name']}:")
 
         for i in range(teacher_count_per_dept):
-            # Generate unique email
-            attempts = 0
-            while attempts < 100:
-                title = random.choice(titles)
-                first_name = random.choice(first_names)
-                last_name = random.choice(last_names)
-
-                email = f"{first_name.lower()}.{last_name.lower()}@university.edu"
-                if attempts > 0:
-                    email = f"{first_name.lower()}.{last_name.lower()}{attempts}@university.edu"
-
-                if email not in existing_emails:
-                    existing_emails.add(email)
-                    break
-                attempts += 1
-
-            if attempts >= 100:
-                print(f"  [ERROR] Could not generate unique email after 100 attempts")
-                continue
-
-            name = f"{title} {first_name} {last_name}"
-
-            teacher = Teacher(
-                name=name,
-                email=email,
-                phone=f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-                department_id=dept.id,
-                specialization=random.choice(dept_specs),
-                is_active=True
-            )
-            db.session.add(teacher)
+            title = random.choice(TITLES)
+            first_name = random.choice(FIRST_NAMES)
+            last_name = random.choice(LAST_NAMES)
+
+            # Generate unique email: number repeated names
+            base_email = f"{first_name.lower()}.{last_name.lower()}"
+            email = f"{base_email}@university.edu"
+            while email in existing_emails:
+                email_counters[base_email] += 1
+                email = f"{base_email}{email_counters[base_email]}@university.edu"
+            existing_emails.add(email)
+
+            teacher = {
+                'id': teacher_id,
+                'name': f"{title} {first_name} {last_name}",
+                'email': email,
+                'phone': f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
+                'department_id': dept['id'],
+                'specialization': random.choice(dept_specs),
+                'is_active': True
+            }
+            teacher_id += 1
             teachers.append(teacher)
-            print(f"  [CREATE] {name} - {teacher.specialization}")
+            log_row(f"  [CREATE] {teacher['name']} - {teacher['specialization']}")
 
+    bulk_insert(Teacher, teachers)
     db.session.commit()
     print(f"\nTotal Teachers: {len(teachers)}")
     return teachers
@@ -312,191 +462,116 @@ def seed_levels():
     print("CREATING LEVELS")
     print("=" * 70)
 
-    levels_data = [
-        {'name': 'Level 1', 'code': 'L1', 'order': 1, 'description': 'First year undergraduate level'},
-        {'name': 'Level 2', 'code': 'L2', 'order': 2, 'description': 'Second year undergraduate level'},
-        {'name': 'Level 3', 'code': 'L3', 'order': 3, 'description': 'Third year undergraduate level'},
-        {'name': 'Master 1', 'code': 'M1', 'order': 4, 'description': 'First year master level'},
-        {'name': 'Master 2', 'code': 'M2', 'order': 5, 'description': 'Second year master level'},
-    ]
-
     levels = []
-    existing_codes = set(l.code for l in Level.query.all())
+    new_levels = []
+    existing = {l.code: l for l in Level.query.all()}
+    level_id = next_id(Level)
 
-    for level_data in levels_data:
-        if level_data['code'] in existing_codes:
-            existing = Level.query.filter_by(code=level_data['code']).first()
+    for level_data in LEVELS_DATA:
+        if level_data['code'] in existing:
+            level = existing[level_data['code']]
             print(f"  [SKIP] {level_data['code']}: {level_data['name']} (already exists)")
-            levels.append(existing)
+            levels.append({'id': level.id, 'name': level.name, 'code': level.code, 'order': level.order})
             continue
 
-        level = Level(**level_data)
-        db.session.add(level)
+        level = dict(level_data, id=level_id)
+        level_id += 1
         levels.append(level)
+        new_levels.append(level)
         print(f"  [CREATE] {level_data['code']}: {level_data['name']}")
 
+    bulk_insert(Level, new_levels)
     db.session.commit()
     print(f"\nTotal Levels: {len(levels)}")
     return levels
 
 
-def seed_rooms():
+def seed_rooms(classroom_count=20, lab_count=10):
     """Create classrooms, labs, and lecture halls with unique names"""
     print("\n" + "=" * 70)
     print("CREATING ROOMS")
     print("=" * 70)
 
     rooms = []
-    existing_names = set(r.name for r in Room.query.all())
+    existing_names = set(name for (name,) in db.session.query(Room.name))
+    room_id = next_id(Room)
 
-    # Regular classrooms (capacity: 30-50)
-    print("\nClassrooms:")
-    for i in range(1, 21):
-        name = f"Room {100 + i}"
+    def add_room(name, room_type, capacity):
+        nonlocal room_id
         if name in existing_names:
-            print(f"  [SKIP] {name} (already exists)")
-            continue
+            log_row(f"  [SKIP] {name} (already exists)")
+            return
+        rooms.append({'id': room_id, 'name': name, 'room_type': room_type,
+                      'capacity': capacity, 'is_available': True})
+        room_id += 1
+        log_row(f"  [CREATE] {name} (capacity: {capacity})")
 
-        room = Room(
-            name=name,
-            room_type='classroom',
-            capacity=random.choice([30, 35, 40, 45, 50]),
-            is_available=True
-        )
-        db.session.add(room)
-        rooms.append(room)
-        print(f"  [CREATE] {name} (capacity: {room.capacity})")
+    # Regular classrooms (capacity: 30-50)
+    log_row("\nClassrooms:")
+    for i in range(1, classroom_count + 1):
+        add_room(f"Room {100 + i}", 'classroom', random.choice([30, 35, 40, 45, 50]))
 
     # Computer labs (capacity: 25-40)
-    print("\nLaboratories:")
-    for i in range(1, 11):
-        name = f"Lab {200 + i}"
-        if name in existing_names:
-            print(f"  [SKIP] {name} (already exists)")
-            continue
-
-        room = Room(
-            name=name,
-            room_type='lab',
-            capacity=random.choice([25, 30, 35, 40]),
-            is_available=True
-        )
-        db.session.add(room)
-        rooms.append(room)
-        print(f"  [CREATE] {name} (capacity: {room.capacity})")
+    log_row("\nLaboratories:")
+    for i in range(1, lab_count + 1):
+        add_room(f"Lab {200 + i}", 'lab', random.choice([25, 30, 35, 40]))
 
     # Lecture halls (capacity: 100-300)
-    print("\nLecture Halls:")
-    lecture_halls = [
-        ('Auditorium A', 300),
-        ('Auditorium B', 250),
-        ('Hall 301', 150),
-        ('Hall 302', 150),
-        ('Grand Hall', 200),
-    ]
-    for name, capacity in lecture_halls:
-        if name in existing_names:
-            print(f"  [SKIP] {name} (already exists)")
-            continue
-
-        room = Room(
-            name=name,
-            room_type='lecture_hall',
-            capacity=capacity,
-            is_available=True
-        )
-        db.session.add(room)
-        rooms.append(room)
-        print(f"  [CREATE] {name} (capacity: {capacity})")
+    log_row("\nLecture Halls:")
+    for name, capacity in LECTURE_HALLS:
+        add_room(name, 'lecture_hall', capacity)
 
+    bulk_insert(Room, rooms)
     db.session.commit()
     print(f"\nTotal Rooms: {len(rooms)}")
     return rooms
 
 
-def seed_courses(departments, teachers, levels=None):
-    """Create courses with unique codes - ensuring each department has courses for all levels"""
-    print("\n" + "=" * 70)
-    print("CREATING COURSES")
-    print("=" * 70)
-
-    if not levels:
-        print("  [ERROR] No levels available. Cannot create courses.")
-        return []
-
-    # Base course templates - will be expanded to cover all levels
-    course_base_templates = {
-        'CS': [
-            ('Introduction to Programming', 'CS', 3),
-            ('Data Structures', 'CS', 3),
-            ('Algorithms', 'CS', 2),
-            ('Database Systems', 'CS', 2),
-            ('Web Development', 'CS', 2),
-            ('Software Engineering', 'CS', 2),
-            ('Operating Systems', 'CS', 2),
-            ('Computer Networks', 'CS', 2),
-            ('Artificial Intelligence', 'CS', 2),
-            ('Machine Learning', 'CS', 2),
-        ],
-        'MATH': [
-            ('Calculus I', 'MATH', 4),
-            ('Calculus II', 'MATH', 4),
-            ('Linear Algebra', 'MATH', 3),
-            ('Statistics', 'MATH', 2),
-            ('Discrete Mathematics', 'MATH', 2),
-            ('Differential Equations', 'MATH', 2),
-            ('Abstract Algebra', 'MATH', 2),
-            ('Real Analysis', 'MATH', 2),
-        ],
-        'PHY': [
-            ('Physics I', 'PHY', 3),
-            ('Physics II', 'PHY', 3),
-            ('Quantum Mechanics', 'PHY', 2),
-            ('Thermodynamics', 'PHY', 2),
-            ('Electromagnetism', 'PHY', 2),
-            ('Optics', 'PHY', 2),
-            ('Astrophysics', 'PHY', 2),
-        ],
-        'CHEM': [
-            ('General Chemistry', 'CHEM', 3),
-            ('Organic Chemistry I', 'CHEM', 3),
-            ('Organic Chemistry II', 'CHEM', 3),
-            ('Physical Chemistry', 'CHEM', 2),
-            ('Analytical Chemistry', 'CHEM', 2),
-            ('Biochemistry', 'CHEM', 2),
-        ],
-        'BIO': [
-            ('Biology I', 'BIO', 3),
-            ('Biology II', 'BIO', 3),
-            ('Genetics', 'BIO', 2),
-            ('Molecular Biology', 'BIO', 2),
-            ('Ecology', 'BIO', 2),
-            ('Microbiology', 'BIO', 2),
-            ('Anatomy', 'BIO', 2),
-        ],
-        'ENG': [
-            ('Engineering Fundamentals', 'ENG', 3),
-            ('Mechanics', 'ENG', 2),
-            ('Circuits', 'ENG', 2),
-            ('Materials Science', 'ENG', 2),
-            ('Design Principles', 'ENG', 2),
-            ('Thermodynamics', 'ENG', 2),
-        ],
-        'BUS': [
-            ('Business Fundamentals', 'BUS', 2),
-            ('Marketing', 'BUS', 2),
-            ('Finance', 'BUS', 2),
-            ('Management', 'BUS', 2),
-            ('Economics', 'BUS', 2),
-            ('Accounting', 'BUS', 2),
-            ('Business Strategy', 'BUS', 2),
-        ]
-    }
-
+def _department_templates(dept, courses_per_department):
+    """
+    Course templates (name, code prefix, weekly sessions) for a department.
+
+    Without courses_per_department, the department's COURSE_TEMPLATES as-is.
+    Otherwise exactly that many, cycling through the templates (or through
+    specialization-based courses when the department has none) with
+    numbered names.
+    """
+    base_templates = COURSE_TEMPLATES.get(dept['base_code'], [])
+    suffix = str(dept['copy'] + 1) if dept['copy'] else ''
+    if courses_per_department is None:
+        return [(name, f"{prefix}{suffix}", sessions) for name, prefix, sessions in base_templates]
+
+    if not base_templates:
+        base_templates = [(f"Introduction to {spec}", dept['base_code'], 2)
+                          for spec in SPECIALIZATIONS.get(dept['base_code'], ['General Studies'])]
+    templates = []
+    for idx in range(courses_per_department):
+        name, prefix, sessions = base_templates[idx % len(base_templates)]
+        round_number = idx // len(base_templates)
+        templates.append((f"{name} {round_number + 1}" if round_number else name, f"{prefix}{suffix}", sessions))
+    return templates
+
+
+def build_courses(departments, teachers, levels, courses_per_department=None, existing_codes=None, first_id=1):
+    """
+    Generate course rows for departments without touching the database.
+
+    Args:
+        departments: Department rows
+        teachers: Teacher rows of those departments
+        levels: Level rows
+        courses_per_department: Optional course count (see _department_templates)
+        existing_codes: Codes already taken; updated with the new ones
+        first_id: Id of the first course
+
+    Returns:
+        List of course rows (with a teacher_name key for slot notes)
+    """
     courses = []
     current_year = datetime.now().year
     semesters = ['Fall', 'Spring']
-    existing_codes = set(c.code for c in Course.query.all())
+    existing_codes = set() if existing_codes is None else existing_codes
+    course_id = first_id
 
     # Level to course number mapping
     level_to_course_num = {
@@ -507,46 +582,47 @@ def seed_courses(departments, teachers, levels=None):
         'M2': (450, 499),  # Master 2: 450-499
     }
 
+    teachers_by_department = defaultdict(list)
+    for teacher in teachers:
+        teachers_by_department[teacher['department_id']].append(teacher)
+
     for dept in departments:
-        dept_teachers = [t for t in teachers if t.department_id == dept.id]
-        base_templates = course_base_templates.get(dept.code, [])
+        dept_teachers = teachers_by_department[dept['id']]
+        base_templates = _department_templates(dept, courses_per_department)
 
         if not base_templates:
-            print(f"\n{dept.code} - {dept.name}: [SKIP] No templates available")
+            log_row(f"\n{dept['code']} - {dept['name']}: [SKIP] No templates available")
             continue
 
-        print(f"\n{dept.code} - {dept.name}:")
+        log_row(f"\n{dept['code']} - {dept['name']}:")
 
         # Ensure we have courses for all levels
         # Distribute base templates across levels
-        level_course_count = {}
-        for level in levels:
-            level_course_count[level.code] = 0
-
+        level_course_count = {level['code']: 0 for level in levels}
         course_num_counter = {level_code: start for level_code, (start, _) in level_to_course_num.items()}
 
         # Assign courses to levels, ensuring each level gets at least one course
         for idx, (name, prefix, weekly_sessions) in enumerate(base_templates):
             # Determine which level this course should belong to
             # Cycle through levels to ensure distribution
-            level_idx = idx % len(levels)
-            level = levels[level_idx]
+            level = levels[idx % len(levels)]
 
             # Get next available course number for this level
-            start_num, end_num = level_to_course_num[level.code]
-            course_num = course_num_counter[level.code]
+            start_num, end_num = level_to_course_num[level['code']]
+            course_num = course_num_counter[level['code']]
 
             if course_num > end_num:
                 # If we've exceeded the range, wrap around within the level
-                course_num = start_num + (course_num_counter[level.code] - end_num - 1)
+                course_num = start_num + (course_num_counter[level['code']] - end_num - 1)
 
             code = f"{prefix}{course_num}"
-            course_num_counter[level.code] += 1
-            level_course_count[level.code] += 1
+            course_num_counter[level['code']] += 1
+            level_course_count[level['code']] += 1
 
             if code in existing_codes:
-                print(f"  [SKIP] {code}: {name} (already exists)")
+                log_row(f"  [SKIP] {code}: {name} (already exists)")
                 continue
+            existing_codes.add(code)
 
             # Assign a random teacher from the department
             teacher = random.choice(dept_teachers) if dept_teachers else None
@@ -554,189 +630,195 @@ def seed_courses(departments, teachers, levels=None):
             # Assign semester (distribute courses across semesters)
             semester = semesters[idx % len(semesters)]
 
-            course = Course(
-                name=name,
-                code=code,
-                department_id=dept.id,
-                teacher_id=teacher.id if teacher else None,
-                level_id=level.id,
-                weekly_sessions=weekly_sessions,
-                semester=semester,
-                year=current_year,
-                is_active=True
-            )
-            db.session.add(course)
+            course = {
+                'id': course_id,
+                'name': name,
+                'code': code,
+                'department_id': dept['id'],
+                'teacher_id': teacher['id'] if teacher else None,
+                'level_id': level['id'],
+                'weekly_sessions': weekly_sessions,
+                'semester': semester,
+                'year': current_year,
+                'is_active': True,
+                'teacher_name': teacher['name'] if teacher else None
+            }
+            course_id += 1
             courses.append(course)
 
-            teacher_name = teacher.name if teacher else 'Unassigned'
-            print(f"  [CREATE] {code}: {name} ({weekly_sessions} sessions/week) - {teacher_name} - Level: {level.code} - Semester: {semester}")
+            teacher_name = teacher['name'] if teacher else 'Unassigned'
+            log_row(f"  [CREATE] {code}: {name} ({weekly_sessions} sessions/week) - {teacher_name} - Level: {level['code']} - Semester: {semester}")
 
         # Verify each level has at least one course
         for level in levels:
-            if level_course_count[level.code] == 0:
-                print(f"  [WARNING] Level {level.code} has no courses assigned")
+            if level_course_count[level['code']] == 0:
+                log_row(f"  [WARNING] Level {level['code']} has no courses assigned")
+
+    return courses
 
-    db.session.commit()
-    print(f"\nTotal Courses: {len(courses)}")
 
-    # Print summary by level
+def print_courses_by_level(courses, levels):
     if courses:
         print("\nCourses by Level:")
         for level in levels:
-            level_courses = [c for c in courses if c.level_id == level.id]
-            print(f"  {level.code} ({level.name}): {len(level_courses)} courses")
-
-    return courses
+            level_courses = [c for c in courses if c['level_id'] == level['id']]
+            print(f"  {level['code']} ({level['name']}): {len(level_courses)} courses")
 
 
-def seed_timetables(departments, admins):
-    """Create timetables - maximum of 20 timetables"""
+def seed_courses(departments, teachers, levels=None, courses_per_department=None):
+    """Create courses with unique codes - ensuring each department has courses for all levels"""
     print("\n" + "=" * 70)
-    print("CREATING TIMETABLES (MAX 20)")
+    print("CREATING COURSES")
     print("=" * 70)
 
-    timetables = []
-    current_year = datetime.now().year
-    MAX_TIMETABLES = 20
+    if not levels:
+        print("  [ERROR] No levels available. Cannot create courses.")
+        return []
+
+    existing_codes = set(code for (code,) in db.session.query(Course.code))
+    courses = build_courses(departments, teachers, levels, courses_per_department,
+                            existing_codes, next_id(Course))
+
+    bulk_insert(Course, courses)
+    db.session.commit()
+    print(f"\nTotal Courses: {len(courses)}")
+    print_courses_by_level(courses, levels)
+    return courses
 
-    # Create Fall 2024 timetable
-    fall_start = date(2024, 9, 2)
-    fall_end = date(2024, 12, 20)
 
-    # Create Spring 2025 timetable
-    spring_start = date(2025, 1, 13)
-    spring_end = date(2025, 5, 16)
+def academic_terms(count=2):
+    """
+    Alternating Fall/Spring terms starting with Fall 2024.
 
-    semesters = [
-        ('Fall', 2024, fall_start, fall_end),
-        ('Spring', 2025, spring_start, spring_end)
-    ]
+    Returns:
+        List of (semester, year, week_start, week_end) tuples
+    """
+    terms = []
+    for index in range(count):
+        year = 2024 + (index + 1) // 2
+        if index % 2 == 0:
+            terms.append(('Fall', year, date(year, 9, 2), date(year, 12, 20)))
+        else:
+            terms.append(('Spring', year, date(year, 1, 13), date(year, 5, 16)))
+    return terms
 
+
+def seed_timetables(departments, admins, levels, terms=2, max_timetables=20):
+    """Create a timetable per department, level and term - at most max_timetables (0 for no limit)"""
+    print("\n" + "=" * 70)
+    print(f"CREATING TIMETABLES (MAX {max_timetables or 'UNLIMITED'})")
+    print("=" * 70)
+
+    timetables = []
     admin = admins[0] if admins else None
+    limit_reached = lambda: max_timetables and len(timetables) >= max_timetables
+
+    existing = {
+        (t.department_id, t.level_id, t.semester, t.academic_year): t
+        for t in TimeTable.query.all()
+    }
+    new_timetables = []
+    timetable_id = next_id(TimeTable)
 
-    # Fetch levels to attach to timetables
-    all_levels = Level.query.order_by(Level.order.asc()).all()
+    # Levels attached to timetables, in level order
+    ordered_levels = sorted(levels, key=lambda level: level['order'])
 
-    # Collect all possible timetable combinations
-    timetable_candidates = []
     for dept in departments:
-        for lvl in all_levels:
-            for semester, year, week_start, week_end in semesters:
+        for lvl in ordered_levels:
+            for semester, year, week_start, week_end in academic_terms(terms):
+                if limit_reached():
+                    break
+                academic_year = f"{year}-{year+1}"
+
                 # Check if timetable already exists
-                existing = TimeTable.query.filter_by(
-                    department_id=dept.id,
-                    level_id=lvl.id,
-                    semester=semester,
-                    academic_year=f"{year}-{year+1}"
-                ).first()
-
-                if existing:
-                    print(f"  [SKIP] {dept.code} - {lvl.code} {semester} {year} (already exists)")
-                    timetables.append(existing)
-                    if len(timetables) >= MAX_TIMETABLES:
-                        break
-                else:
-                    timetable_candidates.append({
-                        'dept': dept,
-                        'level': lvl,
-                        'semester': semester,
-                        'year': year,
-                        'week_start': week_start,
-                        'week_end': week_end
+                found = existing.get((dept['id'], lvl['id'], semester, academic_year))
+                if found:
+                    log_row(f"  [SKIP] {dept['code']} - {lvl['code']} {semester} {year} (already exists)")
+                    timetables.append({
+                        'id': found.id, 'name': found.name, 'department_id': found.department_id,
+                        'level_id': found.level_id, 'semester': found.semester, 'academic_year': found.academic_year
                     })
-
-        if len(timetables) >= MAX_TIMETABLES:
-            break
-
-    # Create timetables up to the limit
-    for candidate in timetable_candidates:
-        if len(timetables) >= MAX_TIMETABLES:
-            break
-
-        dept = candidate['dept']
-        lvl = candidate['level']
-        semester = candidate['semester']
-        year = candidate['year']
-        week_start = candidate['week_start']
-        week_end = candidate['week_end']
-
-        timetable = TimeTable(
-            name=f"{dept.name} {lvl.code} {semester} {year}",
-            department_id=dept.id,
-            level_id=lvl.id,
-            week_start=week_start,
-            week_end=week_end,
-            academic_year=f"{year}-{year+1}",
-            semester=semester,
-            status='published' if semester == 'Fall' else 'draft',
-            created_by=admin.id if admin else None
-        )
-        db.session.add(timetable)
-        timetables.append(timetable)
-        print(f"  [CREATE] {dept.code} - {lvl.code} {semester} {year} ({timetable.status})")
-
+                    continue
+
+                timetable = {
+                    'id': timetable_id,
+                    'name': f"{dept['name']} {lvl['code']} {semester} {year}",
+                    'department_id': dept['id'],
+                    'level_id': lvl['id'],
+                    'week_start': week_start,
+                    'week_end': week_end,
+                    'academic_year': academic_year,
+                    'semester': semester,
+                    'status': 'published' if semester == 'Fall' else 'draft',
+                    'created_by': admin.id if admin else None
+                }
+                timetable_id += 1
+                timetables.append(timetable)
+                new_timetables.append(timetable)
+                log_row(f"  [CREATE] {dept['code']} - {lvl['code']} {semester} {year} ({timetable['status']})")
+
+    bulk_insert(TimeTable, new_timetables)
     db.session.commit()
-    print(f"\nTotal Timetables Created: {len(timetables)} (Limit: {MAX_TIMETABLES})")
+    print(f"\nTotal Timetables Created: {len(timetables)} (Limit: {max_timetables or 'none'})")
     return timetables
 
 
-def seed_timetable_slots(timetables, courses, rooms):
-    """Create time slots with comprehensive conflict detection"""
-    print("\n" + "=" * 70)
-    print("CREATING TIMETABLE SLOTS")
-    print("=" * 70)
+def schedule_slots(timetables, courses, rooms, first_id=1):
+    """
+    Place the weekly sessions of each timetable's courses without touching the database.
 
-    # Initialize conflict detector
-    conflict_detector = ConflictDetector()
-
-    # Time slots: 8:00 AM to 6:00 PM (expanded for more slots)
-    time_slots = [
-        (time(8, 0), time(10, 0)),   # 8:00 - 10:00 AM
-        (time(9, 0), time(11, 0)),   # 9:00 - 11:00 AM (additional slot)
-        (time(10, 0), time(12, 0)),  # 10:00 AM - 12:00 PM
-        (time(11, 0), time(13, 0)),  # 11:00 AM - 1:00 PM (additional slot)
-        (time(12, 0), time(14, 0)),  # 12:00 - 2:00 PM
-        (time(13, 0), time(15, 0)),  # 1:00 - 3:00 PM (additional slot)
-        (time(14, 0), time(16, 0)),  # 2:00 - 4:00 PM
-        (time(15, 0), time(17, 0)),  # 3:00 - 5:00 PM (additional slot)
-        (time(16, 0), time(18, 0)),  # 4:00 - 6:00 PM
-        (time(17, 0), time(19, 0)),  # 5:00 - 7:00 PM (additional slot)
-    ]
+    Args:
+        timetables: Timetable rows
+        courses: Course rows
+        rooms: Room rows to choose from
+        first_id: Id of the first slot
+
+    Returns:
+        Tuple of (slot rows, number of placement attempts that hit a conflict)
+    """
+    # Rooms and teachers may only be double-booked across different terms,
+    # matching the API's rule, so each term gets its own conflict detector
+    conflict_detectors = defaultdict(ConflictDetector)
 
     slots = []
+    slot_id = first_id
     skipped_due_to_conflicts = 0
 
     # Organize rooms by type for efficient lookup
-    classrooms = [r for r in rooms if r.room_type == 'classroom']
-    labs = [r for r in rooms if r.room_type == 'lab']
-    lecture_halls = [r for r in rooms if r.room_type == 'lecture_hall']
+    classrooms = [r for r in rooms if r['room_type'] == 'classroom']
+    labs = [r for r in rooms if r['room_type'] == 'lab']
+    lecture_halls = [r for r in rooms if r['room_type'] == 'lecture_hall']
+
+    # Index courses by department and semester once instead of scanning them per timetable
+    courses_by_dept_semester = defaultdict(list)
+    for course in courses:
+        courses_by_dept_semester[(course['department_id'], course['semester'])].append(course)
 
     for timetable in timetables:
-        print(f"\n{timetable.name}:")
+        log_row(f"\n{timetable['name']}:")
+        conflict_detector = conflict_detectors[(timetable['semester'], timetable['academic_year'])]
 
         # Get courses for this department, level (if set) and semester
-        dept_courses = [c for c in courses
-                if c.department_id == timetable.department_id
-                and c.semester == timetable.semester
-                and (timetable.level_id is None or c.level_id == timetable.level_id)]
+        dept_courses = [c for c in courses_by_dept_semester[(timetable['department_id'], timetable['semester'])]
+                        if timetable['level_id'] is None or c['level_id'] == timetable['level_id']]
 
         if not dept_courses:
-            print("  [INFO] No courses found for this timetable")
+            log_row("  [INFO] No courses found for this timetable")
             continue
 
         scheduled_count = 0
         conflict_count = 0
 
         for course in dept_courses:
-            sessions_needed = course.weekly_sessions
+            sessions_needed = course['weekly_sessions']
             sessions_scheduled = 0
 
             # Choose appropriate room based on course code and requirements
-            if course.code.startswith(('CS', 'ENG', 'CHEM', 'PHY', 'BIO')) and any(
-                keyword in course.name.lower() for keyword in ['lab', 'laboratory', 'practical']
+            if course['code'].startswith(('CS', 'ENG', 'CHEM', 'PHY', 'BIO')) and any(
+                keyword in course['name'].lower() for keyword in ['lab', 'laboratory', 'practical']
             ):
                 suitable_rooms = labs if labs else classrooms
-            elif course.code.endswith(('101', '102')):  # Introductory courses might need larger rooms
+            elif course['code'].endswith(('101', '102')):  # Introductory courses might need larger rooms
                 suitable_rooms = lecture_halls + classrooms
             else:
                 suitable_rooms = classrooms
@@ -744,94 +826,197 @@ def seed_timetable_slots(timetables, courses, rooms):
             if not suitable_rooms:
                 suitable_rooms = rooms  # Fallback to all rooms
 
-            # Try all combinations systematically before giving up - maximize slot creation
-            days = list(range(5))  # Monday to Friday
-            tried_combinations = set()
-            # Increased attempts to maximize slot creation - try all combinations multiple times
-            max_attempts = len(days) * len(time_slots) * len(suitable_rooms) * 20  # Try all combinations 20 times
-
+            # Try every day/time combination once, starting from a random one so courses
+            # spread over the week instead of all queueing for Monday 8:00
             attempts = 0
-            while sessions_scheduled < sessions_needed and attempts < max_attempts:
+            offset = random.randrange(len(WEEKLY_COMBINATIONS))
+            while sessions_scheduled < sessions_needed and attempts < len(WEEKLY_COMBINATIONS):
+                day, (start_time, end_time) = WEEKLY_COMBINATIONS[(offset + attempts) % len(WEEKLY_COMBINATIONS)]
                 attempts += 1
 
-                # Try different days and time slots systematically
-                # Use modulo to cycle through days and times evenly
-                day = days[sessions_scheduled % len(days)] if sessions_scheduled < len(days) * 2 else random.choice(days)
-                start_time, end_time = time_slots[sessions_scheduled % len(time_slots)] if sessions_scheduled < len(time_slots) * 2 else random.choice(time_slots)
-
-                # Create a unique combination key (include course to avoid duplicate attempts for same course)
-                combination_key = (day, start_time, end_time, course.id)
-                if combination_key in tried_combinations and attempts > len(days) * len(time_slots):
-                    # After trying all day/time combinations, allow repeats with different rooms
-                    day = random.choice(days)
-                    start_time, end_time = random.choice(time_slots)
-                    combination_key = (day, start_time, end_time, course.id)
-
-                tried_combinations.add(combination_key)
-
-                # Try to find a room without conflicts across ALL timetables
+                # The teacher conflict does not depend on the room, so check it once per attempt
                 room_found = False
-                random.shuffle(suitable_rooms)  # Randomize to distribute load
-
-                for room in suitable_rooms:
-                    # Check for room conflicts across ALL timetables (proper overlap detection)
-                    if conflict_detector.has_room_conflict(
-                        timetable.id, day, start_time, end_time, room.id
-                    ):
-                        continue
-
-                    # Check for teacher conflicts across ALL timetables (proper overlap detection)
-                    if conflict_detector.has_teacher_conflict(
-                        timetable.id, day, start_time, end_time, course.teacher_id
-                    ):
-                        continue
-
-                    # No conflicts found - create the slot
-                    day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-                    slot = TimeTableSlot(
-                        timetable_id=timetable.id,
-                        course_id=course.id,
-                        room_id=room.id,
-                        day_of_week=day,
-                        start_time=start_time,
-                        end_time=end_time,
-                        notes=f"Instructor: {course.teacher.name if course.teacher else 'TBA'}"
-                    )
-                    db.session.add(slot)
-                    db.session.flush()  # Get slot ID
-
-                    # Register slot to track conflicts across all timetables
-                    conflict_detector.register_slot(
-                        timetable.id, day, start_time, end_time, room.id,
-                        course.teacher_id, course.id, slot.id
-                    )
-
-                    slots.append(slot)
-                    sessions_scheduled += 1
-                    scheduled_count += 1
-                    room_found = True
-
-                    # print(f"  [SCHEDULE] {course.code} - {day_names[day]} {start_time} in {room.name}")
-                    break
+                if not conflict_detector.teacher_conflict(course['teacher_id'], day, start_time, end_time):
+                    # Start from a random room to distribute load
+                    offset = random.randrange(len(suitable_rooms))
+                    for position in range(len(suitable_rooms)):
+                        room = suitable_rooms[(offset + position) % len(suitable_rooms)]
+
+                        # Check for room conflicts within the term (proper overlap detection)
+                        if conflict_detector.room_conflict(room['id'], day, start_time, end_time):
+                            continue
+
+                        # No conflicts found - create the slot
+                        slot = {
+                            'id': slot_id,
+                            'timetable_id': timetable['id'],
+                            'course_id': course['id'],
+                            'room_id': room['id'],
+                            'day_of_week': day,
+                            'start_time': start_time,
+                            'end_time': end_time,
+                            'notes': f"Instructor: {course['teacher_name'] or 'TBA'}"
+                        }
+
+                        # Register slot to track conflicts within the term
+                        conflict_detector.add_slot(
+                            slot_id, day, start_time, end_time, room['id'], course['teacher_id']
+                        )
+                        slot_id += 1
+
+                        slots.append(slot)
+                        sessions_scheduled += 1
+                        scheduled_count += 1
+                        room_found = True
+                        break
 
                 if not room_found:
                     conflict_count += 1
-                    # If we've tried many times without success, skip this course session to avoid infinite loops
-                    if attempts > max_attempts * 0.8:  # After 80% of attempts
-                        break
+                    skipped_due_to_conflicts += 1
 
             if sessions_scheduled < sessions_needed:
-                print(f"  [WARNING] {course.code}: Only scheduled {sessions_scheduled}/{sessions_needed} sessions after {attempts} attempts")
+                log_row(f"  [WARNING] {course['code']}: Only scheduled {sessions_scheduled}/{sessions_needed} sessions after {attempts} attempts")
+
+        log_row(f"  [SUMMARY] Scheduled: {scheduled_count} slots, Conflicts avoided: {conflict_count}")
+
+    return slots, skipped_due_to_conflicts
+
+
+def seed_timetable_slots(timetables, courses, rooms):
+    """Create time slots with comprehensive conflict detection"""
+    print("\n" + "=" * 70)
+    print("CREATING TIMETABLE SLOTS")
+    print("=" * 70)
 
-        print(f"  [SUMMARY] Scheduled: {scheduled_count} slots, Conflicts avoided: {conflict_count}")
+    slots, skipped_due_to_conflicts = schedule_slots(timetables, courses, rooms, next_id(TimeTableSlot))
 
+    bulk_insert(TimeTableSlot, slots)
     db.session.commit()
     print(f"\nTotal TimeTable Slots: {len(slots)}")
     print(f"Total Conflicts Avoided: {skipped_due_to_conflicts}")
     return slots
 
 
-def print_summary(admins, departments, teachers, rooms, courses, timetables, slots):
+def _seed_partition(partition):
+    """
+    Process pool worker: courses and slots for one group of departments.
+
+    Works on plain rows only (no database access). Ids start at 1 and are
+    shifted by the parent when the partitions are merged.
+    """
+    _settings['verbose'] = False
+    random.seed(partition['seed'])
+    courses = build_courses(partition['departments'], partition['teachers'], partition['levels'],
+                            partition['courses_per_department'])
+    slots, conflicts = schedule_slots(partition['timetables'], courses, partition['rooms'])
+    return courses, slots, conflicts
+
+
+def reconcile_slots(slots, timetables, courses):
+    """
+    Drop slots that conflict with an earlier slot of the same term.
+
+    Partitions book disjoint rooms and teachers, so nothing should be
+    dropped; this guards the merged result before it is inserted.
+
+    Returns:
+        Tuple of (kept slots, number of dropped slots)
+    """
+    terms = {t['id']: (t['semester'], t['academic_year']) for t in timetables}
+    teachers = {c['id']: c['teacher_id'] for c in courses}
+    conflict_detectors = defaultdict(ConflictDetector)
+
+    kept = []
+    for slot in slots:
+        detector = conflict_detectors[terms[slot['timetable_id']]]
+        teacher_id = teachers[slot['course_id']]
+        args = (slot['day_of_week'], slot['start_time'], slot['end_time'])
+        if detector.room_conflict(slot['room_id'], *args) or detector.teacher_conflict(teacher_id, *args):
+            continue
+        detector.add_slot(slot['id'], *args, slot['room_id'], teacher_id)
+        kept.append(slot)
+    return kept, len(slots) - len(kept)
+
+
+def seed_courses_and_slots_parallel(departments, teachers, levels, rooms, timetables,
+                                    courses_per_department=None, processes=2):
+    """
+    Create courses and slots with departments partitioned across a process pool.
+
+    Teachers only teach their own department's courses, so each partition
+    gets whole departments and a disjoint share of every room type; their
+    bookings cannot collide. Partitions are merged (ids shifted, course
+    codes deduplicated), reconciled, and inserted in bulk.
+    """
+    processes = max(1, min(processes, len(departments)))
+    print("\n" + "=" * 70)
+    print(f"CREATING COURSES AND TIMETABLE SLOTS ({processes} PROCESSES)")
+    print("=" * 70)
+
+    if not levels:
+        print("  [ERROR] No levels available. Cannot create courses.")
+        return [], []
+
+    rooms_by_type = defaultdict(list)
+    for room in rooms:
+        rooms_by_type[room['room_type']].append(room)
+
+    partitions = []
+    for index in range(processes):
+        partition_departments = departments[index::processes]
+        department_ids = {d['id'] for d in partition_departments}
+        partitions.append({
+            'seed': random.randrange(2 ** 32),
+            'departments': partition_departments,
+            'teachers': [t for t in teachers if t['department_id'] in department_ids],
+            'levels': levels,
+            'rooms': [room for typed in rooms_by_type.values() for room in typed[index::processes]],
+            'timetables': [t for t in timetables if t['department_id'] in department_ids],
+            'courses_per_department': courses_per_department,
+        })
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(_seed_partition, partitions))
+
+    # Merge: shift each partition's ids past the previous ones
+    courses, slots = [], []
+    existing_codes = set(code for (code,) in db.session.query(Course.code))
+    course_offset, slot_offset = next_id(Course) - 1, next_id(TimeTableSlot) - 1
+    conflicts_avoided = 0
+    for index, (partition_courses, partition_slots, conflicts) in enumerate(results):
+        for course in partition_courses:
+            course['id'] += course_offset
+            code, copy = course['code'], 1
+            while code in existing_codes:
+                copy += 1
+                code = f"{course['code']}-{copy}"
+            course['code'] = code
+            existing_codes.add(code)
+        for slot in partition_slots:
+            slot['id'] += slot_offset
+            slot['course_id'] += course_offset
+        course_offset += len(partition_courses)
+        slot_offset += len(partition_slots)
+        courses.extend(partition_courses)
+        slots.extend(partition_slots)
+        conflicts_avoided += conflicts
+        print(f"  [PARTITION {index + 1}] {len(partitions[index]['departments'])} departments, "
+              f"{len(partitions[index]['rooms'])} rooms: {len(partition_courses)} courses, {len(partition_slots)} slots")
+
+    slots, dropped = reconcile_slots(slots, timetables, courses)
+
+    bulk_insert(Course, courses)
+    bulk_insert(TimeTableSlot, slots)
+    db.session.commit()
+    print(f"\nTotal Courses: {len(courses)}")
+    print_courses_by_level(courses, levels)
+    print(f"\nTotal TimeTable Slots: {len(slots)}")
+    print(f"Total Conflicts Avoided: {conflicts_avoided}")
+    print(f"Slots Dropped by Reconciliation: {dropped}")
+    return courses, slots
+
+
+def print_summary(admins, departments, teachers, rooms, courses, timetables, slots, levels):
     """Print comprehensive summary of seeded data"""
     print("\n" + "=" * 70)
     print("DATABASE SEEDING SUMMARY")
@@ -848,29 +1033,32 @@ def print_summary(admins, departments, teachers, rooms, courses, timetables, slo
 
     # Calculate some statistics
     if rooms:
-        classrooms = sum(1 for r in rooms if r.room_type == 'classroom')
-        labs = sum(1 for r in rooms if r.room_type == 'lab')
-        halls = sum(1 for r in rooms if r.room_type == 'lecture_hall')
+        classrooms = sum(1 for r in rooms if r['room_type'] == 'classroom')
+        labs = sum(1 for r in rooms if r['room_type'] == 'lab')
+        halls = sum(1 for r in rooms if r['room_type'] == 'lecture_hall')
         print(f"\nRoom Breakdown:")
         print(f"  Classrooms:          {classrooms}")
         print(f"  Laboratories:        {labs}")
         print(f"  Lecture Halls:       {halls}")
 
-    if courses and departments:
+    if courses and departments and _settings['verbose']:
         print(f"\nCourses by Department and Level:")
         # Get all levels for lookup
-        all_levels = {l.id: l for l in Level.query.all()}
+        all_levels = {l['id']: l for l in levels}
+        courses_by_dept = defaultdict(list)
+        for course in courses:
+            courses_by_dept[course['department_id']].append(course)
 
         for dept in departments:
-            dept_courses = [c for c in courses if c.department_id == dept.id]
+            dept_courses = courses_by_dept[dept['id']]
             if dept_courses:
-                print(f"  {dept.code} - {dept.name}:")
+                print(f"  {dept['code']} - {dept['name']}:")
                 # Group by level
                 level_courses = defaultdict(list)
                 for course in dept_courses:
-                    if course.level_id and course.level_id in all_levels:
-                        level = all_levels[course.level_id]
-                        level_courses[level.code].append(course)
+                    if course['level_id'] in all_levels:
+                        level = all_levels[course['level_id']]
+                        level_courses[level['code']].append(course)
 
                 for level_code in sorted(level_courses.keys()):
                     print(f"    {level_code}: {len(level_courses[level_code])} courses")
@@ -883,7 +1071,7 @@ def print_summary(admins, departments, teachers, rooms, courses, timetables, slo
         day_counts = defaultdict(int)
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         for slot in slots:
-            day_counts[slot.day_of_week] += 1
+            day_counts[slot['day_of_week']] += 1
 
         print(f"  Slots per day:")
         for day_num in sorted(day_counts.keys()):
@@ -906,8 +1094,36 @@ def print_summary(admins, departments, teachers, rooms, courses, timetables, slo
     print("=" * 70 + "\n")
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Seed the timetable database with realistic, conflict-free data')
+    parser.add_argument('--departments', type=int, default=len(DEPARTMENTS_DATA),
+                        help=f'Number of departments; numbered copies beyond the {len(DEPARTMENTS_DATA)} reference ones')
+    parser.add_argument('--teachers-per-department', type=int, default=6,
+                        help='Teachers per department (default: 6)')
+    parser.add_argument('--courses-per-department', type=int,
+                        help='Courses per department (default: one per course template)')
+    parser.add_argument('--classrooms', type=int, default=20, help='Number of classrooms (default: 20)')
+    parser.add_argument('--labs', type=int, default=10, help='Number of laboratories (default: 10)')
+    parser.add_argument('--terms', type=int, default=2,
+                        help='Alternating Fall/Spring terms from Fall 2024 (default: 2)')
+    parser.add_argument('--max-timetables', type=int, default=20,
+                        help='Maximum number of timetables, 0 for no limit (default: 20)')
+    parser.add_argument('--seed', type=int, help='Random seed for a reproducible dataset')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Rows per insert batch (default: 5000)')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='Generate courses and slots in this many processes, 0 for one per CPU (default: 1)')
+    parser.add_argument('--quiet', action='store_true', help='Only print section headers and totals')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main seeding function"""
+    args = parse_args(argv)
+    _settings['verbose'] = not args.quiet
+    _settings['batch_size'] = args.batch_size
+    if args.seed is not None:
+        random.seed(args.seed)
+
     print("\n" + "=" * 70)
     print("TIMETABLE MANAGER - ADVANCED DATABASE SEEDING")
     print("=" * 70)
@@ -920,23 +1136,37 @@ def main():
 
     with app.app_context():
         try:
+            started = perf_counter()
+
             # Clear existing data
             clear_database()
 
             # Seed data in correct order
             admins = seed_admins()
-            departments = seed_departments()
-            teachers = seed_teachers(departments)
+            departments = seed_departments(args.departments)
+            teachers = seed_teachers(departments, args.teachers_per_department)
             levels = seed_levels()
-            rooms = seed_rooms()
-            courses = seed_courses(departments, teachers, levels)
-            timetables = seed_timetables(departments, admins)
-            slots = seed_timetable_slots(timetables, courses, rooms)
+            rooms = seed_rooms(args.classrooms, args.labs)
+            processes = args.processes or os.cpu_count() or 1
+            if processes > 1:
+                timetables = seed_timetables(departments, admins, levels, args.terms, args.max_timetables)
+                courses, slots = seed_courses_and_slots_parallel(
+                    departments, teachers, levels, rooms, timetables, args.courses_per_department, processes
+                )
+            else:
+                courses = seed_courses(departments, teachers, levels, args.courses_per_department)
+                timetables = seed_timetables(departments, admins, levels, args.terms, args.max_timetables)
+                slots = seed_timetable_slots(timetables, courses, rooms)
+
+            reset_sequences(Department, Teacher, Level, Room, Course, TimeTable, TimeTableSlot)
+            db.session.commit()
 
             # Print summary
-            print_summary(admins, departments, teachers, rooms, courses, timetables, slots)
+            print_summary(admins, departments, teachers, rooms, courses, timetables, slots, levels)
+            print(f"Seeded in {perf_counter() - started:.1f}s")
 
         except Exception as e:
+            db.session.rollback()
             print(f"\n{'=' * 70}")
             print("ERROR DURING SEEDING")
             print("=" * 70)
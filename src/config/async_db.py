@@ -0,0 +1,73 @@
+"""
+Async SQLAlchemy engine for the async read endpoints (routes/async_reads.py)
+
+Flask runs each async view in its own event loop, and asyncio connections
+are bound to the loop that opened them, so pooled connections cannot be
+reused across requests. The async engines therefore use NullPool; put
+PgBouncer in front of Postgres if connection setup cost matters.
+"""
+import os
+from flask import current_app, g
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from config.db import REPLICA_BIND
+from config.env import DB_APPLICATION_NAME, DB_STATEMENT_TIMEOUT_MS
+
+# Sync driver -> asyncio driver
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'postgres': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+_engines = {}
+
+
+def to_async_url(uri):
+    """Return the asyncio-driver equivalent of a sync database URI."""
+    url = make_url(uri)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        raise ValueError(f"No async driver configured for '{url.drivername}'")
+    return url.set(drivername=driver)
+
+
+def _connect_args(url):
+    if not url.drivername.startswith('postgresql'):
+        return {}
+    # asyncpg takes server settings directly instead of libpq's 'options'
+    server_settings = {'application_name': DB_APPLICATION_NAME}
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        server_settings['statement_timeout'] = str(DB_STATEMENT_TIMEOUT_MS)
+    return {'server_settings': server_settings}
+
+
+def get_async_engine(bind_key=None):
+    """Get (or create) this process's async engine for the primary or a bind."""
+    if bind_key is None:
+        uri = current_app.config['SQLALCHEMY_DATABASE_URI']
+    else:
+        uri = current_app.config.get('SQLALCHEMY_BINDS', {})[bind_key]
+
+    key = (os.getpid(), uri)
+    engine = _engines.get(key)
+    if engine is None:
+        url = to_async_url(uri)
+        engine = create_async_engine(url, poolclass=NullPool, connect_args=_connect_args(url))
+        _engines[key] = engine
+    return engine
+
+
+def async_session():
+    """
+    New AsyncSession for the current request.
+
+    Uses the read replica when the request was routed to it (see
+    config.db.register_replica_routing). Use one session per concurrent
+    task: an AsyncSession cannot run two queries at once.
+    """
+    use_replica = g.get('db_use_replica') and REPLICA_BIND in current_app.config.get('SQLALCHEMY_BINDS', {})
+    engine = get_async_engine(REPLICA_BIND if use_replica else None)
+    return async_sessionmaker(engine, expire_on_commit=False)()
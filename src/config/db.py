@@ -1,9 +1,44 @@
+from flask import g, has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 import os
+import time
 from urllib.parse import quote_plus
-from config.env import DATABASE_URL, SECRET_KEY
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from config.env import (
+    DATABASE_URL, SECRET_KEY, DATABASE_REPLICA_URL, DB_REPLICA_STICKY_SECONDS, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING, DB_STATEMENT_TIMEOUT_MS, DB_APPLICATION_NAME, JWT_ACCESS_TOKEN_MINUTES, JWT_REFRESH_TOKEN_DAYS,
+    JWT_REVOCATION_REFRESH_SECONDS, JWT_CACHE_SIZE, JWT_NEGATIVE_CACHE_SECONDS, JWT_NEGATIVE_CACHE_SIZE,
+    PASSWORD_HASH_METHOD, PASSWORD_HASH_WORKERS, PASSWORD_HASH_QUEUE,
+    RATE_LIMIT_ENABLED, RATE_LIMITS, RATE_LIMIT_STORAGE_URL, TRUSTED_PROXY_COUNT, QUERY_TIMING_ENABLED,
+    METRICS_ENABLED, SLOW_QUERY_MS, SLOW_QUERY_EXPLAIN, SLOW_QUERY_LOG_SIZE,
+    NPLUSONE_DETECTION, NPLUSONE_THRESHOLD, NPLUSONE_STRICT_ENDPOINTS, IMPORT_BATCH_SIZE
+)
 
-db = SQLAlchemy()
+REPLICA_BIND = 'replica'
+PRIMARY_UNTIL_COOKIE = 'db_primary_until'
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from the replica engine during GET/HEAD requests.
+
+    Flushes always go to the primary, as does everything outside a request
+    or when no replica is configured. The per-request decision is made in
+    _choose_database (see register_replica_routing).
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_request_context() and g.get('db_use_replica'):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 def _build_uri():
     # Prefer explicit full URL from environment (compose sets SQLALCHEMY_DATABASE_URI)
@@ -17,7 +52,155 @@ def _build_uri():
     name = os.getenv("DB_NAME", "timetable_manager")
     return f"postgresql://{user}:{pwd}@{host}:{port}/{name}"
 
+
+POOL_CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent obtaining a connection from the SQLAlchemy pool (includes opening new connections)',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def _build_binds():
+    if not DATABASE_REPLICA_URL:
+        return {}
+    return {REPLICA_BIND: DATABASE_REPLICA_URL}
+
+
+def _choose_database():
+    # Reads go to the replica unless this client wrote recently (read-your-writes)
+    if request.method not in ('GET', 'HEAD'):
+        g.db_use_replica = False
+        return
+    try:
+        primary_until = float(request.cookies.get(PRIMARY_UNTIL_COOKIE, 0))
+    except ValueError:
+        primary_until = 0
+    g.db_use_replica = primary_until < time.time()
+
+
+def _pin_client_to_primary(response):
+    if request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+        sticky_seconds = DB_REPLICA_STICKY_SECONDS
+        response.set_cookie(
+            PRIMARY_UNTIL_COOKIE, str(time.time() + sticky_seconds),
+            max_age=int(sticky_seconds) + 1, httponly=True, samesite='Lax'
+        )
+    return response
+
+
+def register_replica_routing(app):
+    """
+    Route GET/HEAD reads to the replica bind when one is configured.
+
+    After a successful write, the client gets a short-lived cookie that
+    keeps its reads on the primary for DB_REPLICA_STICKY_SECONDS, so it
+    never reads older data than it just wrote. The cookie works across
+    workers; clients that drop cookies fall back to replica reads.
+    """
+    if REPLICA_BIND not in app.config.get('SQLALCHEMY_BINDS', {}):
+        return
+    app.before_request(_choose_database)
+    app.after_request(_pin_client_to_primary)
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
+def register_sqlite_foreign_keys(app):
+    """
+    Enforce foreign keys on SQLite connections.
+
+    SQLite ignores them (including ON DELETE CASCADE, which deleting a
+    timetable relies on) unless enabled per connection.
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            if engine.dialect.name == 'sqlite' and not event.contains(engine, 'connect', _enable_sqlite_foreign_keys):
+                event.listen(engine, 'connect', _enable_sqlite_foreign_keys)
+
+
+def _build_engine_options(uri):
+    # Pool sizing only applies to server databases; SQLite picks its own pool class
+    if not uri.startswith('postgresql'):
+        return {'pool_pre_ping': DB_POOL_PRE_PING}
+
+    server_options = []
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        server_options.append(f'-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}')
+
+    connect_args = {'application_name': DB_APPLICATION_NAME}
+    if server_options:
+        connect_args['options'] = ' '.join(server_options)
+
+    return {
+        'poolclass': TimedQueuePool,
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_pre_ping': DB_POOL_PRE_PING,
+        'connect_args': connect_args,
+    }
+
 class Config:
     SECRET_KEY = SECRET_KEY
     SQLALCHEMY_DATABASE_URI = _build_uri()
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_ENGINE_OPTIONS = _build_engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_BINDS = _build_binds()
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Access tokens are short-lived; sessions are extended with refresh tokens
+    JWT_ACCESS_TOKEN_MINUTES = JWT_ACCESS_TOKEN_MINUTES
+    JWT_REFRESH_TOKEN_DAYS = JWT_REFRESH_TOKEN_DAYS
+    # Seconds between reloads of the in-memory token revocation list
+    JWT_REVOCATION_REFRESH_SECONDS = JWT_REVOCATION_REFRESH_SECONDS
+    # Verified-token LRU: max entries (0 disables); invalid tokens use a separate,
+    # smaller LRU with its own size and entry lifetime
+    JWT_CACHE_SIZE = JWT_CACHE_SIZE
+    JWT_NEGATIVE_CACHE_SECONDS = JWT_NEGATIVE_CACHE_SECONDS
+    JWT_NEGATIVE_CACHE_SIZE = JWT_NEGATIVE_CACHE_SIZE
+
+    # Password hashing method and the bounded pool that runs it (0 workers = min(4, CPUs))
+    PASSWORD_HASH_METHOD = PASSWORD_HASH_METHOD
+    PASSWORD_HASH_WORKERS = PASSWORD_HASH_WORKERS
+    PASSWORD_HASH_QUEUE = PASSWORD_HASH_QUEUE
+
+    # Token-bucket rate limits per endpoint/blueprint; memory:// or redis:// storage
+    RATE_LIMIT_ENABLED = RATE_LIMIT_ENABLED
+    RATE_LIMITS = RATE_LIMITS
+    RATE_LIMIT_STORAGE_URL = RATE_LIMIT_STORAGE_URL
+    # Proxies trusted to set X-Forwarded-For (client IPs for rate limiting come from it)
+    TRUSTED_PROXY_COUNT = TRUSTED_PROXY_COUNT
+
+    # X-Query-Count and Server-Timing (db, serialize, total) response headers
+    QUERY_TIMING_ENABLED = QUERY_TIMING_ENABLED
+    # Prometheus metrics at /metrics (see PROMETHEUS_MULTIPROC_DIR for gunicorn)
+    METRICS_ENABLED = METRICS_ENABLED
+
+    # Queries slower than SLOW_QUERY_MS are logged and listed at /api/diagnostics/slow-queries
+    SLOW_QUERY_MS = SLOW_QUERY_MS
+    SLOW_QUERY_EXPLAIN = SLOW_QUERY_EXPLAIN
+    SLOW_QUERY_LOG_SIZE = SLOW_QUERY_LOG_SIZE
+
+    # N+1 detector: 'off', 'warn' or 'raise' past NPLUSONE_THRESHOLD repeats per request
+    NPLUSONE_DETECTION = NPLUSONE_DETECTION
+    NPLUSONE_THRESHOLD = NPLUSONE_THRESHOLD
+    # Endpoints (e.g. "timetables.get_timetable") where any lazy relationship load raises
+    NPLUSONE_STRICT_ENDPOINTS = NPLUSONE_STRICT_ENDPOINTS
+
+    # Rows per INSERT ... ON CONFLICT statement when importing CSV/NDJSON uploads
+    IMPORT_BATCH_SIZE = IMPORT_BATCH_SIZE
@@ -6,4 +6,58 @@ load_dotenv()
 # Load all environment variables
 DATABASE_URL = os.environ.get('DATABASE_URL')
 SECRET_KEY = os.environ.get('SECRET_KEY')
-DEBUG = os.environ.get('DEBUG', 'False') == 'True'
\ No newline at end of file
+DEBUG = os.environ.get('DEBUG', 'False') == 'True'
+
+# Optional read replica for GET requests, and how long a client's reads stay on the primary after it writes
+DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+DB_REPLICA_STICKY_SECONDS = float(os.environ.get('DB_REPLICA_STICKY_SECONDS', '5'))
+
+# Database connection pool (PostgreSQL)
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '10'))
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '20'))
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'True') == 'True'
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', '30000'))
+DB_APPLICATION_NAME = os.environ.get('DB_APPLICATION_NAME', 'timetable_manager')
+
+# Per-request query count / DB time in X-Query-Count and Server-Timing headers
+QUERY_TIMING_ENABLED = os.environ.get('QUERY_TIMING_ENABLED', 'False') == 'True'
+
+# Prometheus /metrics endpoint and request/pool instrumentation
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+
+# Slow query log (0 disables); EXPLAIN captures PostgreSQL plans once per statement shape
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', '0'))
+SLOW_QUERY_EXPLAIN = os.environ.get('SLOW_QUERY_EXPLAIN', 'False') == 'True'
+SLOW_QUERY_LOG_SIZE = int(os.environ.get('SLOW_QUERY_LOG_SIZE', '100'))
+
+# N+1 query detection for development/tests: off, warn or raise; strict endpoints reject lazy loads
+NPLUSONE_DETECTION = os.environ.get('NPLUSONE_DETECTION', 'off')
+NPLUSONE_THRESHOLD = int(os.environ.get('NPLUSONE_THRESHOLD', '5'))
+NPLUSONE_STRICT_ENDPOINTS = tuple(
+    name.strip() for name in os.environ.get('NPLUSONE_STRICT_ENDPOINTS', '').split(',') if name.strip()
+)
+
+# Rows per INSERT ... ON CONFLICT statement in /api/import uploads
+IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', '500'))
+
+# Authentication
+JWT_ACCESS_TOKEN_MINUTES = int(os.environ.get('JWT_ACCESS_TOKEN_MINUTES', '15'))
+JWT_REFRESH_TOKEN_DAYS = int(os.environ.get('JWT_REFRESH_TOKEN_DAYS', '14'))
+JWT_REVOCATION_REFRESH_SECONDS = int(os.environ.get('JWT_REVOCATION_REFRESH_SECONDS', '30'))
+JWT_CACHE_SIZE = int(os.environ.get('JWT_CACHE_SIZE', '1024'))
+JWT_NEGATIVE_CACHE_SECONDS = float(os.environ.get('JWT_NEGATIVE_CACHE_SECONDS', '5'))
+JWT_NEGATIVE_CACHE_SIZE = int(os.environ.get('JWT_NEGATIVE_CACHE_SIZE', '256'))
+
+# Password hashing (werkzeug method string, e.g. 'scrypt:16384:8:1' or 'pbkdf2:sha256:600000')
+PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:16384:8:1')
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '0'))
+PASSWORD_HASH_QUEUE = int(os.environ.get('PASSWORD_HASH_QUEUE', '32'))
+
+# Rate limiting (RATE_LIMITS format: "auth.login=10/60,slots=300/60,_write=120/60")
+RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'True') == 'True'
+RATE_LIMITS = os.environ.get('RATE_LIMITS', '_write=120/60')
+RATE_LIMIT_STORAGE_URL = os.environ.get('RATE_LIMIT_STORAGE_URL', 'memory://')
+# Reverse proxies in front of the app whose X-Forwarded-For/-Proto are trusted (0 = none)
+TRUSTED_PROXY_COUNT = int(os.environ.get('TRUSTED_PROXY_COUNT', '0'))
@@ -1,16 +1,39 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_migrate import Migrate
-from config.db import db
+from werkzeug.middleware.proxy_fix import ProxyFix
+from config.db import db, register_replica_routing, register_sqlite_foreign_keys
 
 def create_app():
     app = Flask(__name__)
     app.config.from_object('config.db.Config')
 
+    # Behind reverse proxies, take the client address from X-Forwarded-For;
+    # only the last TRUSTED_PROXY_COUNT hops are trusted, so clients cannot spoof it
+    proxy_count = app.config.get('TRUSTED_PROXY_COUNT', 0)
+    if proxy_count:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxy_count, x_proto=proxy_count)
+
 
     db.init_app(app)
+    register_sqlite_foreign_keys(app)
+
+    # Registered first so they see every request and their timings cover the other hooks
+    from services.metrics_service import init_metrics
+    init_metrics(app)
+    from services.query_timing_service import init_query_timing
+    init_query_timing(app)
+    from services.slow_query_service import init_slow_query_log
+    init_slow_query_log(app)
+    from services.nplusone_service import init_nplusone_detection
+    init_nplusone_detection(app)
+
+    register_replica_routing(app)
     CORS(app)
 
+    from services.rate_limit_service import init_rate_limiting
+    init_rate_limiting(app)
+
     Migrate(app, db)
 
     from models import Admin, Department, Teacher, Room, Course, TimeTable, TimeTableSlot
@@ -5,6 +5,7 @@ from .course import Course
 from .department import Department
 from .level import Level
 from .timetable import TimeTable, TimeTableSlot
+from .refresh_token import RefreshToken
 
 __all__ = [
     'Admin',
@@ -14,5 +15,6 @@ __all__ = [
     'Department',
     'Level',
     'TimeTable',
-    'TimeTableSlot'
+    'TimeTableSlot',
+    'RefreshToken'
 ]
\ No newline at end of file
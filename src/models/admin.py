@@ -1,7 +1,26 @@
 from config.db import db
 from datetime import datetime
+from functools import lru_cache
+from flask import current_app
 from werkzeug.security import generate_password_hash, check_password_hash
 
+# scrypt N=2**14, r=8, p=1: the interactive-login parameters from the scrypt paper.
+# Measured at roughly half the latency and memory of werkzeug's default (N=2**15);
+# run scripts/benchmark_password_hash.py to pick a value for your hardware.
+DEFAULT_PASSWORD_HASH_METHOD = 'scrypt:16384:8:1'
+
+
+def password_hash_method():
+    return current_app.config.get('PASSWORD_HASH_METHOD', DEFAULT_PASSWORD_HASH_METHOD)
+
+
+@lru_cache(maxsize=8)
+def _hash_method_prefix(method):
+    # werkzeug expands shorthand methods ("scrypt", "pbkdf2") with its defaults,
+    # so derive the canonical "method:params" prefix from a real hash
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+
 class Admin(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
@@ -9,14 +28,21 @@ class Admin(db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False)
     role = db.Column(db.String(20), default='admin')
     is_active = db.Column(db.Boolean, default=True, nullable=False)
+    token_version = db.Column(db.Integer, default=0, nullable=False)  # Bumped to revoke issued tokens
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=password_hash_method())
 
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
+    def needs_rehash(self):
+        return self.password_hash.split('$', 1)[0] != _hash_method_prefix(password_hash_method())
+
+    def revoke_tokens(self):
+        self.token_version = (self.token_version or 0) + 1
+
     def __repr__(self):
-        return f'<Admin {self.username}>'
\ No newline at end of file
+        return f'<Admin {self.username}>'
@@ -14,13 +14,31 @@ Models included:
 - Room: Physical spaces (classrooms, labs, lecture halls)
 - TimeTable: Weekly schedules
 - TimeTableSlot: Individual time slots
+- RefreshToken: Hashed refresh tokens for admin sessions
 """
 
 from config.db import db
 from datetime import datetime
+from functools import lru_cache
+from flask import current_app
 from werkzeug.security import generate_password_hash, check_password_hash
 
 
+# scrypt N=2**14, r=8, p=1: the interactive-login parameters from the scrypt paper
+DEFAULT_PASSWORD_HASH_METHOD = 'scrypt:16384:8:1'
+
+
+def password_hash_method():
+    """Return the configured werkzeug password hash method."""
+    return current_app.config.get('PASSWORD_HASH_METHOD', DEFAULT_PASSWORD_HASH_METHOD)
+
+
+@lru_cache(maxsize=8)
+def _hash_method_prefix(method):
+    """Canonical "method:params" prefix werkzeug writes for a method."""
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+
 # ============================================================================
 # ADMIN MODEL
 # ============================================================================
@@ -33,17 +51,26 @@ class Admin(db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False)
     role = db.Column(db.String(20), default='admin')
     is_active = db.Column(db.Boolean, default=True, nullable=False)
+    token_version = db.Column(db.Integer, default=0, nullable=False)  # Bumped to revoke issued tokens
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def set_password(self, password):
         """Set password hash from plain text password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=password_hash_method())
 
     def check_password(self, password):
         """Check if provided password matches hash."""
         return check_password_hash(self.password_hash, password)
 
+    def needs_rehash(self):
+        """True if the stored hash uses a different method or cost than configured."""
+        return self.password_hash.split('$', 1)[0] != _hash_method_prefix(password_hash_method())
+
+    def revoke_tokens(self):
+        """Invalidate every token issued before this call."""
+        self.token_version = (self.token_version or 0) + 1
+
     def __repr__(self):
         return f'<Admin {self.username}>'
 
@@ -254,3 +281,29 @@ class TimeTableSlot(db.Model):
         days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         return days[self.day_of_week] if 0 <= self.day_of_week <= 6 else 'Invalid Day'
 
+
+# ============================================================================
+# REFRESH TOKEN MODEL
+# ============================================================================
+
+class RefreshToken(db.Model):
+    """Long-lived refresh tokens, stored as SHA-256 digests."""
+    __tablename__ = 'refresh_token'
+
+    id = db.Column(db.Integer, primary_key=True)
+    admin_id = db.Column(db.Integer, db.ForeignKey('admin.id'), nullable=False, index=True)
+    token_hash = db.Column(db.String(64), unique=True, nullable=False)  # SHA-256 hex digest, never the raw token
+    expires_at = db.Column(db.DateTime, nullable=False)
+    revoked_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Relationships
+    admin = db.relationship('Admin', backref=db.backref('refresh_tokens', lazy='dynamic'))
+
+    @property
+    def is_usable(self):
+        """True while the token is neither revoked nor expired."""
+        return self.revoked_at is None and self.expires_at > datetime.utcnow()
+
+    def __repr__(self):
+        return f'<RefreshToken {self.id} admin={self.admin_id}>'
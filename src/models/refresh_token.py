@@ -0,0 +1,22 @@
+from config.db import db
+from datetime import datetime
+
+class RefreshToken(db.Model):
+    __tablename__ = 'refresh_token'
+
+    id = db.Column(db.Integer, primary_key=True)
+    admin_id = db.Column(db.Integer, db.ForeignKey('admin.id'), nullable=False, index=True)
+    token_hash = db.Column(db.String(64), unique=True, nullable=False)  # SHA-256 hex digest, never the raw token
+    expires_at = db.Column(db.DateTime, nullable=False)
+    revoked_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Relationships
+    admin = db.relationship('Admin', backref=db.backref('refresh_tokens', lazy='dynamic'))
+
+    @property
+    def is_usable(self):
+        return self.revoked_at is None and self.expires_at > datetime.utcnow()
+
+    def __repr__(self):
+        return f'<RefreshToken {self.id} admin={self.admin_id}>'
@@ -21,7 +21,8 @@ class TimeTable(db.Model):
     department = db.relationship('Department', backref='timetables')
     level = db.relationship('Level', backref='timetables')
     creator = db.relationship('Admin', backref='created_timetables')
-    slots = db.relationship('TimeTableSlot', backref='timetable', cascade='all, delete-orphan')
+    # Slots are removed by the database (ON DELETE CASCADE) without being loaded
+    slots = db.relationship('TimeTableSlot', backref='timetable', cascade='all, delete-orphan', passive_deletes=True)
 
     def __repr__(self):
         return f'<TimeTable {self.name}>'
@@ -30,7 +31,7 @@ class TimeTableSlot(db.Model):
     __tablename__ = 'timetable_slot'
 
     id = db.Column(db.Integer, primary_key=True)
-    timetable_id = db.Column(db.Integer, db.ForeignKey('time_table.id'), nullable=False)
+    timetable_id = db.Column(db.Integer, db.ForeignKey('time_table.id', ondelete='CASCADE'), nullable=False)
     course_id = db.Column(db.Integer, db.ForeignKey('course.id'), nullable=False)
     room_id = db.Column(db.Integer, db.ForeignKey('room.id'), nullable=False)
     day_of_week = db.Column(db.Integer, nullable=False)  # 0=Monday, 1=Tuesday, etc. (more standardized)
@@ -9,6 +9,10 @@ from .courses import courses_bp
 from .timetables import timetables_bp
 from .slots import slots_bp
 from .levels import levels_bp
+from .async_reads import async_reads_bp
+from .metrics import metrics_bp
+from .diagnostics import diagnostics_bp
+from .imports import imports_bp
 
 def register_blueprints(app):
     """Register all blueprints with the Flask app"""
@@ -20,6 +24,10 @@ def register_blueprints(app):
     app.register_blueprint(timetables_bp)
     app.register_blueprint(slots_bp)
     app.register_blueprint(levels_bp)
+    app.register_blueprint(async_reads_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(diagnostics_bp)
+    app.register_blueprint(imports_bp)
 
 __all__ = [
     'register_blueprints',
@@ -30,5 +38,9 @@ __all__ = [
     'courses_bp',
     'timetables_bp',
     'slots_bp',
-    'levels_bp'
+    'levels_bp',
+    'async_reads_bp',
+    'metrics_bp',
+    'diagnostics_bp',
+    'imports_bp'
 ]
\ No newline at end of file
@@ -0,0 +1,90 @@
+from flask import Blueprint, request, jsonify
+from services.async_read_service import (
+    fetch_timetable,
+    fetch_slots,
+    fetch_room_schedule,
+    fetch_teacher_schedule,
+    fetch_timetable_dashboard
+)
+from services.jwt_service import token_required
+
+async_reads_bp = Blueprint('async_reads', __name__, url_prefix='/api/async')
+
+
+@async_reads_bp.route('/timetables/<int:timetable_id>', methods=['GET'])
+async def get_timetable(timetable_id):
+    """Get a specific timetable with all its slots (async)."""
+    try:
+        include_slots = request.args.get('include_slots', 'true').lower() == 'true'
+        include_stats = request.args.get('include_stats', 'false').lower() == 'true'
+
+        timetable = await fetch_timetable(timetable_id, include_slots=include_slots, include_stats=include_stats)
+        if not timetable:
+            return jsonify({'error': 'Timetable not found'}), 404
+
+        return jsonify({'timetable': timetable}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@async_reads_bp.route('/timetables/<int:timetable_id>/slots', methods=['GET'])
+async def get_slots(timetable_id):
+    """Get all timetable slots with optional filtering (async)."""
+    try:
+        slots = await fetch_slots(
+            timetable_id,
+            course_id=request.args.get('course_id', type=int),
+            room_id=request.args.get('room_id', type=int),
+            day_of_week=request.args.get('day_of_week', type=int)
+        )
+
+        return jsonify({'slots': slots}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@async_reads_bp.route('/timetables/<int:timetable_id>/dashboard', methods=['GET'])
+@token_required
+async def get_timetable_dashboard(current_admin, timetable_id):
+    """Get a timetable, its statistics and the schedules of its rooms and teachers in one request."""
+    try:
+        dashboard = await fetch_timetable_dashboard(timetable_id)
+        if not dashboard:
+            return jsonify({'error': 'Timetable not found'}), 404
+
+        return jsonify(dashboard), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@async_reads_bp.route('/rooms/<int:room_id>/schedule', methods=['GET'])
+@token_required
+async def get_room_schedule(current_admin, room_id):
+    """Get room's complete schedule (async)."""
+    try:
+        schedule = await fetch_room_schedule(room_id, request.args.get('timetable_id', type=int))
+        if not schedule:
+            return jsonify({'error': 'Room not found'}), 404
+
+        return jsonify(schedule), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@async_reads_bp.route('/teachers/<int:teacher_id>/schedule', methods=['GET'])
+@token_required
+async def get_teacher_schedule(current_admin, teacher_id):
+    """Get teacher's timetable schedule (async)."""
+    try:
+        schedule = await fetch_teacher_schedule(teacher_id)
+        if schedule is None:
+            return jsonify({'error': 'Teacher not found'}), 404
+
+        return jsonify({'schedule': schedule}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
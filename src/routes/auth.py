@@ -1,7 +1,16 @@
 from flask import Blueprint, request, jsonify
-from models.admin import Admin
+from models.admin import Admin, password_hash_method
 from config.db import db
-from services.jwt_service import generate_token, token_required, get_current_admin_from_token
+from services.password_service import verify_password, hash_password
+from services.jwt_service import (
+    generate_token_pair,
+    rotate_refresh_token,
+    revoke_refresh_token,
+    revoke_all_refresh_tokens,
+    token_required,
+    get_current_admin_from_token,
+    revocation_list
+)
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
@@ -25,24 +34,29 @@ def register():
         if Admin.query.filter_by(email=data['email']).first():
             return jsonify({'error': 'Email already exists'}), 400
 
+        # Hashing runs in a bounded pool; shed load instead of piling up threads
+        password_hash, error = hash_password(data['password'], password_hash_method())
+        if error:
+            return jsonify({'error': error}), 503, {'Retry-After': '1'}
+
         # Create new admin
         admin = Admin(
             username=data['username'],
             email=data['email'],
             role=data.get('role', 'admin'),
-            is_active=True
+            is_active=True,
+            password_hash=password_hash
         )
-        admin.set_password(data['password'])
 
         db.session.add(admin)
         db.session.commit()
 
-        # Generate token
-        token = generate_token(admin.id)
+        # Generate access/refresh token pair
+        tokens = generate_token_pair(admin)
 
         return jsonify({
             'message': 'Admin registered successfully',
-            'token': token,
+            **tokens,
             'admin': {
                 'id': admin.id,
                 'username': admin.username,
@@ -69,7 +83,15 @@ def login():
         # Find admin by username
         admin = Admin.query.filter_by(username=data['username']).first()
 
-        if not admin or not admin.check_password(data['password']):
+        if not admin:
+            return jsonify({'error': 'Invalid credentials'}), 401
+
+        # Hashing runs in a bounded pool; shed load instead of piling up threads
+        matched, error = verify_password(admin.password_hash, data['password'])
+        if error:
+            return jsonify({'error': error}), 503, {'Retry-After': '1'}
+
+        if not matched:
             return jsonify({'error': 'Invalid credentials'}), 401
 
         # Check if admin account is active (backward compatible)
@@ -77,12 +99,19 @@ def login():
         if not is_active:
             return jsonify({'error': 'Your account has been disabled. Please contact a super administrator.'}), 403
 
-        # Generate token
-        token = generate_token(admin.id)
+        # Transparently upgrade hashes made with an outdated method or cost
+        if admin.needs_rehash():
+            new_hash, error = hash_password(data['password'], password_hash_method())
+            if not error:
+                admin.password_hash = new_hash
+                db.session.commit()
+
+        # Generate access/refresh token pair
+        tokens = generate_token_pair(admin)
 
         return jsonify({
             'message': 'Login successful',
-            'token': token,
+            **tokens,
             'admin': {
                 'id': admin.id,
                 'username': admin.username,
@@ -96,19 +125,65 @@ def login():
         return jsonify({'error': str(e)}), 500
 
 
+@auth_bp.route('/refresh', methods=['POST'])
+def refresh():
+    """Exchange a refresh token for a new access/refresh token pair."""
+    try:
+        data = request.get_json()
+
+        if not data or not data.get('refresh_token'):
+            return jsonify({'error': 'refresh_token is required'}), 400
+
+        tokens, error = rotate_refresh_token(data['refresh_token'])
+
+        if error:
+            status_code = 500 if error.startswith('Error') else 401
+            return jsonify({'error': error}), status_code
+
+        return jsonify({
+            'message': 'Token refreshed successfully',
+            **tokens
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@auth_bp.route('/logout', methods=['POST'])
+def logout():
+    """Revoke a refresh token."""
+    try:
+        data = request.get_json()
+
+        if not data or not data.get('refresh_token'):
+            return jsonify({'error': 'refresh_token is required'}), 400
+
+        revoke_refresh_token(data['refresh_token'])
+
+        return jsonify({'message': 'Logged out successfully'}), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @auth_bp.route('/me', methods=['GET'])
 @token_required
 def get_current_admin(current_admin):
     """Get current admin information."""
+    admin = Admin.query.get(current_admin.id)
+    if not admin:
+        return jsonify({'error': 'Admin not found'}), 404
+
     return jsonify({
         'admin': {
-            'id': current_admin.id,
-            'username': current_admin.username,
-            'email': current_admin.email,
-                'role': current_admin.role,
-                'is_active': getattr(current_admin, 'is_active', True),
-            'created_at': current_admin.created_at.isoformat(),
-            'updated_at': current_admin.updated_at.isoformat()
+            'id': admin.id,
+            'username': admin.username,
+            'email': admin.email,
+                'role': admin.role,
+                'is_active': getattr(admin, 'is_active', True),
+            'created_at': admin.created_at.isoformat(),
+            'updated_at': admin.updated_at.isoformat()
         }
     }), 200
 
@@ -158,7 +233,13 @@ def toggle_admin_status(current_admin, admin_id):
         # Toggle status (ensure is_active exists)
         current_status = getattr(admin, 'is_active', True)
         admin.is_active = not current_status
+        if not admin.is_active:
+            # Tokens issued before the account was disabled stay invalid after re-enabling
+            admin.revoke_tokens()
         db.session.commit()
+        revocation_list.invalidate()
+        if not admin.is_active:
+            revoke_all_refresh_tokens(admin.id)
 
         return jsonify({
             'message': f'Admin account {"enabled" if admin.is_active else "disabled"} successfully',
@@ -187,15 +268,33 @@ def change_password(current_admin):
         if not data.get('current_password') or not data.get('new_password'):
             return jsonify({'error': 'Current password and new password are required'}), 400
 
-        # Verify current password
-        if not current_admin.check_password(data['current_password']):
+        admin = Admin.query.get(current_admin.id)
+        if not admin:
+            return jsonify({'error': 'Admin not found'}), 404
+
+        # Verify current password (in the bounded hashing pool, like login)
+        matched, error = verify_password(admin.password_hash, data['current_password'])
+        if error:
+            return jsonify({'error': error}), 503, {'Retry-After': '1'}
+
+        if not matched:
             return jsonify({'error': 'Current password is incorrect'}), 400
 
-        # Update password
-        current_admin.set_password(data['new_password'])
+        new_hash, error = hash_password(data['new_password'], password_hash_method())
+        if error:
+            return jsonify({'error': error}), 503, {'Retry-After': '1'}
+
+        # Update password and sign out every other session
+        admin.password_hash = new_hash
+        admin.revoke_tokens()
         db.session.commit()
+        revocation_list.invalidate()
+        revoke_all_refresh_tokens(admin.id)
 
-        return jsonify({'message': 'Password changed successfully'}), 200
+        return jsonify({
+            'message': 'Password changed successfully',
+            **generate_token_pair(admin)
+        }), 200
 
     except Exception as e:
         db.session.rollback()
@@ -209,29 +308,33 @@ def update_profile(current_admin):
     try:
         data = request.get_json()
 
+        admin = Admin.query.get(current_admin.id)
+        if not admin:
+            return jsonify({'error': 'Admin not found'}), 404
+
         # Update allowed fields
         if 'email' in data:
             # Check if email is already taken by another admin
             existing_admin = Admin.query.filter_by(email=data['email']).first()
-            if existing_admin and existing_admin.id != current_admin.id:
+            if existing_admin and existing_admin.id != admin.id:
                 return jsonify({'error': 'Email already exists'}), 400
-            current_admin.email = data['email']
+            admin.email = data['email']
 
         if 'username' in data:
             # Check if username is already taken by another admin
             existing_admin = Admin.query.filter_by(username=data['username']).first()
-            if existing_admin and existing_admin.id != current_admin.id:
+            if existing_admin and existing_admin.id != admin.id:
                 return jsonify({'error': 'Username already exists'}), 400
-            current_admin.username = data['username']
+            admin.username = data['username']
 
         db.session.commit()
 
         return jsonify({
             'message': 'Profile updated successfully',
             'admin': {
-                'id': current_admin.id,
-                'username': current_admin.username,
-                'email': current_admin.email,
+                'id': admin.id,
+                'username': admin.username,
+                'email': admin.email,
             }
         }), 200
 
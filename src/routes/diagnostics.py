@@ -0,0 +1,28 @@
+from flask import Blueprint, request, jsonify, current_app
+from services.slow_query_service import slow_query_log
+from services.jwt_service import token_required
+
+diagnostics_bp = Blueprint('diagnostics', __name__, url_prefix='/api/diagnostics')
+
+
+@diagnostics_bp.route('/slow-queries', methods=['GET'])
+@token_required
+def get_slow_queries(current_admin):
+    """Get this worker's most recent slow queries, with captured plans. Only super admins can do this."""
+    try:
+        if current_admin.role != 'super_admin':
+            return jsonify({'error': 'Only super administrators can view diagnostics'}), 403
+
+        entries = slow_query_log.snapshot()
+        limit = request.args.get('limit', type=int)
+        if limit:
+            entries = entries[:limit]
+
+        return jsonify({
+            'threshold_ms': current_app.config.get('SLOW_QUERY_MS', 0),
+            'slow_queries': entries,
+            'count': len(entries)
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
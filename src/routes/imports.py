@@ -0,0 +1,37 @@
+from flask import Blueprint, request, jsonify, current_app
+from services.import_service import import_rows
+from services.jwt_service import token_required
+
+imports_bp = Blueprint('imports', __name__, url_prefix='/api/import')
+
+CONTENT_TYPES = {
+    'text/csv': 'csv',
+    'application/x-ndjson': 'ndjson',
+    'application/ndjson': 'ndjson',
+    'application/jsonl': 'ndjson',
+}
+
+
+@imports_bp.route('/<entity>', methods=['POST'])
+@token_required
+def import_entity(current_admin, entity):
+    """Create or update departments, teachers, courses or rooms from a CSV or NDJSON upload."""
+    try:
+        file_format = request.args.get('format') or CONTENT_TYPES.get(request.mimetype)
+        if not file_format:
+            return jsonify({'error': 'Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson'}), 415
+
+        # The body is read line by line, never buffered as a whole
+        result, errors = import_rows(
+            entity, request.stream, file_format,
+            batch_size=current_app.config.get('IMPORT_BATCH_SIZE', 500)
+        )
+
+        if errors:
+            status_code = 404 if errors[0].startswith('Unknown import') else 400
+            return jsonify({'error': 'Import failed; nothing was written', 'errors': errors}), status_code
+
+        return jsonify({'message': 'Import completed successfully', **result}), 200
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,14 @@
+from flask import Blueprint, Response, current_app, jsonify
+from services.metrics_service import render_metrics
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Expose metrics in the Prometheus text format."""
+    if not current_app.config.get('METRICS_ENABLED', True):
+        return jsonify({'error': 'Metrics are disabled'}), 404
+
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
@@ -1,4 +1,5 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+import json
 from services.slot_service import (
     get_all_slots,
     get_slot_by_id,
@@ -7,6 +8,7 @@ from services.slot_service import (
     delete_slot,
     check_conflicts,
     bulk_create_slots,
+    ingest_slots,
     serialize_slot
 )
 from services.jwt_service import token_required
@@ -239,3 +241,25 @@ def bulk_create_slots_route(current_admin, timetable_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+
+
+@slots_bp.route('/ingest', methods=['POST'])
+@token_required
+def ingest_slots_route(current_admin, timetable_id):
+    """Create slots from an NDJSON upload, streaming back one result line per chunk."""
+    try:
+        chunk_size = request.args.get('chunk_size', 500, type=int)
+        if chunk_size < 1 or chunk_size > 5000:
+            return jsonify({'error': 'chunk_size must be between 1 and 5000'}), 400
+
+        # The body is parsed line by line while the results are streamed back
+        results, error = ingest_slots(timetable_id, request.stream, chunk_size)
+
+        if error:
+            return jsonify({'error': error}), 404
+
+        lines = (json.dumps(result) + '\n' for result in results)
+        return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
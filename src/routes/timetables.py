@@ -7,7 +7,10 @@ from services.timetable_service import (
     delete_timetable,
     publish_timetable,
     archive_timetable,
+    bulk_set_status,
     clone_timetable,
+    preview_clone,
+    rollover_timetables,
     get_timetable_stats,
     serialize_timetable
 )
@@ -195,6 +198,50 @@ def archive_timetable_route(current_admin, timetable_id):
         return jsonify({'error': str(e)}), 500
 
 
+def _bulk_status_response(status):
+    data = request.get_json() or {}
+    result, error = bulk_set_status(
+        status,
+        timetable_ids=data.get('ids'),
+        department_id=data.get('department_id'),
+        semester=data.get('semester'),
+        academic_year=data.get('academic_year')
+    )
+
+    if error:
+        if error.startswith('Error'):
+            status_code = 500
+        elif 'not found' in error.lower():
+            status_code = 404
+        else:
+            status_code = 400
+        return jsonify({'error': error}), status_code
+
+    return jsonify(result), 200
+
+
+@timetables_bp.route('/bulk/publish', methods=['PUT'])
+@token_required
+def bulk_publish_timetables_route(current_admin):
+    """Publish many timetables, selected by ids or filters."""
+    try:
+        return _bulk_status_response('published')
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@timetables_bp.route('/bulk/archive', methods=['PUT'])
+@token_required
+def bulk_archive_timetables_route(current_admin):
+    """Archive many timetables, selected by ids or filters."""
+    try:
+        return _bulk_status_response('archived')
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @timetables_bp.route('/<int:timetable_id>/clone', methods=['POST'])
 @token_required
 def clone_timetable_route(current_admin, timetable_id):
@@ -202,10 +249,27 @@ def clone_timetable_route(current_admin, timetable_id):
     try:
         data = request.get_json()
 
+        if data.get('dry_run'):
+            report, error = preview_clone(
+                timetable_id=timetable_id,
+                name=data.get('name'),
+                academic_year=data.get('academic_year'),
+                semester=data.get('semester'),
+                room_map=data.get('room_map'),
+                time_offset_minutes=data.get('time_offset_minutes', 0),
+                day_map=data.get('day_map')
+            )
+
+            if error:
+                status_code = 404 if 'not found' in error.lower() else 400
+                return jsonify({'error': error}), status_code
+
+            return jsonify({'dry_run': True, **report}), 200
+
         if not data.get('name'):
             return jsonify({'error': 'name is required for cloned timetable'}), 400
 
-        new_timetable, error = clone_timetable(
+        new_timetable, error, slots_cloned = clone_timetable(
             timetable_id=timetable_id,
             name=data['name'],
             week_start=data.get('week_start'),
@@ -214,23 +278,63 @@ def clone_timetable_route(current_admin, timetable_id):
             academic_year=data.get('academic_year'),
             semester=data.get('semester'),
             created_by=current_admin.id,
-            level_id=data.get('level_id')
+            level_id=data.get('level_id'),
+            room_map=data.get('room_map'),
+            time_offset_minutes=data.get('time_offset_minutes', 0),
+            day_map=data.get('day_map')
         )
 
         if error:
             status_code = 404 if 'not found' in error.lower() else 400
             return jsonify({'error': error}), status_code
 
+        # The copied slots are only loaded when asked for; otherwise
+        # slots_count comes from the INSERT ... SELECT row count
+        include_slots = request.args.get('include_slots', 'false').lower() == 'true'
+
         return jsonify({
             'message': 'Timetable cloned successfully',
             'original_id': timetable_id,
-            'timetable': serialize_timetable(new_timetable, include_slots=True)
+            'slots_cloned': slots_cloned,
+            'timetable': serialize_timetable(new_timetable, include_slots=include_slots, slots_count=slots_cloned)
         }), 201
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+@timetables_bp.route('/rollover', methods=['POST'])
+@token_required
+def rollover_timetables_route(current_admin):
+    """Clone every timetable of one term into another."""
+    try:
+        data = request.get_json()
+
+        required_fields = ['source_semester', 'source_academic_year', 'target_semester', 'target_academic_year']
+        for field in required_fields:
+            if not data.get(field):
+                return jsonify({'error': f'{field} is required'}), 400
+
+        report, error = rollover_timetables(
+            source_semester=data['source_semester'],
+            source_academic_year=data['source_academic_year'],
+            target_semester=data['target_semester'],
+            target_academic_year=data['target_academic_year'],
+            department_id=data.get('department_id'),
+            level_id=data.get('level_id'),
+            created_by=current_admin.id
+        )
+
+        if error:
+            status_code = 404 if 'no timetables found' in error.lower() else 400
+            return jsonify({'error': error}), status_code
+
+        return jsonify({'message': 'Timetables rolled over successfully', **report}), 201
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @timetables_bp.route('/<int:timetable_id>/stats', methods=['GET'])
 def get_timetable_stats_route(timetable_id):
     """Get statistics for a specific timetable."""
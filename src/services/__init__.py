@@ -2,21 +2,39 @@
 Services package
 """
 from . import jwt_service
+from . import password_service
+from . import rate_limit_service
+from . import query_timing_service
+from . import metrics_service
+from . import slow_query_service
+from . import nplusone_service
 from . import level_service
 from . import department_service
 from . import teacher_service
 from . import course_service
 from . import room_service
+from . import conflict_service
 from . import timetable_service
 from . import slot_service
+from . import import_service
+from . import async_read_service
 
 __all__ = [
     'jwt_service',
+    'password_service',
+    'rate_limit_service',
+    'query_timing_service',
+    'metrics_service',
+    'slow_query_service',
+    'nplusone_service',
     'level_service',
     'department_service',
     'teacher_service',
     'course_service',
     'room_service',
+    'conflict_service',
     'timetable_service',
-    'slot_service'
+    'slot_service',
+    'import_service',
+    'async_read_service'
 ]
\ No newline at end of file
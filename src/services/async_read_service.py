@@ -0,0 +1,216 @@
+"""
+Async read service for the high-concurrency schedule endpoints
+
+Mirrors the read paths of the timetable, slot, room and teacher services on
+the asyncio engine. Lazy loading is not available on an AsyncSession, so
+every query eager-loads exactly what the shared serializers touch. Independent
+queries run concurrently, each in its own session.
+"""
+import asyncio
+from sqlalchemy import select
+from sqlalchemy.orm import configure_mappers, joinedload, selectinload
+from config.async_db import async_session
+from models.timetable import TimeTable, TimeTableSlot
+from models.course import Course
+from models.classroom import Room
+from models.teacher import Teacher
+from services.timetable_service import serialize_timetable, build_timetable_stats
+from services.slot_service import serialize_slot
+from services.teacher_service import serialize_schedule_slot
+
+
+def _slot_options():
+    """Loader options for serialize_slot / serialize_schedule_slot."""
+    # Course.level is a backref; make sure it exists before referencing it
+    configure_mappers()
+    return (
+        joinedload(TimeTableSlot.timetable),
+        joinedload(TimeTableSlot.room),
+        joinedload(TimeTableSlot.course).joinedload(Course.teacher),
+        joinedload(TimeTableSlot.course).joinedload(Course.level),
+    )
+
+
+def _timetable_options():
+    """Loader options for serialize_timetable(include_slots=True) and build_timetable_stats."""
+    return (
+        joinedload(TimeTable.department),
+        joinedload(TimeTable.level),
+        joinedload(TimeTable.creator),
+        selectinload(TimeTable.slots).options(
+            joinedload(TimeTableSlot.room),
+            joinedload(TimeTableSlot.course).joinedload(Course.teacher),
+        ),
+    )
+
+
+async def _scalar(statement):
+    async with async_session() as session:
+        return (await session.execute(statement)).unique().scalar_one_or_none()
+
+
+async def _scalars(statement):
+    async with async_session() as session:
+        return (await session.execute(statement)).unique().scalars().all()
+
+
+async def fetch_timetable(timetable_id, include_slots=True, include_stats=False):
+    """
+    Get a serialized timetable.
+
+    Args:
+        timetable_id: The ID of the timetable
+        include_slots: Boolean to include slots in response
+        include_stats: Boolean to add the statistics from get_timetable_stats
+
+    Returns:
+        Dictionary representation of the timetable, or None if not found
+    """
+    timetable = await _scalar(
+        select(TimeTable).options(*_timetable_options()).where(TimeTable.id == timetable_id)
+    )
+    if not timetable:
+        return None
+
+    data = serialize_timetable(timetable, include_slots=include_slots)
+    if include_stats:
+        data['stats'] = build_timetable_stats(timetable)['statistics']
+    return data
+
+
+async def fetch_slots(timetable_id, course_id=None, room_id=None, day_of_week=None):
+    """
+    Get serialized slots of a timetable with optional filtering.
+
+    Args:
+        timetable_id: The ID of the timetable
+        course_id: Optional filter by course
+        room_id: Optional filter by room
+        day_of_week: Optional filter by day (0-6)
+
+    Returns:
+        List of serialized slots ordered by day and start time
+    """
+    query = select(TimeTableSlot).options(*_slot_options()).where(TimeTableSlot.timetable_id == timetable_id)
+
+    if course_id:
+        query = query.where(TimeTableSlot.course_id == course_id)
+
+    if room_id:
+        query = query.where(TimeTableSlot.room_id == room_id)
+
+    if day_of_week is not None:
+        query = query.where(TimeTableSlot.day_of_week == day_of_week)
+
+    slots = await _scalars(query.order_by(TimeTableSlot.day_of_week, TimeTableSlot.start_time))
+    return [serialize_slot(slot) for slot in slots]
+
+
+async def _fetch_room_slots(room_ids, timetable_id=None):
+    query = select(TimeTableSlot).options(*_slot_options()).where(TimeTableSlot.room_id.in_(room_ids))
+
+    if timetable_id:
+        query = query.where(TimeTableSlot.timetable_id == timetable_id)
+
+    return await _scalars(query.order_by(TimeTableSlot.day_of_week, TimeTableSlot.start_time))
+
+
+async def fetch_room_schedule(room_id, timetable_id=None):
+    """
+    Get a room and its schedule; both queries run concurrently.
+
+    Args:
+        room_id: The ID of the room
+        timetable_id: Optional filter by timetable
+
+    Returns:
+        Dictionary with 'room' and 'schedule', or None if the room is not found
+    """
+    room, slots = await asyncio.gather(
+        _scalar(select(Room).where(Room.id == room_id)),
+        _fetch_room_slots([room_id], timetable_id)
+    )
+    if not room:
+        return None
+
+    return {
+        'room': {
+            'id': room.id,
+            'name': room.name,
+            'room_type': room.room_type,
+            'capacity': room.capacity
+        },
+        'schedule': [serialize_slot(slot) for slot in slots]
+    }
+
+
+async def _fetch_teacher_slots(teacher_ids):
+    return await _scalars(
+        select(TimeTableSlot)
+        .options(*_slot_options())
+        .join(Course)
+        .where(Course.teacher_id.in_(teacher_ids))
+        .order_by(TimeTableSlot.day_of_week, TimeTableSlot.start_time)
+    )
+
+
+async def fetch_teacher_schedule(teacher_id):
+    """
+    Get a teacher's schedule; the teacher lookup and slot query run concurrently.
+
+    Args:
+        teacher_id: The ID of the teacher
+
+    Returns:
+        List of serialized schedule entries, or None if the teacher is not found
+    """
+    teacher, slots = await asyncio.gather(
+        _scalar(select(Teacher).where(Teacher.id == teacher_id)),
+        _fetch_teacher_slots([teacher_id])
+    )
+    if not teacher:
+        return None
+
+    return [serialize_schedule_slot(slot) for slot in slots]
+
+
+async def fetch_timetable_dashboard(timetable_id):
+    """
+    Get a timetable with its statistics plus the full schedules of the rooms
+    and teachers it uses, fetched concurrently.
+
+    Args:
+        timetable_id: The ID of the timetable
+
+    Returns:
+        Dictionary with 'timetable', 'room_schedules' and 'teacher_schedules'
+        (keyed by room/teacher ID), or None if the timetable is not found
+    """
+    room_ids = select(TimeTableSlot.room_id).where(TimeTableSlot.timetable_id == timetable_id)
+    teacher_ids = (
+        select(Course.teacher_id)
+        .join(TimeTableSlot, TimeTableSlot.course_id == Course.id)
+        .where(TimeTableSlot.timetable_id == timetable_id, Course.teacher_id.isnot(None))
+    )
+
+    timetable, room_slots, teacher_slots = await asyncio.gather(
+        fetch_timetable(timetable_id, include_slots=True, include_stats=True),
+        _fetch_room_slots(room_ids),
+        _fetch_teacher_slots(teacher_ids)
+    )
+    if not timetable:
+        return None
+
+    room_schedules = {}
+    for slot in room_slots:
+        room_schedules.setdefault(slot.room_id, []).append(serialize_slot(slot))
+
+    teacher_schedules = {}
+    for slot in teacher_slots:
+        teacher_schedules.setdefault(slot.course.teacher_id, []).append(serialize_schedule_slot(slot))
+
+    return {
+        'timetable': timetable,
+        'room_schedules': room_schedules,
+        'teacher_schedules': teacher_schedules
+    }
@@ -0,0 +1,188 @@
+"""
+Conflict service: in-memory room and teacher bookings for one term
+
+ConflictDetector answers "is this room (or teacher) free on this day
+between these times" without a query per probe. Each (day, room) and
+(day, teacher) schedule keeps a bitmask of booked minutes for the yes/no
+answer and a start-sorted list of bookings, searched with bisect, to
+name the conflicting slot. Conflicts only exist within one semester and
+academic year, so use one detector per term.
+"""
+from bisect import bisect_left, insort
+from collections import namedtuple
+from itertools import count
+from models.timetable import TimeTableSlot, TimeTable
+from models.course import Course
+from config.db import db
+
+
+# A booking found in conflict; details holds whatever was passed to add_slot
+Booking = namedtuple('Booking', ['slot_id', 'start_time', 'end_time', 'details'])
+
+
+def to_minutes(value):
+    """Minutes since midnight of a datetime.time."""
+    return value.hour * 60 + value.minute
+
+
+def _minute_mask(start, end):
+    return ((1 << (end - start)) - 1) << start
+
+
+class _Schedule:
+    """Bookings of one room or teacher on one day."""
+
+    __slots__ = ('mask', 'entries', 'longest')
+
+    def __init__(self):
+        self.mask = 0
+        self.entries = []  # (start, end, sequence, booking), sorted by start
+        self.longest = 0
+
+    def add(self, start, end, sequence, booking):
+        insort(self.entries, (start, end, sequence, booking))
+        self.mask |= _minute_mask(start, end)
+        self.longest = max(self.longest, end - start)
+
+    def remove(self, sequence):
+        self.entries = [entry for entry in self.entries if entry[2] != sequence]
+        self.mask = 0
+        for start, end, _, _ in self.entries:
+            self.mask |= _minute_mask(start, end)
+
+    def find(self, start, end, exclude_slot_id=None):
+        if not self.mask & _minute_mask(start, end):
+            return None
+        # Entries before index start before `end`; walk back until none can still reach `start`
+        index = bisect_left(self.entries, (end,))
+        while index > 0:
+            index -= 1
+            entry_start, entry_end, _, booking = self.entries[index]
+            if entry_start + self.longest <= start:
+                break
+            if entry_end > start and (exclude_slot_id is None or booking.slot_id != exclude_slot_id):
+                return booking
+        return None
+
+
+class ConflictDetector:
+    """
+    Room and teacher bookings of one term.
+
+    Probes cost a bitmask test plus, on a hit, a bisect into the bookings
+    of that room or teacher for that day, instead of scanning them all.
+    """
+
+    def __init__(self):
+        self._rooms = {}  # (day, room_id) -> _Schedule
+        self._teachers = {}  # (day, teacher_id) -> _Schedule
+        self._slots = {}  # slot_id -> (sequence, room key, teacher key)
+        self._sequence = count()
+
+    def __len__(self):
+        return len(self._slots)
+
+    @staticmethod
+    def _find(schedules, key, start_time, end_time, exclude_slot_id):
+        schedule = schedules.get(key)
+        if schedule is None:
+            return None
+        return schedule.find(to_minutes(start_time), to_minutes(end_time), exclude_slot_id)
+
+    def room_conflict(self, room_id, day, start_time, end_time, exclude_slot_id=None):
+        """
+        Find a booking of the room overlapping the given time.
+
+        Args:
+            room_id: Room ID
+            day: Day of week (0-6)
+            start_time: datetime.time
+            end_time: datetime.time
+            exclude_slot_id: Optional slot to ignore (the slot being moved)
+
+        Returns:
+            Booking or None
+        """
+        return self._find(self._rooms, (day, room_id), start_time, end_time, exclude_slot_id)
+
+    def teacher_conflict(self, teacher_id, day, start_time, end_time, exclude_slot_id=None):
+        """
+        Find a booking of the teacher overlapping the given time.
+
+        Returns:
+            Booking or None (always None without a teacher)
+        """
+        if teacher_id is None:
+            return None
+        return self._find(self._teachers, (day, teacher_id), start_time, end_time, exclude_slot_id)
+
+    def add_slot(self, slot_id, day, start_time, end_time, room_id, teacher_id=None, **details):
+        """
+        Book a room (and teacher, if any) for a slot.
+
+        Args:
+            slot_id: Slot ID, or any unique key for slots not stored yet
+            day: Day of week (0-6)
+            start_time: datetime.time
+            end_time: datetime.time
+            room_id: Room ID
+            teacher_id: Optional teacher ID
+            **details: Kept on the Booking returned by conflict lookups
+        """
+        start, end = to_minutes(start_time), to_minutes(end_time)
+        sequence = next(self._sequence)
+        booking = Booking(slot_id, start_time, end_time, details)
+
+        room_key = (day, room_id)
+        self._rooms.setdefault(room_key, _Schedule()).add(start, end, sequence, booking)
+        teacher_key = None
+        if teacher_id is not None:
+            teacher_key = (day, teacher_id)
+            self._teachers.setdefault(teacher_key, _Schedule()).add(start, end, sequence, booking)
+        self._slots[slot_id] = (sequence, room_key, teacher_key)
+
+    def remove_slot(self, slot_id):
+        """Release the bookings of a slot added earlier; unknown slots are ignored."""
+        sequence, room_key, teacher_key = self._slots.pop(slot_id, (None, None, None))
+        if sequence is None:
+            return
+        self._rooms[room_key].remove(sequence)
+        if teacher_key is not None:
+            self._teachers[teacher_key].remove(sequence)
+
+
+def load_term_detector(semester, academic_year, room_ids=None, teacher_ids=None):
+    """
+    Build a ConflictDetector holding the slots of a term.
+
+    Pass room_ids and teacher_ids to load only the slots that can clash
+    with a known set of new slots: those in one of the rooms or taught by
+    one of the teachers. Without them every slot of the term is loaded.
+
+    Args:
+        semester: Timetable semester (e.g. "Fall")
+        academic_year: Timetable academic year (e.g. "2024-2025")
+        room_ids: Optional rooms to load bookings for
+        teacher_ids: Optional teachers to load bookings for
+
+    Returns:
+        ConflictDetector whose bookings carry the timetable_name detail
+    """
+    detector = ConflictDetector()
+    rows = db.session.query(
+        TimeTableSlot.id, TimeTableSlot.day_of_week, TimeTableSlot.start_time, TimeTableSlot.end_time,
+        TimeTableSlot.room_id, Course.teacher_id, TimeTable.name
+    ).join(Course, Course.id == TimeTableSlot.course_id).join(
+        TimeTable, TimeTable.id == TimeTableSlot.timetable_id
+    ).filter(
+        TimeTable.semester == semester,
+        TimeTable.academic_year == academic_year
+    )
+    if room_ids is not None or teacher_ids is not None:
+        rows = rows.filter(db.or_(
+            TimeTableSlot.room_id.in_(set(room_ids or ())),
+            Course.teacher_id.in_(set(teacher_ids or ()) - {None})
+        ))
+    for slot_id, day, start_time, end_time, room_id, teacher_id, timetable_name in rows:
+        detector.add_slot(slot_id, day, start_time, end_time, room_id, teacher_id, timetable_name=timetable_name)
+    return detector
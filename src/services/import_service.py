@@ -0,0 +1,350 @@
+"""
+Import service: bulk upsert of reference data from CSV or NDJSON
+
+Rows are read from the upload stream one line at a time and handled in
+batches: each batch is validated, its foreign keys are resolved by
+natural key (department code, teacher email, level code) with one query
+per key type, and it is written with a single
+INSERT ... ON CONFLICT (<natural key>) DO UPDATE. The whole import is
+one transaction; if any row is invalid nothing is kept.
+"""
+import csv
+import json
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from models.department import Department
+from models.teacher import Teacher
+from models.course import Course
+from models.classroom import Room
+from models.level import Level
+from config.db import db
+from services.room_service import VALID_ROOM_TYPES
+
+
+# Errors reported before an import stops reading the upload
+MAX_ERRORS = 100
+
+FORMATS = ('csv', 'ndjson')
+
+
+class _RowError(ValueError):
+    pass
+
+
+def _text(column, required=False):
+    max_length = column.type.length
+
+    def parse(value):
+        if value is None or (isinstance(value, str) and not value.strip()):
+            if required:
+                raise _RowError('is required')
+            return None
+        value = str(value).strip()
+        if max_length and len(value) > max_length:
+            raise _RowError(f'must be at most {max_length} characters')
+        return value
+    return parse
+
+
+def _integer(required=False, positive=False):
+    def parse(value):
+        if value is None or value == '':
+            if required:
+                raise _RowError('is required')
+            return None
+        if isinstance(value, bool):
+            raise _RowError('must be an integer')
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise _RowError('must be an integer')
+        if positive and value <= 0:
+            raise _RowError('must be a positive integer')
+        return value
+    return parse
+
+
+def _boolean(value):
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ('true', '1', 'yes'):
+        return True
+    if text in ('false', '0', 'no'):
+        return False
+    raise _RowError('must be true or false')
+
+
+def _choice(choices):
+    def parse(value):
+        if value not in choices:
+            raise _RowError(f"must be one of: {', '.join(choices)}")
+        return value
+    return parse
+
+
+class _Importer:
+    """
+    How one entity is imported.
+
+    fields maps upload columns to parsers; references maps a column
+    holding a natural key (e.g. department_code) to the model, key
+    column and id column it resolves to.
+    """
+
+    def __init__(self, model, key, fields, references=None, defaults=None):
+        self.model = model
+        self.key = key
+        self.fields = fields
+        self.references = references or {}
+        self.defaults = defaults or {}
+
+
+IMPORTERS = {
+    'departments': _Importer(Department, 'code', {
+        'code': _text(Department.code, required=True),
+        'name': _text(Department.name, required=True),
+        'head': _text(Department.head),
+        'contact_email': _text(Department.contact_email),
+    }),
+    'teachers': _Importer(Teacher, 'email', {
+        'email': _text(Teacher.email, required=True),
+        'name': _text(Teacher.name, required=True),
+        'department_code': _text(Department.code, required=True),
+        'phone': _text(Teacher.phone),
+        'specialization': _text(Teacher.specialization),
+        'is_active': _boolean,
+    }, references={
+        'department_code': (Department, Department.code, 'department_id'),
+    }, defaults={'is_active': True}),
+    'courses': _Importer(Course, 'code', {
+        'code': _text(Course.code, required=True),
+        'name': _text(Course.name, required=True),
+        'department_code': _text(Department.code, required=True),
+        'teacher_email': _text(Teacher.email),
+        'level_code': _text(Level.code),
+        'weekly_sessions': _integer(positive=True),
+        'semester': _text(Course.semester),
+        'year': _integer(),
+        'is_active': _boolean,
+    }, references={
+        'department_code': (Department, Department.code, 'department_id'),
+        'teacher_email': (Teacher, Teacher.email, 'teacher_id'),
+        'level_code': (Level, Level.code, 'level_id'),
+    }, defaults={'weekly_sessions': 1, 'is_active': True}),
+    'rooms': _Importer(Room, 'name', {
+        'name': _text(Room.name, required=True),
+        'room_type': _choice(VALID_ROOM_TYPES),
+        'capacity': _integer(required=True, positive=True),
+        'is_available': _boolean,
+    }, defaults={'is_available': True}),
+}
+
+
+def read_records(stream, file_format):
+    """
+    Yield (line number, dict or error message) from an upload stream without buffering it.
+
+    Args:
+        stream: Binary file-like object (e.g. request.stream)
+        file_format: 'csv' (with a header row) or 'ndjson'
+    """
+    lines = (line.decode('utf-8-sig') for line in stream)
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        for record in reader:
+            if None in record:
+                yield reader.line_num, 'more values than columns'
+            elif any(value for value in record.values()):
+                yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_number, 'invalid JSON'
+            continue
+        if not isinstance(record, dict):
+            yield line_number, 'each line must be a JSON object'
+            continue
+        yield line_number, record
+
+
+def _parse_record(importer, record):
+    unknown = sorted(set(record) - set(importer.fields))
+    if unknown:
+        raise _RowError(f"unknown field '{unknown[0]}'")
+    row = {}
+    for field, value in record.items():
+        try:
+            value = importer.fields[field](value)
+        except _RowError as e:
+            raise _RowError(f'{field} {e}')
+        # A blank value for a field with a default counts as not given
+        if value is not None or field not in importer.defaults:
+            row[field] = value
+    for field, parse in importer.fields.items():
+        if field not in row:
+            try:
+                parse(None)
+            except _RowError as e:
+                raise _RowError(f'{field} {e}')
+    return row
+
+
+def _upsert_statement(model, key, update_columns):
+    # Executed with a list of rows: the statement is compiled once and
+    # SQLAlchemy batches the rows into multi-row VALUES itself
+    dialect = db.session.get_bind(mapper=model.__mapper__).dialect.name
+    if dialect == 'postgresql':
+        insert = postgresql.insert
+    elif dialect == 'sqlite':
+        insert = sqlite.insert
+    else:
+        raise NotImplementedError(f'Imports are not supported on {dialect}')
+    statement = insert(model.__table__)
+    return statement.on_conflict_do_update(
+        index_elements=[key],
+        set_={column: statement.excluded[column] for column in update_columns}
+    )
+
+
+class _Batch:
+    """Resolves, validates and writes one batch of parsed rows."""
+
+    def __init__(self, importer, lookups):
+        self.importer = importer
+        self.lookups = lookups  # reference column -> {natural key: (id, department_id)}
+
+    def _resolve(self, rows):
+        for column, (model, key_column, _) in self.importer.references.items():
+            cache = self.lookups.setdefault(column, {})
+            wanted = {row[column] for _, row in rows if row.get(column) and row[column] not in cache}
+            if wanted:
+                department = getattr(model, 'department_id', None)
+                columns = [key_column, model.id] + ([department] if department is not None else [])
+                for found in db.session.execute(select(*columns).where(key_column.in_(wanted))):
+                    cache[found[0]] = (found[1], found[2] if len(found) > 2 else None)
+
+    def write(self, rows, errors):
+        """
+        Write rows as (line number, parsed row); append failures to errors.
+
+        Returns:
+            Tuple of (inserted count, updated count)
+        """
+        importer = self.importer
+        self._resolve(rows)
+
+        # Later rows win over earlier ones with the same key
+        ready = {}
+        for line_number, row in rows:
+            values = {}
+            try:
+                for field, value in row.items():
+                    if field in importer.references:
+                        if value is None:
+                            values[importer.references[field][2]] = None
+                            continue
+                        model, _, id_column = importer.references[field]
+                        found = self.lookups[field].get(value)
+                        if found is None:
+                            raise _RowError(f"{field} '{value}': {model.__name__} not found")
+                        values[id_column] = found[0]
+                    else:
+                        values[field] = value
+                teacher = self.lookups.get('teacher_email', {}).get(row.get('teacher_email'))
+                if teacher and teacher[1] != values.get('department_id'):
+                    raise _RowError('Teacher must belong to the same department')
+            except _RowError as e:
+                errors.append(f'Line {line_number}: {e}')
+                continue
+            ready[values[importer.key]] = values
+
+        if errors or not ready:
+            return 0, 0
+
+        key_column = getattr(importer.model, importer.key)
+        existing = set(db.session.execute(select(key_column).where(key_column.in_(ready))).scalars())
+
+        # One statement per set of provided columns; columns a row leaves out
+        # get their defaults on insert and are kept on update
+        now = datetime.utcnow()
+        groups = {}
+        for values in ready.values():
+            groups.setdefault(tuple(sorted(values)), []).append(values)
+        for provided, group in groups.items():
+            inserts = [{**importer.defaults, **values, 'created_at': now, 'updated_at': now} for values in group]
+            update_columns = [column for column in provided if column != importer.key] + ['updated_at']
+            db.session.execute(_upsert_statement(importer.model, importer.key, update_columns), inserts)
+
+        return len(ready) - len(existing), len(existing)
+
+
+def import_rows(entity, stream, file_format, batch_size=500):
+    """
+    Upsert departments, teachers, courses or rooms from an upload stream.
+
+    Args:
+        entity: 'departments', 'teachers', 'courses' or 'rooms'
+        stream: Binary file-like object with the upload
+        file_format: 'csv' or 'ndjson'
+        batch_size: Rows per INSERT ... ON CONFLICT statement
+
+    Returns:
+        Tuple of (result dictionary, list of errors)
+        If any row is invalid, nothing is written and the errors are returned
+    """
+    importer = IMPORTERS.get(entity)
+    if importer is None:
+        return None, [f"Unknown import '{entity}'. Must be one of: {', '.join(IMPORTERS)}"]
+    if file_format not in FORMATS:
+        return None, [f"Unsupported format. Must be one of: {', '.join(FORMATS)}"]
+
+    batch = _Batch(importer, {})
+    errors = []
+    rows = []
+    counts = {'rows': 0, 'inserted': 0, 'updated': 0}
+
+    def flush():
+        inserted, updated = batch.write(rows, errors)
+        counts['inserted'] += inserted
+        counts['updated'] += updated
+        rows.clear()
+
+    try:
+        try:
+            for line_number, record in read_records(stream, file_format):
+                counts['rows'] += 1
+                try:
+                    if isinstance(record, str):
+                        raise _RowError(record)
+                    rows.append((line_number, _parse_record(importer, record)))
+                except _RowError as e:
+                    errors.append(f'Line {line_number}: {e}')
+                if len(rows) >= batch_size:
+                    flush()
+                if len(errors) >= MAX_ERRORS:
+                    errors.append(f'Stopped after {MAX_ERRORS} errors')
+                    break
+            else:
+                flush()
+        except UnicodeDecodeError:
+            errors.append('Upload must be UTF-8 encoded')
+
+        if errors:
+            db.session.rollback()
+            return None, errors
+
+        db.session.commit()
+        return {'entity': entity, **counts}, []
+
+    except Exception as e:
+        db.session.rollback()
+        return None, [f'Error importing {entity}: {str(e)}']
@@ -1,22 +1,201 @@
 import jwt
+import hashlib
+import inspect
+import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from functools import wraps
 from flask import jsonify, current_app, request
+from prometheus_client import Counter
+from sqlalchemy import update
 
-def generate_token(admin_id, expires_in_hours=24):
+
+class TokenAdmin:
+    """
+    Admin identity rebuilt from verified token claims.
+
+    Protected routes receive this instead of an Admin row, so authenticating
+    a request needs no database access. Routes that need the full record
+    (email, password hash, timestamps) load it explicitly.
     """
-    Generate a JWT token for a given admin user ID.
+    __slots__ = ('id', 'role', 'is_active', 'token_version')
+
+    def __init__(self, id, role, is_active=True, token_version=0):
+        self.id = id
+        self.role = role
+        self.is_active = is_active
+        self.token_version = token_version
+
+    @classmethod
+    def from_payload(cls, payload):
+        return cls(
+            id=payload['admin_id'],
+            role=payload.get('role', 'admin'),
+            is_active=payload.get('is_active', True),
+            token_version=payload.get('ver', 0)
+        )
+
+    def __repr__(self):
+        return f'<TokenAdmin {self.id} ({self.role})>'
+
+
+class _RevocationList:
+    """
+    In-memory view of revoked admin tokens.
+
+    Holds only admins whose tokens have been revoked at least once
+    (token_version > 0) or who are disabled, mapped to the minimum token
+    version still accepted. Admins absent from the map are trusted, so new
+    accounts work immediately. The map is reloaded from the admin table
+    every JWT_REVOCATION_REFRESH_SECONDS, or on the next check after
+    invalidate() is called by a route that changed an admin's status.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._min_versions = {}
+        self._loaded_at = None
+
+    def invalidate(self):
+        """Force a reload on the next check (used after local changes)."""
+        with self._lock:
+            self._loaded_at = None
+
+    def is_revoked(self, payload):
+        self._refresh_if_stale()
+        min_version = self._min_versions.get(payload.get('admin_id'))
+        if min_version is None:
+            return False
+        return payload.get('ver', 0) < min_version
+
+    def _refresh_if_stale(self):
+        interval = current_app.config.get('JWT_REVOCATION_REFRESH_SECONDS', 30)
+        now = time.monotonic()
+        loaded_at = self._loaded_at
+        if loaded_at is not None and now - loaded_at < interval:
+            return
+
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            if self._loaded_at is not None and now - self._loaded_at < interval:
+                return
+
+            from models.admin import Admin
+            from config.db import db
+            rows = db.session.query(Admin.id, Admin.token_version, Admin.is_active).filter(
+                db.or_(Admin.token_version > 0, Admin.is_active.is_(False))
+            ).all()
+
+            self._min_versions = {
+                admin_id: (version or 0) if is_active else float('inf')
+                for admin_id, version, is_active in rows
+            }
+            self._loaded_at = time.monotonic()
+
+
+revocation_list = _RevocationList()
+
+
+TOKEN_CACHE_LOOKUPS = Counter(
+    'jwt_token_cache_lookups_total',
+    'Verified-token cache lookups by result (hit, miss)',
+    ['result']
+)
+
+
+class _TokenCache:
+    """
+    Bounded LRUs of decoded token payloads, keyed by a SHA-256 digest of the raw token.
+
+    Valid tokens are cached until their own `exp`; tokens that fail
+    verification are cached as invalid for JWT_NEGATIVE_CACHE_SECONDS so that
+    floods of garbage tokens cost one hash lookup instead of an HMAC check.
+    Invalid tokens live in their own, smaller LRU so that such a flood can
+    never evict the valid entries. Revocation is checked separately on every
+    request, so caching a payload never extends the life of a revoked token.
+    """
+
+    MISS = object()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._valid = OrderedDict()    # digest -> (payload, expires_at)
+        self._invalid = OrderedDict()  # digest -> (None, expires_at)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def get(self, token):
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            entries = self._valid if key in self._valid else self._invalid
+            entry = entries.get(key)
+            if entry is None:
+                self.misses += 1
+                TOKEN_CACHE_LOOKUPS.labels('miss').inc()
+                return self.MISS
+            payload, expires_at = entry
+            if now >= expires_at:
+                del entries[key]
+                self.misses += 1
+                TOKEN_CACHE_LOOKUPS.labels('miss').inc()
+                return self.MISS
+            entries.move_to_end(key)
+            self.hits += 1
+            TOKEN_CACHE_LOOKUPS.labels('hit').inc()
+            return payload
+
+    def put(self, token, payload, expires_at, max_size):
+        """Cache a payload (None for an invalid token) in the matching LRU of at most max_size entries."""
+        if max_size <= 0:
+            return
+        key = self._key(token)
+        entries = self._invalid if payload is None else self._valid
+        with self._lock:
+            entries[key] = (payload, expires_at)
+            entries.move_to_end(key)
+            while len(entries) > max_size:
+                entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._valid.clear()
+            self._invalid.clear()
+
+
+token_cache = _TokenCache()
+
+
+def generate_token(admin, expires_in_minutes=None):
+    """
+    Generate a short-lived JWT access token for a given admin user.
+
+    The token embeds the admin's role, status and token version so that
+    protected routes can authorize requests without loading the admin.
+    Long sessions are kept alive with refresh tokens (see issue_refresh_token).
 
     Args:
-        admin_id (int): The ID of the admin user.
-        expires_in_hours (int): Token expiration time in hours. Default is 24 hours.
+        admin (Admin): The admin user.
+        expires_in_minutes (int): Token lifetime in minutes. Defaults to JWT_ACCESS_TOKEN_MINUTES.
 
     Returns:
         str: The generated JWT token.
     """
+    if expires_in_minutes is None:
+        expires_in_minutes = current_app.config.get('JWT_ACCESS_TOKEN_MINUTES', 15)
+
     payload = {
-        'admin_id': admin_id,
-        'exp': datetime.now(timezone.utc) + timedelta(hours=expires_in_hours),
+        'admin_id': admin.id,
+        'role': admin.role,
+        'is_active': admin.is_active,
+        'ver': admin.token_version or 0,
+        'exp': datetime.now(timezone.utc) + timedelta(minutes=expires_in_minutes),
         'iat': datetime.now(timezone.utc),
         'type': 'access'
     }
@@ -33,106 +212,274 @@ def decode_token(token):
     """
     Decode and validate a JWT token.
 
+    Results are served from the verified-token cache when possible; the
+    returned payload is shared and must not be modified.
+
     Args:
         token (str): The JWT token to decode.
 
     Returns:
         dict or None: The decoded token payload if valid, None if invalid/expired.
     """
+    cached = token_cache.get(token)
+    if cached is not token_cache.MISS:
+        return cached
+
     try:
         payload = jwt.decode(
             token,
             current_app.config['SECRET_KEY'],
             algorithms=['HS256']
         )
-        return payload
     except jwt.ExpiredSignatureError:
-        return None  # Token has expired
+        payload = None  # Token has expired
     except jwt.InvalidTokenError:
-        return None  # Invalid token
+        payload = None  # Invalid token
+
+    if payload is None:
+        negative_ttl = current_app.config.get('JWT_NEGATIVE_CACHE_SECONDS', 5)
+        negative_size = current_app.config.get('JWT_NEGATIVE_CACHE_SIZE', 256)
+        token_cache.put(token, None, time.time() + negative_ttl, negative_size)
+    elif 'exp' in payload:
+        token_cache.put(token, payload, payload['exp'], current_app.config.get('JWT_CACHE_SIZE', 1024))
 
+    return payload
 
-def refresh_token(token, additional_hours=24):
+
+def _hash_refresh_token(raw_token):
+    return hashlib.sha256(raw_token.encode('utf-8')).hexdigest()
+
+
+def issue_refresh_token(admin):
     """
-    Refresh a JWT token by extending its expiration time.
+    Create and store a new refresh token for an admin.
+
+    Only the SHA-256 digest is persisted; the raw token is returned once.
 
     Args:
-        token (str): The JWT token to refresh.
-        additional_hours (int): Additional hours to extend the token's validity. Default is 24 hours.
+        admin (Admin): The admin user.
 
     Returns:
-        str or None: The refreshed JWT token if successful, None if invalid/expired.
+        str: The raw refresh token to hand to the client.
     """
-    payload = decode_token(token)
+    from models.refresh_token import RefreshToken
+    from config.db import db
 
-    if not payload:
-        return None  # Invalid or expired token
+    raw_token = secrets.token_urlsafe(48)
+    lifetime = timedelta(days=current_app.config.get('JWT_REFRESH_TOKEN_DAYS', 14))
 
-    # Create new payload with extended expiration
-    new_payload = {
-        'admin_id': payload.get('admin_id'),
-        'exp': datetime.now(timezone.utc) + timedelta(hours=additional_hours),
-        'iat': datetime.now(timezone.utc),
-        'type': 'access'
+    db.session.add(RefreshToken(
+        admin_id=admin.id,
+        token_hash=_hash_refresh_token(raw_token),
+        expires_at=datetime.utcnow() + lifetime
+    ))
+    db.session.commit()
+
+    return raw_token
+
+
+def generate_token_pair(admin):
+    """
+    Issue an access token and a refresh token for an admin.
+
+    Args:
+        admin (Admin): The admin user.
+
+    Returns:
+        dict: token, refresh_token and expires_in (access token lifetime in seconds).
+    """
+    access_minutes = current_app.config.get('JWT_ACCESS_TOKEN_MINUTES', 15)
+    return {
+        'token': generate_token(admin, expires_in_minutes=access_minutes),
+        'refresh_token': issue_refresh_token(admin),
+        'expires_in': access_minutes * 60
     }
 
-    refreshed_token = jwt.encode(
-        new_payload,
-        current_app.config['SECRET_KEY'],
-        algorithm='HS256'
-    )
 
-    return refreshed_token
+def rotate_refresh_token(raw_token):
+    """
+    Exchange a refresh token for a new access/refresh token pair.
+
+    This is the only place where session validity is checked against the
+    database. The presented token is revoked and replaced (rotation) with a
+    single conditional UPDATE, so of two concurrent refreshes with the same
+    token only one wins. If an already-revoked token is presented, the token
+    has most likely leaked: every refresh token of that admin is revoked and
+    their token version is bumped, which also ends outstanding access tokens.
+
+    Args:
+        raw_token (str): The refresh token presented by the client.
+
+    Returns:
+        Tuple of (token pair dict, error_message)
+        If successful, error_message is None
+    """
+    from models.refresh_token import RefreshToken
+    from models.admin import Admin
+    from config.db import db
+
+    try:
+        token_hash = _hash_refresh_token(raw_token)
+        now = datetime.utcnow()
+
+        claimed = db.session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now
+            )
+            .values(revoked_at=now)
+            .returning(RefreshToken.admin_id)
+        ).scalar_one_or_none()
+
+        if claimed is None:
+            db.session.rollback()
+            stored = RefreshToken.query.filter_by(token_hash=token_hash).first()
+            if not stored:
+                return None, "Invalid refresh token"
+            if stored.revoked_at is not None:
+                _revoke_reused_refresh_token(stored.admin_id)
+                return None, "Refresh token has been revoked"
+            return None, "Refresh token has expired"
+
+        admin = db.session.get(Admin, claimed)
+        if not admin or not getattr(admin, 'is_active', True):
+            db.session.rollback()
+            return None, "Admin account is disabled"
+
+        pair = generate_token_pair(admin)
+
+        return pair, None
+
+    except Exception as e:
+        db.session.rollback()
+        return None, f"Error refreshing token: {str(e)}"
+
+
+def _revoke_reused_refresh_token(admin_id):
+    """End every session of an admin whose revoked refresh token was presented again."""
+    from models.admin import Admin
+    from config.db import db
+
+    admin = db.session.get(Admin, admin_id)
+    if admin:
+        admin.revoke_tokens()
+    revoke_all_refresh_tokens(admin_id)
+    revocation_list.invalidate()
+
+
+def revoke_refresh_token(raw_token):
+    """
+    Revoke a single refresh token (logout).
+
+    Args:
+        raw_token (str): The refresh token presented by the client.
+
+    Returns:
+        bool: True if a usable token was revoked.
+    """
+    from models.refresh_token import RefreshToken
+    from config.db import db
+
+    stored = RefreshToken.query.filter_by(token_hash=_hash_refresh_token(raw_token)).first()
+    if not stored or stored.revoked_at is not None:
+        return False
+
+    stored.revoked_at = datetime.utcnow()
+    db.session.commit()
+    return True
+
+
+def revoke_all_refresh_tokens(admin_id):
+    """
+    Revoke every outstanding refresh token of an admin.
+
+    Args:
+        admin_id (int): The admin whose sessions are ended.
+
+    Returns:
+        int: Number of tokens revoked.
+    """
+    from models.refresh_token import RefreshToken
+    from config.db import db
+
+    count = RefreshToken.query.filter(
+        RefreshToken.admin_id == admin_id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({'revoked_at': datetime.utcnow()}, synchronize_session=False)
+    db.session.commit()
+    return count
 
 def token_required(f):
     """
     Decorator to protect routes with JWT authentication.
 
+    The wrapped view receives a TokenAdmin built from the token claims;
+    no database lookup happens per request.
+
     Usage:
         @app.route('/protected')
         @token_required
         def protected_route(current_admin):
-            return jsonify({'message': f'Hello {current_admin.username}'})
+            return jsonify({'message': f'Hello admin {current_admin.id}'})
+
+    Async views are supported and stay coroutines after wrapping.
     """
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def async_decorated(*args, **kwargs):
+            current_admin, error_response = _authenticate_request()
+            if error_response:
+                return error_response
+            return await f(current_admin, *args, **kwargs)
+
+        return async_decorated
+
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
+        current_admin, error_response = _authenticate_request()
+        if error_response:
+            return error_response
+        return f(current_admin, *args, **kwargs)
 
-        # Check for token in Authorization header
-        if 'Authorization' in request.headers:
-            auth_header = request.headers['Authorization']
+    return decorated
 
-            try:
-                # Expect format: "Bearer <token>"
-                token = auth_header.split(" ")[1]
-            except IndexError:
-                return jsonify({'message': 'Invalid token format. Use: Bearer <token>'}), 401
 
-        if not token:
-            return jsonify({'message': 'Token is missing!'}), 401
+def _authenticate_request():
+    """Return (TokenAdmin, None), or (None, error response) if the request is not authenticated."""
+    token = None
+
+    # Check for token in Authorization header
+    if 'Authorization' in request.headers:
+        auth_header = request.headers['Authorization']
 
-        # Decode and validate token
-        payload = decode_token(token)
+        try:
+            # Expect format: "Bearer <token>"
+            token = auth_header.split(" ")[1]
+        except IndexError:
+            return None, (jsonify({'message': 'Invalid token format. Use: Bearer <token>'}), 401)
 
-        if not payload:
-            return jsonify({'message': 'Token is invalid!'}), 401
+    if not token:
+        return None, (jsonify({'message': 'Token is missing!'}), 401)
 
-        # Import Admin here to avoid circular imports
-        from models.admin import Admin
-        current_admin = Admin.query.filter_by(id=payload['admin_id']).first()
+    # Decode and validate token
+    payload = decode_token(token)
 
-        if not current_admin:
-            return jsonify({'message': "Admin user not found!"}), 401
+    if not payload or 'admin_id' not in payload:
+        return None, (jsonify({'message': 'Token is invalid!'}), 401)
 
-        return f(current_admin, *args, **kwargs)
+    # Trust the verified claims; only the revocation list is consulted
+    if revocation_list.is_revoked(payload):
+        return None, (jsonify({'message': 'Token has been revoked!'}), 401)
 
-    return decorated
+    return TokenAdmin.from_payload(payload), None
 
 
 def optional_token(f):
     """
     Decorator that allows both authenticated and unauthenticated access.
-    If token is present and valid, current_admin is provided, else None.
+    If token is present and valid, current_admin (a TokenAdmin) is provided, else None.
     """
     @wraps(f)
     def decorated(*args, **kwargs):
@@ -146,10 +493,8 @@ def optional_token(f):
                 token = auth_header.split(" ")[1]
                 payload = decode_token(token)
 
-                if payload:
-                    # Import Admin here to avoid circular imports
-                    from models.admin import Admin
-                    current_admin = Admin.query.filter_by(id=payload["admin_id"]).first()
+                if payload and not revocation_list.is_revoked(payload):
+                    current_admin = TokenAdmin.from_payload(payload)
             except (IndexError, KeyError):
                 # If there's any error with token parsing, just continue with None user
                 pass
@@ -192,7 +537,7 @@ def get_current_admin_from_token():
 
     payload = decode_token(token)
 
-    if not payload:
+    if not payload or revocation_list.is_revoked(payload):
         return None
 
     # Import Admin here to avoid circular imports
@@ -0,0 +1,117 @@
+"""
+Metrics service: Prometheus request, pool and cache metrics plus /metrics rendering
+
+With gunicorn, set PROMETHEUS_MULTIPROC_DIR (before the app is imported)
+so every worker writes its samples to that directory and /metrics
+aggregates them; gunicorn.conf.py cleans it up as workers exit.
+"""
+import os
+import time
+from flask import g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Gauge, Histogram, generate_latest
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from config.db import db
+
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'Request latency by blueprint and endpoint',
+    ['method', 'blueprint', 'endpoint', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'Requests currently being handled',
+    multiprocess_mode='livesum'
+)
+
+POOL_CHECKED_OUT = Gauge(
+    'db_pool_connections_checked_out',
+    'Connections currently checked out of the pool',
+    ['bind'],
+    multiprocess_mode='livesum'
+)
+
+# Set once at startup (before gunicorn forks), so report it per worker
+POOL_CAPACITY = Gauge(
+    'db_pool_connections_max',
+    "Maximum connections one worker's pool may open (pool size + overflow)",
+    ['bind'],
+    multiprocess_mode='max'
+)
+
+
+def _start_request():
+    g.metrics_started_at = time.perf_counter()
+    REQUESTS_IN_FLIGHT.inc()
+
+
+def _observe_request(response):
+    started_at = g.get('metrics_started_at')
+    if started_at is not None:
+        REQUEST_LATENCY.labels(
+            request.method,
+            request.blueprint or '',
+            request.endpoint or 'unmatched',
+            str(response.status_code)
+        ).observe(time.perf_counter() - started_at)
+    return response
+
+
+def _finish_request(exception=None):
+    if g.pop('metrics_started_at', None) is not None:
+        REQUESTS_IN_FLIGHT.dec()
+
+
+def _instrument_pool(engine, bind):
+    checked_out = POOL_CHECKED_OUT.labels(bind)
+
+    @event.listens_for(engine, 'checkout')
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_out.inc()
+
+    @event.listens_for(engine, 'checkin')
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out.dec()
+
+    size = getattr(engine.pool, 'size', None)
+    if callable(size):
+        POOL_CAPACITY.labels(bind).set(size() + max(engine.pool._max_overflow, 0))
+
+
+def render_metrics():
+    """
+    Render all metrics in the Prometheus text format.
+
+    Returns:
+        Tuple of (body, content type)
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def init_metrics(app):
+    """
+    Register request metrics and pool instrumentation when METRICS_ENABLED is set.
+
+    Must be registered before any before_request hook that can
+    short-circuit a request (rate limiting) so every request is counted.
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    app.before_request(_start_request)
+    app.after_request(_observe_request)
+    app.teardown_request(_finish_request)
+
+    with app.app_context():
+        for bind, engine in db.engines.items():
+            _instrument_pool(engine, bind or 'default')
@@ -0,0 +1,104 @@
+"""
+N+1 query detector: flags statements repeated within one request
+
+Meant for development and tests (NPLUSONE_DETECTION=warn or raise). Lazy
+relationship loads are grouped by relationship; any other ORM statement
+(including dynamic relationships such as Level.courses.count()) by its SQL.
+"""
+import logging
+import sys
+from collections import Counter
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+APP_PACKAGES = ('services.', 'routes.', 'models.', 'config.')
+MODES = ('off', 'warn', 'raise')
+
+
+class NPlusOneError(Exception):
+    """Raised for repeated queries in raise mode and for lazy loads on strict endpoints."""
+
+
+def _call_site():
+    """Return "module.function:line" of the innermost application frame, or None."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith(APP_PACKAGES) and module != __name__:
+            return f"{module}.{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+def _relationship_name(orm_execute_state):
+    path = orm_execute_state.loader_strategy_path
+    if path is None or not len(path):
+        return None
+    return str(path[-1])
+
+
+def _report(message):
+    if current_app.config.get('NPLUSONE_DETECTION') == 'raise':
+        raise NPlusOneError(message)
+    logger.warning(message)
+
+
+def _on_orm_execute(orm_execute_state):
+    if not has_request_context():
+        return
+
+    relationship = _relationship_name(orm_execute_state) if orm_execute_state.is_relationship_load else None
+
+    if relationship and request.endpoint in current_app.config.get('NPLUSONE_STRICT_ENDPOINTS', ()):
+        raise NPlusOneError(
+            f"Lazy load of {relationship} in strict endpoint {request.endpoint} at {_call_site()}; "
+            f"eager-load it with selectinload/joinedload"
+        )
+
+    counts = g.get('nplusone_counts')
+    if counts is None:
+        return
+
+    if relationship:
+        key = f"lazy load of {relationship}"
+    else:
+        key = f"statement {str(orm_execute_state.statement)!r}"
+
+    counts[key] += 1
+    # Report each shape once per request, when it first crosses the threshold
+    if counts[key] == current_app.config.get('NPLUSONE_THRESHOLD', 5) + 1:
+        _report(
+            f"Possible N+1 in {request.endpoint}: {key} ran more than "
+            f"{counts[key] - 1} times, last from {_call_site()}"
+        )
+
+
+def _start_request():
+    g.nplusone_counts = Counter()
+
+
+def init_nplusone_detection(app):
+    """
+    Register the N+1 detector and strict endpoints.
+
+    With NPLUSONE_DETECTION set to 'warn' or 'raise', a statement shape
+    executed more than NPLUSONE_THRESHOLD times in one request is logged
+    ('warn') or raises NPlusOneError ('raise') with the relationship and
+    the call site. Endpoints listed in
+    NPLUSONE_STRICT_ENDPOINTS reject every lazy relationship load that
+    needs SQL, like lazy='raise' on all relationships.
+    """
+    mode = app.config.get('NPLUSONE_DETECTION', 'off')
+    if mode not in MODES:
+        raise ValueError(f"NPLUSONE_DETECTION must be one of {', '.join(MODES)}")
+    if mode == 'off' and not app.config.get('NPLUSONE_STRICT_ENDPOINTS'):
+        return
+
+    if not event.contains(Session, 'do_orm_execute', _on_orm_execute):
+        event.listen(Session, 'do_orm_execute', _on_orm_execute)
+
+    if mode != 'off':
+        app.before_request(_start_request)
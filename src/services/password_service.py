@@ -0,0 +1,87 @@
+"""
+Password service for hashing work done off the request threads
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+_lock = threading.Lock()
+_executor = None
+_slots = None
+_pid = None
+
+
+def _get_pool():
+    """
+    Return the process-wide hashing pool, creating it on first use.
+
+    The pool is rebuilt after a fork (gunicorn workers) since threads are
+    not inherited. Capacity is PASSWORD_HASH_WORKERS running jobs plus
+    PASSWORD_HASH_QUEUE waiting ones.
+    """
+    global _executor, _slots, _pid
+
+    if _executor is not None and _pid == os.getpid():
+        return _executor, _slots
+
+    with _lock:
+        if _executor is None or _pid != os.getpid():
+            workers = current_app.config.get('PASSWORD_HASH_WORKERS') or min(4, os.cpu_count() or 1)
+            queue = current_app.config.get('PASSWORD_HASH_QUEUE', 32)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+            _slots = threading.BoundedSemaphore(workers + queue)
+            _pid = os.getpid()
+
+    return _executor, _slots
+
+
+def _run_bounded(fn, *args):
+    """
+    Run a hashing function in the bounded pool.
+
+    Returns:
+        Tuple of (result, error_message)
+        If the pool is saturated, the job is rejected instead of queued.
+    """
+    executor, slots = _get_pool()
+
+    if not slots.acquire(blocking=False):
+        return None, "Too many password operations in progress, please retry"
+
+    try:
+        return executor.submit(fn, *args).result(), None
+    finally:
+        slots.release()
+
+
+def verify_password(password_hash, password):
+    """
+    Check a password against a stored hash in the hashing pool.
+
+    Args:
+        password_hash: Stored werkzeug password hash
+        password: Plain text password to check
+
+    Returns:
+        Tuple of (matches: bool, error_message)
+        If successful, error_message is None
+    """
+    return _run_bounded(check_password_hash, password_hash, password)
+
+
+def hash_password(password, method):
+    """
+    Hash a password in the hashing pool.
+
+    Args:
+        password: Plain text password
+        method: werkzeug hash method, e.g. 'scrypt:16384:8:1'
+
+    Returns:
+        Tuple of (password_hash, error_message)
+        If successful, error_message is None
+    """
+    return _run_bounded(generate_password_hash, password, method)
@@ -0,0 +1,107 @@
+"""
+Query timing service: per-request SQL query count, DB time and JSON
+serialization time, reported in Server-Timing and X-Query-Count headers
+"""
+import time
+from flask import g, has_request_context
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class RequestTimings:
+    """Counters for one request."""
+
+    __slots__ = ('started_at', 'query_count', 'db_seconds', 'serialize_seconds')
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.query_count = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+    def server_timing(self):
+        total_ms = (time.perf_counter() - self.started_at) * 1000
+        return ', '.join([
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.query_count} queries"',
+            f'serialize;dur={self.serialize_seconds * 1000:.2f}',
+            f'total;dur={total_ms:.2f}',
+        ])
+
+
+def current_timings():
+    """The RequestTimings of the current request, or None outside an instrumented request."""
+    if not has_request_context():
+        return None
+    return g.get('request_timings')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_timing_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('query_timing_start')
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    timings = current_timings()
+    if timings is not None:
+        timings.query_count += 1
+        timings.db_seconds += elapsed
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    connection = exception_context.connection
+    if connection is not None:
+        starts = connection.info.get('query_timing_start')
+        if starts:
+            starts.pop()
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """JSON provider that adds encoding time to the current request's timings."""
+
+    def dumps(self, obj, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            timings = current_timings()
+            if timings is not None:
+                timings.serialize_seconds += time.perf_counter() - start
+
+
+def _start_timing():
+    g.request_timings = RequestTimings()
+
+
+def _add_timing_headers(response):
+    timings = current_timings()
+    if timings is not None:
+        response.headers['X-Query-Count'] = str(timings.query_count)
+        response.headers.add('Server-Timing', timings.server_timing())
+    return response
+
+
+def init_query_timing(app):
+    """
+    Register per-request query timing on the app when QUERY_TIMING_ENABLED is set.
+
+    Listeners are attached to the Engine class, so the primary, replica and
+    async engines are all counted. The cost per query is two perf_counter
+    calls, which keeps the headers cheap enough to leave on in production.
+    Serialization time covers JSON encoding through app.json (jsonify).
+    """
+    if not app.config.get('QUERY_TIMING_ENABLED', False):
+        return
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+
+    app.json = TimedJSONProvider(app)
+    app.before_request(_start_timing)
+    app.after_request(_add_timing_headers)
@@ -0,0 +1,223 @@
+"""
+Rate limit service: token-bucket throttling applied before any view runs
+"""
+import math
+import threading
+import time
+from flask import current_app, jsonify, request
+
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Endpoint or blueprint name -> "<requests>/<seconds>"; merged with RATE_LIMITS from config
+DEFAULT_RULES = {
+    'auth.login': '10/60',
+    'auth.register': '5/60',
+    'auth.refresh': '30/60',
+    'slots.bulk_create_slots_route': '10/60',
+}
+
+
+def parse_rule(rule):
+    """
+    Parse a "<requests>/<seconds>" rule into (capacity, refill rate per second).
+
+    Returns None for "off" or an empty rule.
+    """
+    if not rule or rule.strip().lower() == 'off':
+        return None
+    requests_part, seconds_part = rule.split('/', 1)
+    capacity = float(requests_part)
+    seconds = float(seconds_part)
+    if capacity <= 0 or seconds <= 0:
+        raise ValueError(f"Invalid rate limit rule: {rule}")
+    return capacity, capacity / seconds
+
+
+def parse_rules(spec):
+    """Parse "name=rule,name=rule" (the RATE_LIMITS environment format) into a dict."""
+    rules = {}
+    for item in (spec or '').split(','):
+        if '=' in item:
+            name, rule = item.split('=', 1)
+            rules[name.strip()] = rule.strip()
+    return rules
+
+
+class MemoryBucketStore:
+    """
+    Per-process token buckets.
+
+    Buckets that have refilled completely are indistinguishable from new
+    ones, so they are swept periodically to keep memory bounded.
+    """
+
+    SWEEP_EVERY = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}  # key -> (tokens, updated_at, full_at)
+        self._operations = 0
+
+    def consume(self, keys, capacity, rate):
+        """
+        Take one token from every bucket in keys, or from none of them.
+
+        A request rejected by one bucket (e.g. the admin's) must not drain
+        the others (e.g. the IP's), so all buckets are checked first.
+
+        Returns:
+            Tuple of (allowed, seconds until every bucket has a token)
+        """
+        now = time.monotonic()
+        with self._lock:
+            levels = {}
+            for key in keys:
+                tokens, updated_at, _ = self._buckets.get(key, (capacity, now, now))
+                levels[key] = min(capacity, tokens + (now - updated_at) * rate)
+
+            retry_after = max((1 - tokens) / rate for tokens in levels.values())
+            allowed = retry_after <= 0
+            for key, tokens in levels.items():
+                if allowed:
+                    tokens -= 1
+                self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+
+            self._operations += 1
+            if self._operations % self.SWEEP_EVERY == 0:
+                self._buckets = {k: v for k, v in self._buckets.items() if v[2] > now}
+
+        return allowed, 0.0 if allowed else retry_after
+
+
+class RedisBucketStore:
+    """Token buckets shared by every worker through Redis (requires the redis package)."""
+
+    # All buckets are refilled and checked first; tokens are only taken
+    # when every bucket has one
+    _SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local levels = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local bucket = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+    if tokens < 1 then
+        retry_after = math.max(retry_after, (1 - tokens) / rate)
+    end
+    levels[i] = tokens
+end
+for i, key in ipairs(KEYS) do
+    local tokens = levels[i]
+    if retry_after == 0 then
+        tokens = tokens - 1
+    end
+    redis.call('HSET', key, 'tokens', tokens, 'updated_at', now)
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+end
+return tostring(retry_after)
+"""
+
+    def __init__(self, url):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_STORAGE_URL points to Redis but the 'redis' package is not installed")
+        self._client = redis.Redis.from_url(url)
+        self._consume = self._client.register_script(self._SCRIPT)
+
+    def consume(self, keys, capacity, rate):
+        """Take one token from every bucket in keys, or from none of them (see MemoryBucketStore)."""
+        retry_after = float(self._consume(keys=[f'ratelimit:{key}' for key in keys], args=[capacity, rate, time.time()]))
+        return retry_after == 0.0, retry_after
+
+
+def create_store(url):
+    """Build a bucket store from a storage URL ("memory://" or "redis://...")."""
+    if not url or url.startswith('memory://'):
+        return MemoryBucketStore()
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisBucketStore(url)
+    raise ValueError(f"Unsupported RATE_LIMIT_STORAGE_URL: {url}")
+
+
+def _resolve_rule(app_rules, endpoint, blueprint, method):
+    """Most specific rule wins: endpoint, then blueprint, then the default write rule."""
+    for name in (endpoint, blueprint):
+        if name and name in app_rules:
+            return name, app_rules[name]
+    if method not in SAFE_METHODS and app_rules.get('_write'):
+        return '_write', app_rules['_write']
+    return None, None
+
+
+def _admin_id_from_request():
+    """Admin id from a valid bearer token, or None (uses the verified-token cache)."""
+    auth_header = request.headers.get('Authorization', '')
+    if not auth_header.startswith('Bearer '):
+        return None
+    from services.jwt_service import decode_token
+    payload = decode_token(auth_header[7:])
+    return payload.get('admin_id') if payload else None
+
+
+def _check_rate_limit():
+    if request.method == 'OPTIONS':
+        return None  # CORS preflights never reach a view
+
+    state = current_app.extensions['rate_limit']
+    name, rule = _resolve_rule(state['rules'], request.endpoint, request.blueprint, request.method)
+    if rule is None:
+        return None
+
+    capacity, rate = rule
+    # remote_addr is the client address once ProxyFix has applied TRUSTED_PROXY_COUNT
+    keys = [f'{name}:ip:{request.remote_addr}']
+    admin_id = _admin_id_from_request()
+    if admin_id is not None:
+        keys.append(f'{name}:admin:{admin_id}')
+
+    allowed, retry_after = state['store'].consume(keys, capacity, rate)
+
+    if not allowed:
+        response = jsonify({'error': 'Too many requests, please slow down'})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+        return response
+
+    return None
+
+
+def init_rate_limiting(app):
+    """
+    Register the rate limiter on the app.
+
+    Rules come from DEFAULT_RULES overridden by RATE_LIMITS (a dict or a
+    "name=requests/seconds,..." string). Names are endpoints
+    ("auth.login") or blueprints ("slots"); "_write" applies to every
+    non-GET request without a more specific rule. Each request consumes
+    one token from a per-IP bucket and, when authenticated, a per-admin
+    bucket; a request rejected by either consumes from neither.
+    """
+    if not app.config.get('RATE_LIMIT_ENABLED', True):
+        return
+
+    configured = app.config.get('RATE_LIMITS') or {}
+    if isinstance(configured, str):
+        configured = parse_rules(configured)
+
+    rules = {}
+    for name, rule in {**DEFAULT_RULES, **configured}.items():
+        parsed = parse_rule(rule)
+        if parsed:
+            rules[name] = parsed
+
+    app.extensions['rate_limit'] = {
+        'rules': rules,
+        'store': create_store(app.config.get('RATE_LIMIT_STORAGE_URL'))
+    }
+    app.before_request(_check_rate_limit)
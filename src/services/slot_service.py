@@ -5,7 +5,19 @@ from models.timetable import TimeTableSlot, TimeTable
 from models.course import Course
 from models.classroom import Room
 from config.db import db
-from datetime import time
+from services.conflict_service import load_term_detector
+from services.import_service import MAX_ERRORS, read_records
+from collections import namedtuple
+from datetime import datetime, time
+from sqlalchemy import insert
+from prometheus_client import Counter
+
+
+CONFLICT_CHECKS = Counter(
+    'slot_conflict_checks_total',
+    'Slot conflict checks by caller (create, update, check, bulk, ingest) and outcome (clear, room, teacher, conflict)',
+    ['source', 'result']
+)
 
 
 def get_all_slots(timetable_id=None, course_id=None, room_id=None, day_of_week=None):
@@ -115,6 +127,7 @@ def create_slot(timetable_id, course_id, room_id, day_of_week, start_time_str, e
         ).first()
 
         if room_conflict:
+            CONFLICT_CHECKS.labels('create', 'room').inc()
             conflict_timetable = room_conflict.timetable.name if room_conflict.timetable else "Unknown"
             return None, f"Room conflict: {room.name} is already booked at this time in timetable '{conflict_timetable}' ({timetable_semester} {timetable_academic_year})"
 
@@ -130,9 +143,12 @@ def create_slot(timetable_id, course_id, room_id, day_of_week, start_time_str, e
             ).first()
 
             if teacher_conflict:
+                CONFLICT_CHECKS.labels('create', 'teacher').inc()
                 conflict_timetable = teacher_conflict.timetable.name if teacher_conflict.timetable else "Unknown"
                 return None, f"Teacher conflict: {course.teacher.name} is already scheduled at this time in timetable '{conflict_timetable}' ({timetable_semester} {timetable_academic_year})"
 
+        CONFLICT_CHECKS.labels('create', 'clear').inc()
+
         # Create new slot
         slot = TimeTableSlot(
             timetable_id=timetable_id,
@@ -228,11 +244,14 @@ def update_slot(slot_id, timetable_id=None, course_id=None, room_id=None, day_of
         timetable_semester = current_timetable.semester
         timetable_academic_year = current_timetable.academic_year
 
-        # Check for conflicts if time/room/day is being changed
-        final_room_id = room_id if room_id else slot.room_id
+        # Check for conflicts if time/room/day is being changed (day 0 is Monday, so test for None)
+        final_room_id = room_id if room_id is not None else slot.room_id
         final_day_of_week = day_of_week if day_of_week is not None else slot.day_of_week
+        time_changed = day_of_week is not None or start_time_str is not None or end_time_str is not None
+        conflicts_checked = False
 
-        if (room_id or day_of_week or start_time_str or end_time_str):
+        if room_id is not None or time_changed:
+            conflicts_checked = True
             # Check for room conflicts (excluding current slot) across timetables in the SAME semester and academic year
             room_conflict = TimeTableSlot.query.join(TimeTable).filter(
                 TimeTableSlot.id != slot_id,
@@ -245,15 +264,17 @@ def update_slot(slot_id, timetable_id=None, course_id=None, room_id=None, day_of
             ).first()
 
             if room_conflict:
+                CONFLICT_CHECKS.labels('update', 'room').inc()
                 room_obj = Room.query.get(final_room_id)
                 conflict_timetable = room_conflict.timetable.name if room_conflict.timetable else "Unknown"
                 return None, f"Room conflict: {room_obj.name} is already booked at this time in timetable '{conflict_timetable}' ({timetable_semester} {timetable_academic_year})"
 
         # Check for teacher conflicts if course is being changed
-        final_course_id = course_id if course_id else slot.course_id
-        if course_id or day_of_week or start_time_str or end_time_str:
+        final_course_id = course_id if course_id is not None else slot.course_id
+        if course_id is not None or time_changed:
             course_obj = Course.query.get(final_course_id)
             if course_obj and course_obj.teacher_id:
+                conflicts_checked = True
                 # Check for teacher conflicts across timetables in the SAME semester and academic year
                 teacher_conflict = TimeTableSlot.query.join(Course).join(TimeTable).filter(
                     TimeTableSlot.id != slot_id,
@@ -266,9 +287,13 @@ def update_slot(slot_id, timetable_id=None, course_id=None, room_id=None, day_of
                 ).first()
 
                 if teacher_conflict:
+                    CONFLICT_CHECKS.labels('update', 'teacher').inc()
                     conflict_timetable = teacher_conflict.timetable.name if teacher_conflict.timetable else "Unknown"
                     return None, f"Teacher conflict: {course_obj.teacher.name} is already scheduled at this time in timetable '{conflict_timetable}' ({timetable_semester} {timetable_academic_year})"
 
+        if conflicts_checked:
+            CONFLICT_CHECKS.labels('update', 'clear').inc()
+
         # Update fields
         if timetable_id:
             slot.timetable_id = timetable_id
@@ -431,15 +456,121 @@ def check_conflicts(course_id, room_id, day_of_week, start_time_str, end_time_st
                     }
                 })
 
+        CONFLICT_CHECKS.labels('check', 'conflict' if conflicts else 'clear').inc()
         return conflicts, None
 
     except Exception as e:
         return None, f"Error checking conflicts: {str(e)}"
 
 
+def _parse_id(value):
+    """An id given as an int or a string of digits, else None (booleans and floats are rejected)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isascii() and value.isdigit():
+        return int(value)
+    return None
+
+
+# Timetable fields ingest_slots needs after the session has been cleared
+_TimetableRef = namedtuple('_TimetableRef', ['id', 'name', 'semester', 'academic_year'])
+
+
+def _validate_new_slot(label, slot_data, courses, rooms, detector, timetable, source):
+    """
+    Check one slot of a batch and book it in the detector if it is valid.
+
+    Args:
+        label: Prefix of error messages (e.g. "Slot 3")
+        slot_data: Slot data dictionary
+        courses: {course id: Course} for the batch
+        rooms: {room id: Room} for the batch
+        detector: ConflictDetector of the timetable's term
+        timetable: Target TimeTable
+        source: CONFLICT_CHECKS source label
+
+    Returns:
+        Tuple of (slot column values, error_message)
+    """
+    if not isinstance(slot_data, dict):
+        return None, f'{label}: Each slot must be an object'
+    missing = [field for field in ('course_id', 'room_id', 'day_of_week', 'start_time', 'end_time')
+               if field not in slot_data]
+    if missing:
+        return None, f'{label}: {missing[0]} is required'
+
+    course_id = _parse_id(slot_data['course_id'])
+    room_id = _parse_id(slot_data['room_id'])
+    if course_id is None:
+        return None, f'{label}: course_id must be an integer'
+    if room_id is None:
+        return None, f'{label}: room_id must be an integer'
+
+    course = courses.get(course_id)
+    room = rooms.get(room_id)
+    day_of_week = slot_data['day_of_week']
+    if not course:
+        return None, f'{label}: Course not found'
+    if not room:
+        return None, f'{label}: Room not found'
+    if not isinstance(day_of_week, int) or day_of_week < 0 or day_of_week > 6:
+        return None, f'{label}: day_of_week must be an integer between 0 (Monday) and 6 (Sunday)'
+    try:
+        start_time = time.fromisoformat(slot_data['start_time'])
+        end_time = time.fromisoformat(slot_data['end_time'])
+    except (TypeError, ValueError):
+        return None, f'{label}: Invalid time format. Use HH:MM format.'
+    if start_time >= end_time:
+        return None, f'{label}: Start time must be before end time'
+    if not room.is_available:
+        return None, f'{label}: Room is not available'
+
+    term = f"{timetable.semester} {timetable.academic_year}"
+    room_conflict = detector.room_conflict(room.id, day_of_week, start_time, end_time)
+    if room_conflict:
+        CONFLICT_CHECKS.labels(source, 'room').inc()
+        return None, (f"{label}: Room conflict: {room.name} is already booked at this time in timetable "
+                      f"'{room_conflict.details['timetable_name']}' ({term})")
+    teacher_conflict = detector.teacher_conflict(course.teacher_id, day_of_week, start_time, end_time)
+    if teacher_conflict:
+        CONFLICT_CHECKS.labels(source, 'teacher').inc()
+        return None, (f"{label}: Teacher conflict: {course.teacher.name} is already scheduled at this time "
+                      f"in timetable '{teacher_conflict.details['timetable_name']}' ({term})")
+    CONFLICT_CHECKS.labels(source, 'clear').inc()
+
+    # Book it so later slots of the batch are checked against it too
+    detector.add_slot(('new', label), day_of_week, start_time, end_time, room.id, course.teacher_id,
+                      timetable_name=timetable.name)
+    return {
+        'timetable_id': timetable.id,
+        'course_id': course.id,
+        'room_id': room.id,
+        'day_of_week': day_of_week,
+        'start_time': start_time,
+        'end_time': end_time,
+        'notes': slot_data.get('notes')
+    }, None
+
+
+def _load_batch_refs(slots_data):
+    """Courses and rooms referenced by a batch, by id (one query each)."""
+    records = [data for data in slots_data if isinstance(data, dict)]
+    course_ids = {_parse_id(data.get('course_id')) for data in records} - {None}
+    room_ids = {_parse_id(data.get('room_id')) for data in records} - {None}
+    courses = {course.id: course for course in Course.query.filter(Course.id.in_(course_ids))}
+    rooms = {room.id: room for room in Room.query.filter(Room.id.in_(room_ids))}
+    return courses, rooms
+
+
 def bulk_create_slots(timetable_id, slots_data):
     """
-    Create multiple timetable slots at once.
+    Create multiple timetable slots at once, all or none.
+
+    The term's bookings are loaded into a ConflictDetector once, so each
+    slot is checked in memory, against the database and against the slots
+    before it in the batch. Nothing is written if any slot is invalid.
 
     Args:
         timetable_id: Timetable ID
@@ -448,42 +579,131 @@ def bulk_create_slots(timetable_id, slots_data):
     Returns:
         Tuple of (list of created slots, list of errors)
     """
-    created_slots = []
-    errors = []
+    try:
+        timetable = TimeTable.query.get(timetable_id)
+        if not timetable:
+            return [], ['Timetable not found']
 
-    for i, slot_data in enumerate(slots_data):
-        try:
-            # Validate required fields
-            required_fields = ['course_id', 'room_id', 'day_of_week', 'start_time', 'end_time']
-            for field in required_fields:
-                if field not in slot_data:
-                    errors.append(f'Slot {i+1}: {field} is required')
-                    break
-            else:
-                # All required fields present, try to create slot
-                slot, error = create_slot(
-                    timetable_id=timetable_id,
-                    course_id=slot_data['course_id'],
-                    room_id=slot_data['room_id'],
-                    day_of_week=slot_data['day_of_week'],
-                    start_time_str=slot_data['start_time'],
-                    end_time_str=slot_data['end_time'],
-                    notes=slot_data.get('notes')
-                )
+        courses, rooms = _load_batch_refs(slots_data)
+        # Only bookings of the batch's rooms and teachers can clash with it
+        detector = load_term_detector(
+            timetable.semester, timetable.academic_year,
+            room_ids=set(rooms), teacher_ids={course.teacher_id for course in courses.values()}
+        )
 
-                if error:
-                    errors.append(f'Slot {i+1}: {error}')
-                else:
-                    created_slots.append(slot)
-        except Exception as e:
-            errors.append(f'Slot {i+1}: {str(e)}')
+        new_slots = []
+        errors = []
+        for i, slot_data in enumerate(slots_data):
+            values, error = _validate_new_slot(f'Slot {i+1}', slot_data, courses, rooms, detector, timetable, 'bulk')
+            if error:
+                errors.append(error)
+                continue
+            new_slots.append(TimeTableSlot(**values))
 
-    if errors:
-        db.session.rollback()
-    else:
+        if errors:
+            return [], errors
+
+        db.session.add_all(new_slots)
         db.session.commit()
+        return new_slots, []
+
+    except Exception as e:
+        db.session.rollback()
+        return [], [f'Error creating slots: {str(e)}']
+
 
-    return created_slots, errors
+def ingest_slots(timetable_id, stream, chunk_size=500):
+    """
+    Create slots from an NDJSON stream, validating and inserting them in chunks.
+
+    Each chunk is all or nothing, like bulk_create_slots, and is committed
+    on its own; a rejected chunk does not stop the following ones. Only one
+    chunk of records is held at a time and the session is cleared after
+    each, so memory does not grow with the upload (the term's
+    ConflictDetector grows by one small booking per created slot).
+
+    Args:
+        timetable_id: Timetable ID
+        stream: Binary file-like object with one slot object per line
+        chunk_size: Records per chunk
+
+    Returns:
+        Tuple of (generator of per-chunk result dictionaries, error_message)
+        The generator ends with a summary ({"done": true, ...})
+    """
+    timetable = TimeTable.query.get(timetable_id)
+    if not timetable:
+        return None, "Timetable not found"
+    timetable = _TimetableRef(timetable.id, timetable.name, timetable.semester, timetable.academic_year)
+
+    def results():
+        detector = load_term_detector(timetable.semester, timetable.academic_year)
+        insert_slots = insert(TimeTableSlot.__table__)
+        summary = {'done': True, 'received': 0, 'created': 0, 'chunks': 0, 'failed_chunks': 0}
+
+        def process(chunk):
+            first_line, last_line = chunk[0][0], chunk[-1][0]
+            slots_data = [record for _, record in chunk]
+            courses, rooms = _load_batch_refs(slots_data)
+
+            rows, errors, booked = [], [], []
+            for line_number, record in chunk:
+                label = f'Line {line_number}'
+                if isinstance(record, str):
+                    errors.append(f'{label}: {record}')
+                    continue
+                values, error = _validate_new_slot(label, record, courses, rooms, detector, timetable, 'ingest')
+                if error:
+                    errors.append(error)
+                    continue
+                booked.append(('new', label))
+                rows.append(values)
+
+            created = 0
+            if errors:
+                for slot_key in booked:
+                    detector.remove_slot(slot_key)
+            elif rows:
+                # Python column defaults do not apply to Core executemany
+                now = datetime.utcnow()
+                try:
+                    db.session.execute(insert_slots, [{**row, 'created_at': now, 'updated_at': now} for row in rows])
+                    db.session.commit()
+                    created = len(rows)
+                except Exception as e:
+                    db.session.rollback()
+                    for slot_key in booked:
+                        detector.remove_slot(slot_key)
+                    errors.append(f'Error creating slots: {str(e)}')
+            db.session.expunge_all()
+
+            summary['chunks'] += 1
+            summary['received'] += len(chunk)
+            summary['created'] += created
+            summary['failed_chunks'] += 1 if errors else 0
+            return {
+                'chunk': summary['chunks'],
+                'first_line': first_line,
+                'last_line': last_line,
+                'created': created,
+                'error_count': len(errors),
+                'errors': errors[:MAX_ERRORS]
+            }
+
+        chunk = []
+        try:
+            for line_number, record in read_records(stream, 'ndjson'):
+                chunk.append((line_number, record))
+                if len(chunk) >= chunk_size:
+                    yield process(chunk)
+                    chunk = []
+            if chunk:
+                yield process(chunk)
+        except UnicodeDecodeError:
+            summary['error'] = 'Upload must be UTF-8 encoded'
+        yield summary
+
+    return results(), None
 
 
 def serialize_slot(slot):
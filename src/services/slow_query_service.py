@@ -0,0 +1,173 @@
+"""
+Slow query service: logs queries over SLOW_QUERY_MS with their route and
+service function, and optionally captures PostgreSQL plans with EXPLAIN
+"""
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+MAX_PARAMETERS_LENGTH = 500
+
+
+class SlowQueryLog:
+    """
+    Bounded, per-process record of slow queries.
+
+    Entries live in a ring buffer of the most recent slow queries. Each
+    statement shape (the SQL text with placeholders) is explained at most
+    once while it is remembered; its plan is attached to later entries.
+    """
+
+    def __init__(self, max_entries=100):
+        self._lock = threading.Lock()
+        self.entries = deque(maxlen=max_entries)
+        self._plans = OrderedDict()  # statement -> plan (or error) for explained shapes
+        self._max_plans = max_entries * 10
+
+    def record(self, entry):
+        with self._lock:
+            entry['plan'] = self._plans.get(entry['statement'])
+            self.entries.append(entry)
+
+    def needs_plan(self, statement):
+        with self._lock:
+            if statement in self._plans:
+                self._plans.move_to_end(statement)
+                return False
+            # Reserve the shape so concurrent requests do not explain it too
+            self._plans[statement] = None
+            while len(self._plans) > self._max_plans:
+                self._plans.popitem(last=False)
+            return True
+
+    def store_plan(self, statement, plan):
+        with self._lock:
+            self._plans[statement] = plan
+            for entry in self.entries:
+                if entry['statement'] == statement and entry['plan'] is None:
+                    entry['plan'] = plan
+
+    def snapshot(self):
+        with self._lock:
+            return list(reversed(self.entries))
+
+    def resize(self, max_entries):
+        with self._lock:
+            self.entries = deque(self.entries, maxlen=max_entries)
+            self._max_plans = max_entries * 10
+
+
+slow_query_log = SlowQueryLog()
+
+
+def _calling_service_function():
+    """Return "module.function" of the innermost services.* frame, or None."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith('services.') and module != __name__:
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def _format_parameters(parameters):
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        text = text[:MAX_PARAMETERS_LENGTH] + '...'
+    return text
+
+
+# Set by init_slow_query_log; the listeners are shared by every engine
+_settings = {'threshold_seconds': None, 'explain': False}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('slow_query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('slow_query_start')
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    if elapsed < _settings['threshold_seconds'] or conn.info.get('slow_query_explaining'):
+        return
+
+    entry = {
+        'recorded_at': datetime.now(timezone.utc).isoformat(),
+        'duration_ms': round(elapsed * 1000, 2),
+        'statement': statement,
+        'parameters': _format_parameters(parameters),
+        'endpoint': request.endpoint if has_request_context() else None,
+        'function': _calling_service_function(),
+    }
+    slow_query_log.record(entry)
+    logger.warning(
+        "Slow query (%.1f ms) in %s via %s: %s; parameters=%s",
+        entry['duration_ms'], entry['endpoint'], entry['function'], statement, entry['parameters']
+    )
+
+    # EXPLAIN runs after the request on its own connection (see _run_pending_explains)
+    if (_settings['explain'] and has_request_context() and not executemany
+            and conn.dialect.name == 'postgresql' and not conn.dialect.is_async
+            and slow_query_log.needs_plan(statement)):
+        g.setdefault('slow_query_explains', []).append((conn.engine, statement, parameters))
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None:
+        starts = connection.info.get('slow_query_start')
+        if starts:
+            starts.pop()
+
+
+def _run_pending_explains(exception=None):
+    for engine, statement, parameters in g.pop('slow_query_explains', []):
+        try:
+            with engine.connect() as connection:
+                connection.info['slow_query_explaining'] = True
+                try:
+                    result = connection.exec_driver_sql(
+                        'EXPLAIN (ANALYZE off, FORMAT JSON) ' + statement, parameters
+                    )
+                    plan = result.scalar()
+                finally:
+                    connection.info.pop('slow_query_explaining', None)
+        except Exception as e:
+            plan = {'error': f"EXPLAIN failed: {str(e)}"}
+        slow_query_log.store_plan(statement, plan)
+
+
+def init_slow_query_log(app):
+    """
+    Register the slow query log when SLOW_QUERY_MS is above zero.
+
+    Slow queries are logged and kept in slow_query_log (SLOW_QUERY_LOG_SIZE
+    entries per worker). With SLOW_QUERY_EXPLAIN, PostgreSQL plans are
+    captured after the response, on a separate connection, so the request
+    transaction is never affected.
+    """
+    threshold_ms = app.config.get('SLOW_QUERY_MS', 0)
+    if threshold_ms <= 0:
+        return
+
+    slow_query_log.resize(app.config.get('SLOW_QUERY_LOG_SIZE', 100))
+    _settings['threshold_seconds'] = threshold_ms / 1000
+    _settings['explain'] = app.config.get('SLOW_QUERY_EXPLAIN', False)
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+
+    app.teardown_request(_run_pending_explains)
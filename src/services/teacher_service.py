@@ -229,18 +229,30 @@ def serialize_teacher(teacher, include_courses=False, include_schedule=False):
 
     if include_schedule:
         slots = get_teacher_schedule(teacher.id)
-        data['schedule'] = [{
-            'id': slot.id,
-            'course_name': slot.course.name,
-            'course_code': slot.course.code,
-            'room_name': slot.room.name,
-            'day_of_week': slot.day_of_week,
-            'day_name': slot.day_name,
-            'start_time': slot.start_time.strftime('%H:%M'),
-            'end_time': slot.end_time.strftime('%H:%M'),
-            'notes': slot.notes,
-            'timetable_name': slot.timetable.name
-        } for slot in slots] if slots else []
+        data['schedule'] = [serialize_schedule_slot(slot) for slot in slots] if slots else []
 
     return data
 
+
+def serialize_schedule_slot(slot):
+    """
+    Serialize a slot for a teacher's schedule.
+
+    Args:
+        slot: TimeTableSlot object with course, room and timetable loaded
+
+    Returns:
+        Dictionary representation of the schedule entry
+    """
+    return {
+        'id': slot.id,
+        'course_name': slot.course.name,
+        'course_code': slot.course.code,
+        'room_name': slot.room.name,
+        'day_of_week': slot.day_of_week,
+        'day_name': slot.day_name,
+        'start_time': slot.start_time.strftime('%H:%M'),
+        'end_time': slot.end_time.strftime('%H:%M'),
+        'notes': slot.notes,
+        'timetable_name': slot.timetable.name
+    }
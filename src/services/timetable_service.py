@@ -4,8 +4,13 @@ Timetable service for business logic related to timetables
 from models.timetable import TimeTable, TimeTableSlot
 from models.department import Department
 from models.level import Level
+from models.course import Course
+from models.classroom import Room
 from config.db import db
-from datetime import datetime, date
+from services.conflict_service import load_term_detector, to_minutes
+from datetime import datetime, date, time
+import re
+from sqlalchemy import case, func, insert, literal, select, update
 
 
 VALID_STATUSES = ['draft', 'published', 'archived']
@@ -220,9 +225,11 @@ def delete_timetable(timetable_id):
             return False, "Timetable not found", None
 
         timetable_name = timetable.name
-        slots_count = len(timetable.slots)
+        slots_count = db.session.query(func.count(TimeTableSlot.id)).filter(
+            TimeTableSlot.timetable_id == timetable_id
+        ).scalar()
 
-        # The slots will be automatically deleted due to cascade='all, delete-orphan'
+        # The slots are not loaded; the database deletes them (ON DELETE CASCADE)
         db.session.delete(timetable)
         db.session.commit()
 
@@ -294,11 +301,283 @@ def archive_timetable(timetable_id):
         return None, f"Error archiving timetable: {str(e)}"
 
 
+def _parse_id_map(mapping, field, valid=None):
+    """
+    Turn a JSON object of id -> id (string keys allowed) into a dict of ints.
+
+    Returns:
+        Tuple of (dict, error_message)
+    """
+    if not mapping:
+        return {}, None
+    if not isinstance(mapping, dict):
+        return None, f"{field} must be an object mapping old ids to new ids"
+    try:
+        parsed = {int(key): int(value) for key, value in mapping.items()}
+    except (TypeError, ValueError):
+        return None, f"{field} keys and values must be integers"
+    if valid and any(value not in valid for value in parsed.values()):
+        return None, f"{field} values must be between {min(valid)} and {max(valid)}"
+    return parsed, None
+
+
+def _transformed_slots(timetable_id, room_map=None, time_offset_minutes=0, day_map=None):
+    """
+    Read a timetable's slots as plain rows with the clone transformations applied.
+
+    Args:
+        timetable_id: Source timetable ID
+        room_map: Optional {old room id: new room id}
+        time_offset_minutes: Minutes added to start and end times (may be negative)
+        day_map: Optional {old day: new day}
+
+    Returns:
+        Tuple of (list of slot dicts, error_message)
+        Each dict carries source_slot_id and teacher_id besides the slot columns
+    """
+    room_map, error = _parse_id_map(room_map, 'room_map')
+    if error:
+        return None, error
+    day_map, error = _parse_id_map(day_map, 'day_map', valid=range(7))
+    if error:
+        return None, error
+    if not isinstance(time_offset_minutes, int) or isinstance(time_offset_minutes, bool):
+        return None, "time_offset_minutes must be an integer"
+
+    if room_map:
+        found = {room_id for (room_id,) in db.session.query(Room.id).filter(Room.id.in_(room_map.values()))}
+        missing = sorted(set(room_map.values()) - found)
+        if missing:
+            return None, f"room_map refers to unknown room {missing[0]}"
+
+    rows = db.session.query(
+        TimeTableSlot.id, TimeTableSlot.course_id, TimeTableSlot.room_id, TimeTableSlot.day_of_week,
+        TimeTableSlot.start_time, TimeTableSlot.end_time, TimeTableSlot.notes, Course.teacher_id
+    ).join(Course, Course.id == TimeTableSlot.course_id).filter(
+        TimeTableSlot.timetable_id == timetable_id
+    ).order_by(TimeTableSlot.id)
+
+    slots = []
+    for slot_id, course_id, room_id, day_of_week, start_time, end_time, notes, teacher_id in rows:
+        start = to_minutes(start_time) + time_offset_minutes
+        end = to_minutes(end_time) + time_offset_minutes
+        if start < 0 or end >= 24 * 60:
+            return None, f"Slot {slot_id}: time_offset_minutes moves it outside the day"
+        slots.append({
+            'source_slot_id': slot_id,
+            'course_id': course_id,
+            'teacher_id': teacher_id,
+            'room_id': room_map.get(room_id, room_id),
+            'day_of_week': day_map.get(day_of_week, day_of_week),
+            'start_time': time(start // 60, start % 60),
+            'end_time': time(end // 60, end % 60),
+            'notes': notes
+        })
+    return slots, None
+
+
+def find_clone_conflicts(slots, semester, academic_year, timetable_name):
+    """
+    Check transformed slots against a term's bookings and against each other.
+
+    The term's bookings of the clone's rooms and teachers are loaded into
+    a ConflictDetector once, then every slot is probed in memory; all
+    clashes are reported, not just the first.
+
+    Args:
+        slots: Slot dicts from _transformed_slots
+        semester: Target semester
+        academic_year: Target academic year
+        timetable_name: Name reported for clashes between cloned slots
+
+    Returns:
+        List of conflict dictionaries
+    """
+    detector = load_term_detector(
+        semester, academic_year,
+        room_ids={slot['room_id'] for slot in slots},
+        teacher_ids={slot['teacher_id'] for slot in slots}
+    )
+    conflicts = []
+    for slot in slots:
+        args = (slot['day_of_week'], slot['start_time'], slot['end_time'])
+        for conflict_type, booking in (
+            ('room', detector.room_conflict(slot['room_id'], *args)),
+            ('teacher', detector.teacher_conflict(slot['teacher_id'], *args)),
+        ):
+            if booking:
+                cloned_from = booking.details.get('source_slot_id')
+                conflicts.append({
+                    'type': conflict_type,
+                    'source_slot_id': slot['source_slot_id'],
+                    'slot': {
+                        'course_id': slot['course_id'],
+                        'room_id': slot['room_id'],
+                        'day_of_week': slot['day_of_week'],
+                        'start_time': slot['start_time'].strftime('%H:%M'),
+                        'end_time': slot['end_time'].strftime('%H:%M')
+                    },
+                    'conflicting_slot': {
+                        'id': booking.slot_id if cloned_from is None else None,
+                        'cloned_from_slot_id': cloned_from,
+                        'start_time': booking.start_time.strftime('%H:%M'),
+                        'end_time': booking.end_time.strftime('%H:%M'),
+                        'timetable_name': booking.details['timetable_name']
+                    }
+                })
+        # Book it so later cloned slots are checked against it too
+        detector.add_slot(('clone', slot['source_slot_id']), *args, slot['room_id'], slot['teacher_id'],
+                          timetable_name=timetable_name, source_slot_id=slot['source_slot_id'])
+    return conflicts
+
+
+def preview_clone(timetable_id, name=None, academic_year=None, semester=None,
+                  room_map=None, time_offset_minutes=0, day_map=None):
+    """
+    Dry-run a clone: transform the slots and list every conflict in the target term.
+
+    Nothing is written.
+
+    Args:
+        timetable_id: The ID of the timetable to clone
+        name: Optional name of the clone, used for clashes between cloned slots
+        academic_year: Optional target academic year
+        semester: Optional target semester
+        room_map: Optional {old room id: new room id}
+        time_offset_minutes: Minutes added to start and end times
+        day_map: Optional {old day: new day}
+
+    Returns:
+        Tuple of (report dictionary, error_message)
+        If successful, error_message is None
+    """
+    try:
+        original = db.session.get(TimeTable, timetable_id)
+        if not original:
+            return None, "Timetable not found"
+
+        academic_year = academic_year or original.academic_year
+        semester = semester or original.semester
+        slots, error = _transformed_slots(timetable_id, room_map, time_offset_minutes, day_map)
+        if error:
+            return None, error
+
+        conflicts = find_clone_conflicts(slots, semester, academic_year, name or f"{original.name} (clone)")
+        return {
+            'source_timetable_id': timetable_id,
+            'semester': semester,
+            'academic_year': academic_year,
+            'slots': len(slots),
+            'conflicts': conflicts
+        }, None
+
+    except Exception as e:
+        return None, f"Error previewing clone: {str(e)}"
+
+
+def bulk_set_status(status, timetable_ids=None, department_id=None, semester=None, academic_year=None):
+    """
+    Publish or archive many timetables with a single UPDATE.
+
+    As with publish_timetable/archive_timetable, timetables already in
+    the target status are left alone; only the ones actually changed are
+    reported. Slots are not loaded.
+
+    Args:
+        status: 'published' or 'archived'
+        timetable_ids: Optional list of timetable IDs
+        department_id: Optional department filter
+        semester: Optional semester filter
+        academic_year: Optional academic year filter
+
+    Returns:
+        Tuple of (result dictionary, error_message)
+        If successful, error_message is None
+    """
+    if status not in ('published', 'archived'):
+        return None, "status must be 'published' or 'archived'"
+    if timetable_ids is None and not (department_id or semester or academic_year):
+        return None, "Provide ids or at least one of department_id, semester, academic_year"
+    if timetable_ids is not None:
+        if not isinstance(timetable_ids, list) or not timetable_ids:
+            return None, "ids must be a non-empty list of timetable IDs"
+        try:
+            timetable_ids = sorted({int(timetable_id) for timetable_id in timetable_ids})
+        except (TypeError, ValueError):
+            return None, "ids must be a non-empty list of timetable IDs"
+
+    try:
+        statement = update(TimeTable).where(TimeTable.status != status)
+        if timetable_ids is not None:
+            statement = statement.where(TimeTable.id.in_(timetable_ids))
+        if department_id:
+            statement = statement.where(TimeTable.department_id == department_id)
+        if semester:
+            statement = statement.where(TimeTable.semester == semester)
+        if academic_year:
+            statement = statement.where(TimeTable.academic_year == academic_year)
+        statement = statement.values(status=status, updated_at=datetime.utcnow()).returning(TimeTable.id)
+
+        updated_ids = sorted(db.session.execute(statement).scalars())
+        db.session.commit()
+
+        result = {
+            'status': status,
+            'updated_count': len(updated_ids),
+            'updated_ids': updated_ids
+        }
+        if timetable_ids is not None:
+            # Already in the target status, or not found
+            unchanged = sorted(set(timetable_ids) - set(updated_ids))
+            result['unchanged_count'] = len(unchanged)
+            result['unchanged_ids'] = unchanged
+        return result, None
+
+    except Exception as e:
+        db.session.rollback()
+        return None, f"Error updating timetable status: {str(e)}"
+
+
+def _copy_slots(timetable_ids, now):
+    """
+    Copy the slots of timetables server-side with one INSERT ... SELECT.
+
+    Column defaults are Python callables, which INSERT ... SELECT does not
+    apply, so the timestamps are passed explicitly.
+
+    Args:
+        timetable_ids: {source timetable id: new timetable id}
+        now: created_at/updated_at of the copies
+
+    Returns:
+        Number of slots copied
+    """
+    slot = TimeTableSlot.__table__.c
+    copied = select(
+        case(timetable_ids, value=slot.timetable_id), slot.course_id, slot.room_id, slot.day_of_week,
+        slot.start_time, slot.end_time, slot.notes,
+        literal(now, slot.created_at.type), literal(now, slot.updated_at.type)
+    ).where(slot.timetable_id.in_(timetable_ids)).order_by(slot.id)
+    return db.session.execute(
+        insert(TimeTableSlot.__table__).from_select(
+            ['timetable_id', 'course_id', 'room_id', 'day_of_week', 'start_time', 'end_time',
+             'notes', 'created_at', 'updated_at'],
+            copied
+        )
+    ).rowcount
+
+
 def clone_timetable(timetable_id, name, week_start=None, week_end=None, department_id=None,
-                    academic_year=None, semester=None, created_by=None, level_id=None):
+                    academic_year=None, semester=None, created_by=None, level_id=None,
+                    room_map=None, time_offset_minutes=0, day_map=None):
     """
     Create a copy of an existing timetable.
 
+    Without transformations the slots are copied with a single
+    INSERT ... SELECT, so the original slots are never loaded into the
+    session. With them, the slots are read as plain rows, transformed and
+    inserted in one batch. Conflicts are not checked; use preview_clone.
+
     Args:
         timetable_id: The ID of the timetable to clone
         name: Name for the cloned timetable
@@ -308,15 +587,18 @@ def clone_timetable(timetable_id, name, week_start=None, week_end=None, departme
         academic_year: Optional new academic year
         semester: Optional new semester
         created_by: Admin ID who created it
+        room_map: Optional {old room id: new room id}
+        time_offset_minutes: Minutes added to start and end times (may be negative)
+        day_map: Optional {old day: new day}
 
     Returns:
-        Tuple of (TimeTable object, error_message)
+        Tuple of (TimeTable object, error_message, slots_cloned)
         If successful, error_message is None
     """
     try:
-        original = get_timetable_by_id(timetable_id)
+        original = db.session.get(TimeTable, timetable_id)
         if not original:
-            return None, "Timetable not found"
+            return None, "Timetable not found", 0
 
         # Use original values if not provided
         week_start = week_start or original.week_start
@@ -332,6 +614,12 @@ def clone_timetable(timetable_id, name, week_start=None, week_end=None, departme
         if week_end and isinstance(week_end, str):
             week_end = date.fromisoformat(week_end)
 
+        transformed = None
+        if room_map or time_offset_minutes or day_map:
+            transformed, error = _transformed_slots(timetable_id, room_map, time_offset_minutes, day_map)
+            if error:
+                return None, error, 0
+
         # Create new timetable
         new_timetable = TimeTable(
             name=name,
@@ -348,29 +636,168 @@ def clone_timetable(timetable_id, name, week_start=None, week_end=None, departme
         db.session.add(new_timetable)
         db.session.flush()
 
-        # Clone all slots
-        for original_slot in original.slots:
-            new_slot = TimeTableSlot(
-                timetable_id=new_timetable.id,
-                course_id=original_slot.course_id,
-                room_id=original_slot.room_id,
-                day_of_week=original_slot.day_of_week,
-                start_time=original_slot.start_time,
-                end_time=original_slot.end_time,
-                notes=original_slot.notes
-            )
-            db.session.add(new_slot)
+        # Column defaults are Python callables, which Core executemany does
+        # not apply, so the timestamps are explicit
+        now = datetime.utcnow()
+        if transformed is None:
+            slots_cloned = _copy_slots({original.id: new_timetable.id}, now)
+        else:
+            rows = [{
+                'timetable_id': new_timetable.id,
+                'course_id': row['course_id'],
+                'room_id': row['room_id'],
+                'day_of_week': row['day_of_week'],
+                'start_time': row['start_time'],
+                'end_time': row['end_time'],
+                'notes': row['notes'],
+                'created_at': now,
+                'updated_at': now
+            } for row in transformed]
+            if rows:
+                db.session.execute(insert(TimeTableSlot.__table__), rows)
+            slots_cloned = len(rows)
 
         db.session.commit()
 
-        return new_timetable, None
+        return new_timetable, None, slots_cloned
 
     except ValueError as e:
         db.session.rollback()
-        return None, f"Invalid date format: {str(e)}"
+        return None, f"Invalid date format: {str(e)}", 0
+    except Exception as e:
+        db.session.rollback()
+        return None, f"Error cloning timetable: {str(e)}", 0
+
+
+def _rollover_name(name, source_semester, source_academic_year, target_semester, target_academic_year):
+    """
+    Rename a timetable for the target term.
+
+    The source semester becomes the target semester and each year of the
+    source academic year the matching target year, in one pass
+    (e.g. "CS L1 Fall 2024" from 2024-2025 to 2025-2026 -> "CS L1 Fall 2025").
+    """
+    replacements = {source_semester: target_semester} if source_semester else {}
+    source_years = (source_academic_year or '').split('-')
+    target_years = (target_academic_year or '').split('-')
+    if source_academic_year and target_academic_year:
+        replacements[source_academic_year] = target_academic_year
+        if len(source_years) == len(target_years):
+            replacements.update(zip(source_years, target_years))
+    replacements = {old: new for old, new in replacements.items() if old and old != new}
+    if not replacements:
+        return name
+    pattern = re.compile('|'.join(re.escape(old) for old in sorted(replacements, key=len, reverse=True)))
+    return pattern.sub(lambda match: replacements[match.group(0)], name)
+
+
+def _shift_years(value, years):
+    if value is None or not years:
+        return value
+    try:
+        return value.replace(year=value.year + years)
+    except ValueError:  # 29 February
+        return value.replace(year=value.year + years, day=28)
+
+
+def rollover_timetables(source_semester, source_academic_year, target_semester, target_academic_year,
+                        department_id=None, level_id=None, created_by=None):
+    """
+    Clone every timetable of one term into another, in one transaction.
+
+    The new timetables are inserted in one batch and all their slots are
+    copied with a single INSERT ... SELECT. Timetables whose renamed copy
+    already exists in the target term (same department and level) are
+    skipped, so a rollover can be re-run safely. Week dates move by the
+    difference between the academic years.
+
+    Args:
+        source_semester: Semester to copy from (e.g. "Fall")
+        source_academic_year: Academic year to copy from (e.g. "2024-2025")
+        target_semester: Semester to copy to
+        target_academic_year: Academic year to copy to
+        department_id: Optional department filter
+        level_id: Optional level filter
+        created_by: Admin ID who runs the rollover
+
+    Returns:
+        Tuple of (report dictionary, error_message)
+        If successful, error_message is None
+    """
+    try:
+        if (source_semester, source_academic_year) == (target_semester, target_academic_year):
+            return None, "Target term must differ from the source term"
+
+        query = TimeTable.query.filter(
+            TimeTable.semester == source_semester,
+            TimeTable.academic_year == source_academic_year
+        )
+        if department_id:
+            query = query.filter(TimeTable.department_id == department_id)
+        if level_id:
+            query = query.filter(TimeTable.level_id == level_id)
+        sources = query.order_by(TimeTable.id).all()
+        if not sources:
+            return None, f"No timetables found for {source_semester} {source_academic_year}"
+
+        existing = set(db.session.query(TimeTable.department_id, TimeTable.level_id, TimeTable.name).filter(
+            TimeTable.semester == target_semester,
+            TimeTable.academic_year == target_academic_year
+        ))
+        slot_counts = dict(db.session.query(TimeTableSlot.timetable_id, func.count(TimeTableSlot.id)).filter(
+            TimeTableSlot.timetable_id.in_([source.id for source in sources])
+        ).group_by(TimeTableSlot.timetable_id))
+
+        try:
+            years = int(target_academic_year.split('-')[0]) - int(source_academic_year.split('-')[0])
+        except (AttributeError, ValueError):
+            years = 0
+
+        copies = []
+        skipped = []
+        for source in sources:
+            name = _rollover_name(source.name, source_semester, source_academic_year,
+                                  target_semester, target_academic_year)
+            if (source.department_id, source.level_id, name) in existing:
+                skipped.append({'source_id': source.id, 'name': name, 'reason': 'already exists in target term'})
+                continue
+            copies.append((source, TimeTable(
+                name=name,
+                department_id=source.department_id,
+                level_id=source.level_id,
+                week_start=_shift_years(source.week_start, years),
+                week_end=_shift_years(source.week_end, years),
+                academic_year=target_academic_year,
+                semester=target_semester,
+                status='draft',
+                created_by=created_by
+            )))
+
+        db.session.add_all([copy for _, copy in copies])
+        db.session.flush()
+
+        slots_cloned = 0
+        if copies:
+            slots_cloned = _copy_slots({source.id: copy.id for source, copy in copies}, datetime.utcnow())
+        db.session.commit()
+
+        return {
+            'source': {'semester': source_semester, 'academic_year': source_academic_year},
+            'target': {'semester': target_semester, 'academic_year': target_academic_year},
+            'timetables_cloned': len(copies),
+            'slots_cloned': slots_cloned,
+            'timetables': [{
+                'source_id': source.id,
+                'id': copy.id,
+                'name': copy.name,
+                'slots_cloned': slot_counts.get(source.id, 0)
+            } for source, copy in copies],
+            'skipped': skipped
+        }, None
+
     except Exception as e:
         db.session.rollback()
-        return None, f"Error cloning timetable: {str(e)}"
+        return None, f"Error rolling over timetables: {str(e)}"
 
 
 def get_timetable_stats(timetable_id):
@@ -387,6 +814,19 @@ def get_timetable_stats(timetable_id):
     if not timetable:
         return None
 
+    return build_timetable_stats(timetable)
+
+
+def build_timetable_stats(timetable):
+    """
+    Compute statistics from a timetable whose slots (and their courses) are loaded.
+
+    Args:
+        timetable: TimeTable object
+
+    Returns:
+        Dictionary with statistics
+    """
     total_slots = len(timetable.slots)
     unique_courses = len(set(slot.course_id for slot in timetable.slots))
     unique_rooms = len(set(slot.room_id for slot in timetable.slots))
@@ -425,13 +865,15 @@ def get_timetable_stats(timetable_id):
     }
 
 
-def serialize_timetable(timetable, include_slots=False):
+def serialize_timetable(timetable, include_slots=False, slots_count=None):
     """
     Serialize a timetable object to dictionary.
 
     Args:
         timetable: TimeTable object
         include_slots: Boolean to include slots in response
+        slots_count: Optional known number of slots; when given without
+            include_slots, the slots relationship is not loaded
 
     Returns:
         Dictionary representation of timetable
@@ -452,7 +894,7 @@ def serialize_timetable(timetable, include_slots=False):
         'creator_name': timetable.creator.username if timetable.creator else None,
         'created_at': timetable.created_at.isoformat() if timetable.created_at else None,
         'updated_at': timetable.updated_at.isoformat() if timetable.updated_at else None,
-        'slots_count': len(timetable.slots)
+        'slots_count': slots_count if slots_count is not None else len(timetable.slots)
     }
 
     if include_slots: